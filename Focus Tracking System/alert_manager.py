@@ -93,21 +93,29 @@ class AlertManager:
         else:
             self._play_system_beep()
         
-    def trigger_alert(self):
-    """Uyarıyı tetikle (ses + görsel). Thread-safe."""
-    should_play = False
-    with self._lock:
-        self._should_show_warning = True
-        if not self._is_playing:
-            self._is_playing = True
-            should_play = True
-    
-    if should_play:
-        self._start_sound_thread()
+    def trigger_alert(self, blocking: bool = False):
+        """
+        Uyarıyı tetikle (ses + görsel). Thread-safe.
+        
+        Args:
+            blocking: True ise ses çağıran thread'de başlatılır (ör. asyncio
+                      runtime'ın ses executor'ünde), False ise yeni thread açılır
+        """
+        should_play = False
+        with self._lock:
+            self._should_show_warning = True
+            if not self._is_playing:
+                self._is_playing = True
+                should_play = True
+    
+        if should_play:
+            if blocking:
+                self._play_alert_loop()
+            else:
+                self._start_sound_thread()
 
-def _start_sound_thread(self):
-    """Ses çalma thread'ini başlat (lock almadan)."""
-    def play_sound():
+    def _play_alert_loop(self):
+        """Uyarı sesini döngüde çalmaya başla (lock almadan)."""
         try:
             if PYGAME_AVAILABLE and os.path.exists(self.sound_file):
                 pygame.mixer.music.load(self.sound_file)
@@ -119,9 +127,11 @@ def _start_sound_thread(self):
             with self._lock:
                 self._is_playing = False
             self._play_system_beep()
-    
-    self._sound_thread = threading.Thread(target=play_sound, daemon=True)
-    self._sound_thread.start()
+
+    def _start_sound_thread(self):
+        """Ses çalma thread'ini başlat (lock almadan)."""
+        self._sound_thread = threading.Thread(target=self._play_alert_loop, daemon=True)
+        self._sound_thread.start()
     
     def play_alert_sound(self):
         """Uyarı sesini senkron olarak çal."""
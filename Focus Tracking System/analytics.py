@@ -0,0 +1,239 @@
+"""
+Analytics Module
+Kaydedilmiş oturum zaman çizelgeleri (.timeline) üzerinde NumPy ile vektörel analiz.
+Dosyalar np.memmap ile açılır; odak yüzdesi, dikkat dağınıklığı bölümleri,
+en uzun odak serisi ve günün saatlerine göre odak oranı binlerce oturum
+için saniyeler içinde hesaplanır.
+
+Kullanım:
+    python analytics.py sessions/
+    python analytics.py sessions/ --min-episode 10 --per-session
+"""
+
+import os
+import sys
+import time
+import argparse
+from dataclasses import dataclass, field
+from typing import Iterable, List, Tuple
+
+import numpy as np
+
+from timeline import EXTENSION, DIRECTION_CODES, read_header, read_timeline
+from config import DISTRACTION_SECONDS
+
+# Kayıtlar arası bundan uzun boşluklar (ör. uygulama donması) bu süreyle sınırlanır
+MAX_GAP_SECONDS = 2.0
+
+
+@dataclass
+class SessionStats:
+    """Tek bir oturumun özeti. Süreler saniyedir."""
+    path: str
+    start_epoch: float
+    records: int
+    duration: float
+    focused: float
+    episodes: int
+    episode_seconds: float
+    longest_episode: float
+    longest_streak: float
+    hourly_total: np.ndarray = field(repr=False)
+    hourly_focused: np.ndarray = field(repr=False)
+
+    @property
+    def focus_percent(self) -> float:
+        return 100.0 * self.focused / self.duration if self.duration > 0 else 0.0
+
+
+@dataclass
+class Report:
+    """Birden çok oturumun toplu özeti."""
+    sessions: List[SessionStats]
+    duration: float
+    focused: float
+    episodes: int
+    episode_seconds: float
+    longest_episode: float
+    longest_streak: float
+    hourly_total: np.ndarray = field(repr=False)
+    hourly_focused: np.ndarray = field(repr=False)
+
+    @property
+    def focus_percent(self) -> float:
+        return 100.0 * self.focused / self.duration if self.duration > 0 else 0.0
+
+    @property
+    def hourly_percent(self) -> np.ndarray:
+        """Günün her saati için odak yüzdesi (veri yoksa NaN)."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(self.hourly_total > 0, 100.0 * self.hourly_focused / self.hourly_total, np.nan)
+
+
+def record_durations(timestamps: np.ndarray, max_gap: float = None) -> np.ndarray:
+    """
+    Her kaydın kapsadığı süre: bir sonraki kayda kadar geçen zaman.
+    Son kayıt için aralıkların medyanı kullanılır; boşluklar max_gap ile sınırlanır.
+    """
+    max_gap = max_gap if max_gap is not None else MAX_GAP_SECONDS
+    if len(timestamps) == 0:
+        return np.zeros(0)
+    if len(timestamps) == 1:
+        return np.zeros(1)
+    gaps = np.diff(timestamps.astype(np.float64))
+    durations = np.empty(len(timestamps))
+    durations[:-1] = gaps
+    durations[-1] = np.median(gaps)
+    return np.clip(durations, 0.0, max_gap)
+
+
+def runs(mask: np.ndarray, durations: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Maskeyi ardışık aynı değerli bölümlere ayır.
+
+    Returns:
+        tuple: (her bölümün değeri, her bölümün toplam süresi)
+    """
+    if len(mask) == 0:
+        return np.zeros(0, dtype=bool), np.zeros(0)
+    starts = np.concatenate(([0], np.flatnonzero(mask[1:] != mask[:-1]) + 1))
+    return mask[starts], np.add.reduceat(durations, starts)
+
+
+def local_hours(start_epoch: float, timestamps: np.ndarray) -> np.ndarray:
+    """Kayıtların yerel saatine göre günün saati (0-23)."""
+    offset = time.localtime(start_epoch).tm_gmtoff
+    seconds = start_epoch + offset + timestamps.astype(np.float64)
+    return (np.floor(seconds / 3600.0) % 24).astype(np.intp)
+
+
+def analyze_records(records: np.ndarray, start_epoch: float = 0.0, path: str = "",
+                    min_episode: float = None, max_gap: float = None) -> SessionStats:
+    """
+    Tek bir oturumun kayıtlarını analiz et.
+
+    Args:
+        records: timeline.RECORD_DTYPE (veya TIMELINE_DTYPE) kayıtları
+        start_epoch: Oturum başlangıcı (saatlik dağılım için)
+        path: Rapor için dosya yolu
+        min_episode: Bundan kısa uzaklaşmalar dikkat dağınıklığı bölümü sayılmaz
+                     (None ise DISTRACTION_SECONDS)
+        max_gap: Kayıtlar arası en uzun sayılacak boşluk
+
+    Returns:
+        SessionStats
+    """
+    min_episode = min_episode if min_episode is not None else DISTRACTION_SECONDS
+    durations = record_durations(records["timestamp"], max_gap)
+    focused_mask = np.asarray(records["direction"]) == DIRECTION_CODES["merkez"]
+
+    values, run_seconds = runs(focused_mask, durations)
+    away = run_seconds[~values]
+    episodes = away[away >= min_episode]
+    streaks = run_seconds[values]
+
+    hours = local_hours(start_epoch, records["timestamp"])
+    return SessionStats(
+        path=path,
+        start_epoch=start_epoch,
+        records=len(records),
+        duration=float(durations.sum()),
+        focused=float(durations[focused_mask].sum()),
+        episodes=len(episodes),
+        episode_seconds=float(episodes.sum()),
+        longest_episode=float(episodes.max()) if len(episodes) else 0.0,
+        longest_streak=float(streaks.max()) if len(streaks) else 0.0,
+        hourly_total=np.bincount(hours, weights=durations, minlength=24),
+        hourly_focused=np.bincount(hours, weights=durations * focused_mask, minlength=24),
+    )
+
+
+def find_sessions(paths: Iterable[str]) -> List[str]:
+    """Verilen dosya ve klasörlerdeki .timeline dosyalarını sıralı listele."""
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            found.extend(os.path.join(path, name) for name in sorted(os.listdir(path))
+                         if name.endswith(EXTENSION))
+        else:
+            found.append(path)
+    return found
+
+
+def analyze_sessions(paths: Iterable[str], min_episode: float = None, max_gap: float = None) -> Report:
+    """
+    Oturum dosyalarını memmap ile açıp analiz et ve toplu rapor oluştur.
+
+    Args:
+        paths: .timeline dosyaları veya bunları içeren klasörler
+        min_episode: En kısa dikkat dağınıklığı bölümü (saniye)
+        max_gap: Kayıtlar arası en uzun sayılacak boşluk
+
+    Returns:
+        Report
+    """
+    sessions = [
+        analyze_records(read_timeline(path), read_header(path).start_epoch, path, min_episode, max_gap)
+        for path in find_sessions(paths)
+    ]
+    hourly_total = np.zeros(24)
+    hourly_focused = np.zeros(24)
+    for stats in sessions:
+        hourly_total += stats.hourly_total
+        hourly_focused += stats.hourly_focused
+    return Report(
+        sessions=sessions,
+        duration=sum(s.duration for s in sessions),
+        focused=sum(s.focused for s in sessions),
+        episodes=sum(s.episodes for s in sessions),
+        episode_seconds=sum(s.episode_seconds for s in sessions),
+        longest_episode=max((s.longest_episode for s in sessions), default=0.0),
+        longest_streak=max((s.longest_streak for s in sessions), default=0.0),
+        hourly_total=hourly_total,
+        hourly_focused=hourly_focused,
+    )
+
+
+def format_report(report: Report, per_session: bool = False) -> str:
+    """Raporu metin olarak biçimlendir."""
+    lines = [
+        f"Oturum: {len(report.sessions)}, toplam süre: {report.duration / 60:.1f} dk",
+        f"Odak: %{report.focus_percent:.1f}",
+        f"Dikkat dağınıklığı: {report.episodes} bölüm, toplam {report.episode_seconds / 60:.1f} dk, "
+        f"en uzun {report.longest_episode:.0f} s",
+        f"En uzun odak serisi: {report.longest_streak / 60:.1f} dk",
+        "",
+        "Saat   Süre (dk)   Odak %",
+    ]
+    for hour, (total, percent) in enumerate(zip(report.hourly_total, report.hourly_percent)):
+        if total > 0:
+            lines.append(f"{hour:02d}:00  {total / 60:9.1f}   {percent:6.1f}")
+
+    if per_session:
+        lines += ["", f"{'Oturum':<36}{'dk':>7}{'odak %':>8}{'bölüm':>7}{'seri dk':>9}"]
+        for s in report.sessions:
+            lines.append(f"{os.path.basename(s.path)[:35]:<36}{s.duration / 60:>7.1f}"
+                         f"{s.focus_percent:>8.1f}{s.episodes:>7}{s.longest_streak / 60:>9.1f}")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Kaydedilmiş oturumlar için odak raporu.")
+    parser.add_argument("paths", nargs="+", help=".timeline dosyaları veya klasörler")
+    parser.add_argument("--min-episode", type=float, default=None,
+                        help="En kısa dikkat dağınıklığı bölümü (saniye, varsayılan DISTRACTION_SECONDS)")
+    parser.add_argument("--per-session", action="store_true", help="Oturum bazında tabloyu da yazdır")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    report = analyze_sessions(args.paths, args.min_episode)
+    if not report.sessions:
+        print("Oturum bulunamadı.")
+        return 1
+    print(format_report(report, args.per_session))
+    print(f"\n{len(report.sessions)} oturum {time.perf_counter() - started:.2f} s içinde analiz edildi.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,333 @@
+"""
+Async Runtime Module
+Oturumları tek bir asyncio olay döngüsünde çalıştıran çalışma zamanı.
+Kamera okuma ve bakış analizi sınırlı boyutlu executor'larda, süre sayacı
+ve uyarı sesleri coroutine olarak çalışır. Her oturum için yeni thread
+açılmaz; toplam thread sayısı executor boyutlarıyla sınırlıdır ve aynı
+süreçte çok sayıda oturum ucuza çalıştırılabilir.
+
+Kapatma sırası tanımlıdır: önce video döngüleri, sonra süre sayaçları,
+en son uyarı/ses işleri iptal edilir; ardından executor'lar ve döngü kapatılır.
+"""
+
+import asyncio
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+import numpy as np
+
+from frame_scheduler import FramePacer
+from session_engine import FocusSession
+from instrumentation import get_profiler
+from config import TARGET_FPS
+
+GROUP_VIDEO = "video"
+GROUP_TIMER = "timer"
+GROUP_ALERT = "alert"
+
+# Kapatmada grupların iptal sırası
+SHUTDOWN_ORDER = (GROUP_VIDEO, GROUP_TIMER, GROUP_ALERT)
+
+_profiler = get_profiler()
+
+
+class SessionHandle:
+    """Runtime'da çalışan bir oturumun görevleri ve frame adımlayıcısı."""
+
+    def __init__(self, session: FocusSession, pacer: Optional[FramePacer]):
+        self.session = session
+        self.pacer = pacer
+        self.tasks: Dict[str, asyncio.Task] = {}
+        # Video döngüsünün executor'de çalışan son adımı; durdurmada bitmesi beklenir
+        self.inflight: Optional[Future] = None
+        # Video döngüsünde hata veren okuma/analiz adımı sayısı
+        self.errors = 0
+
+    @property
+    def done(self) -> bool:
+        return all(task.done() for task in self.tasks.values())
+
+
+class AsyncRuntime:
+    """
+    Arka plan thread'inde çalışan asyncio olay döngüsü.
+    Thread-safe: public metodlar herhangi bir thread'den çağrılabilir.
+
+    Executor'lar:
+    - capture: kaynaktan frame bekleme (bloklayan okuma)
+    - detection: frame hazırlama, analiz ve önizleme çizimi
+    - sound: ses çalma ve durdurma (tek thread; sesler sırayla çalınır)
+    """
+
+    def __init__(self, capture_threads: int = None, detection_threads: int = None):
+        """
+        AsyncRuntime'ı başlat.
+
+        Args:
+            capture_threads: Okuma executor'ünün thread sayısı (None ise 4)
+            detection_threads: Analiz executor'ünün thread sayısı (None ise CPU sayısı)
+        """
+        self.capture_threads = capture_threads or 4
+        self.detection_threads = detection_threads or os.cpu_count() or 1
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._groups: Dict[str, set] = {group: set() for group in SHUTDOWN_ORDER}
+        self._executors: Dict[str, ThreadPoolExecutor] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def is_running(self) -> bool:
+        return self.loop is not None and self.loop.is_running()
+
+    def start(self) -> "AsyncRuntime":
+        """Olay döngüsünü ve executor'ları başlat."""
+        with self._lock:
+            if self._thread is not None:
+                return self
+            self._executors = {
+                "capture": ThreadPoolExecutor(self.capture_threads, thread_name_prefix="capture"),
+                "detection": ThreadPoolExecutor(self.detection_threads, thread_name_prefix="detection"),
+                "sound": ThreadPoolExecutor(1, thread_name_prefix="sound"),
+            }
+            self.loop = asyncio.new_event_loop()
+            ready = threading.Event()
+            self._thread = threading.Thread(target=self._run_loop, args=(ready,),
+                                            name="focus-runtime", daemon=True)
+            self._thread.start()
+        ready.wait()
+        return self
+
+    def _run_loop(self, ready: threading.Event):
+        asyncio.set_event_loop(self.loop)
+        self.loop.call_soon(ready.set)
+        self.loop.run_forever()
+
+    def thread_count(self) -> int:
+        """Runtime'ın açabileceği en fazla thread sayısı (döngü thread'i dahil)."""
+        return 1 + self.capture_threads + self.detection_threads + 1
+
+    def _spawn(self, group: str, coro) -> asyncio.Task:
+        """Döngü thread'inde görev oluştur ve gruba kaydet."""
+        task = self.loop.create_task(coro)
+        self._groups[group].add(task)
+        task.add_done_callback(self._groups[group].discard)
+        return task
+
+    def call(self, fn: Callable, *args) -> Future:
+        """Fonksiyonu döngü thread'inde çalıştır; sonucu Future ile döndür."""
+        if not self.is_running:
+            raise RuntimeError("Runtime çalışmıyor")
+
+        async def run():
+            return fn(*args)
+        return asyncio.run_coroutine_threadsafe(run(), self.loop)
+
+    def run_in(self, executor: str, fn: Callable, *args):
+        """Döngü içinden: fonksiyonu adı verilen executor'de çalıştır (awaitable)."""
+        return asyncio.wrap_future(self._executors[executor].submit(fn, *args), loop=self.loop)
+
+    def play(self, fn: Callable, *args) -> Future:
+        """
+        Ses işini (ör. AlertManager.play_start_sound) ses executor'ünde çalıştır.
+        Çağrı beklemez; işler sırayla ve tek thread'de çalışır.
+        """
+        if not self.is_running:
+            raise RuntimeError("Runtime çalışmıyor")
+
+        async def run():
+            return await self.run_in("sound", fn, *args)
+
+        async def spawn():
+            return await self._spawn(GROUP_ALERT, run())
+        return asyncio.run_coroutine_threadsafe(spawn(), self.loop)
+
+    def start_session(self, session: FocusSession,
+                      on_frame: Callable[[FocusSession, np.ndarray, object], None] = None,
+                      on_tick: Callable[[int], None] = None, fps: float = None,
+                      read_timeout: float = 0.5) -> SessionHandle:
+        """
+        Oturumu başlat ve video döngüsü ile süre sayacını görev olarak çalıştır.
+
+        Args:
+            session: Çalıştırılacak oturum (start() henüz çağrılmamışsa çağrılır)
+            on_frame: Her frame'den sonra analiz executor'ünde çağrılır (oturum, frame, yakalanan)
+            on_tick: Her saniye kalan süreyle döngü thread'inde çağrılır
+            fps: Video döngüsünün hedef hızı (0 ise beklemeden, None ise TARGET_FPS)
+            read_timeout: Kaynaktan frame bekleme süresi
+
+        Returns:
+            SessionHandle
+        """
+        fps = fps if fps is not None else TARGET_FPS
+        pacer = FramePacer(fps) if fps else None
+        handle = SessionHandle(session, pacer)
+
+        def spawn():
+            if not session.is_running and not session.is_completed:
+                session.start()
+            handle.tasks[GROUP_VIDEO] = self._spawn(
+                GROUP_VIDEO, self._video_loop(handle, on_frame, read_timeout)
+            )
+            handle.tasks[GROUP_TIMER] = self._spawn(GROUP_TIMER, self._timer_loop(session, on_tick))
+
+        self.call(spawn).result()
+        return handle
+
+    def _step(self, handle: SessionHandle, executor: str, fn: Callable, *args):
+        handle.inflight = self._executors[executor].submit(fn, *args)
+        return asyncio.wrap_future(handle.inflight, loop=self.loop)
+
+    async def _video_loop(self, handle: SessionHandle, on_frame, read_timeout: float):
+        session, pacer = handle.session, handle.pacer
+        if pacer is not None:
+            pacer.reset()
+        failing = False
+        while session.is_running:
+            try:
+                captured = await self._step(handle, "capture", self._read, session, read_timeout)
+                if captured is None:
+                    if getattr(session.source, "exhausted", False):
+                        break
+                    continue
+                await self._step(handle, "detection", self._process, session, captured, on_frame)
+                failing = False
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Tek frame'deki okuma/analiz hatası döngüyü ve dikkat takibini bitirmemeli;
+                # art arda gelen hatalardan sadece ilki yazdırılır
+                handle.errors += 1
+                if not failing:
+                    print(f"Video döngüsü hatası: {e!r}")
+                failing = True
+            if pacer is not None:
+                await asyncio.sleep(pacer.remaining())
+                pacer.tick()
+            else:
+                await asyncio.sleep(0)
+
+    @staticmethod
+    def _read(session: FocusSession, timeout: float):
+        with _profiler.probe("cap.read"):
+            return session.next_frame(timeout)
+
+    @staticmethod
+    def _process(session: FocusSession, captured, on_frame):
+        frame = session.process(captured)
+        if on_frame is not None:
+            on_frame(session, frame, captured)
+
+    async def _timer_loop(self, session: FocusSession, on_tick):
+        while session.is_running:
+            now = session.clock()
+            remaining = session.remaining_seconds(now)
+            if session.tick(now) is not None:
+                break
+            if on_tick is not None:
+                on_tick(remaining)
+            # Bir sonraki tam saniyeye kadar bekle (bitiş zamanına göre kaymaz)
+            fraction = (session.end_time - now) % 1.0
+            await asyncio.sleep(fraction if fraction > 1e-3 else 1.0)
+        if session.is_completed and on_tick is not None:
+            on_tick(0)
+
+    def stop_session_async(self, handle: SessionHandle, timeout: float = 5.0,
+                           on_stopped: Callable[[SessionHandle], None] = None) -> Future:
+        """
+        Oturumu durdur ve görevlerini video → sayaç sırasıyla iptal et; beklemeden döner.
+        Arayüz thread'i gibi bloklanmaması gereken thread'lerden bu metod kullanılmalıdır.
+
+        Args:
+            handle: Durdurulacak oturum
+            timeout: Executor'de süren son adımın (okuma/analiz) bitmesi için beklenecek süre
+            on_stopped: Son adım bittikten sonra okuma executor'ünde çağrılır
+                        (detector, kayıt, kaynak bırakma gibi bloklayan temizlik için)
+
+        Returns:
+            Future: Temizlik bitince tamamlanır. Son adım süre içinde bitmezse TimeoutError
+                    ile sonuçlanır; on_stopped bu durumda adım bittiğinde çağrılır,
+                    yani detector analiz sürerken bırakılmaz.
+        """
+        handle.session.stop()
+        if not self.is_running:
+            raise RuntimeError("Runtime çalışmıyor")
+        return asyncio.run_coroutine_threadsafe(self._stop(handle, timeout, on_stopped), self.loop)
+
+    async def _stop(self, handle: SessionHandle, timeout: float, on_stopped):
+        tasks = [handle.tasks[group] for group in (GROUP_VIDEO, GROUP_TIMER) if group in handle.tasks]
+        for task in tasks:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        inflight = handle.inflight
+        if inflight is not None and not inflight.done():
+            done, _ = await asyncio.wait({asyncio.wrap_future(inflight, loop=self.loop)}, timeout=timeout)
+            if not done:
+                if on_stopped is not None:
+                    inflight.add_done_callback(lambda _: on_stopped(handle))
+                raise TimeoutError(f"Oturumun son adımı {timeout} s içinde bitmedi")
+        if on_stopped is not None:
+            await self.run_in("capture", on_stopped, handle)
+
+    def stop_session(self, handle: SessionHandle, timeout: float = 5.0,
+                     on_stopped: Callable[[SessionHandle], None] = None):
+        """
+        stop_session_async() ile durdur ve temizliğin bitmesini bekle.
+        Döngü thread'inden çağrılırsa görevler sadece iptal edilir.
+        Döngünün beklediği bir thread'den (ör. döngüden root.after çağrılan Tk
+        thread'i) çağrılmamalıdır; orada stop_session_async() kullanılır.
+
+        Raises:
+            TimeoutError: Son adım veya temizlik süre içinde bitmezse
+        """
+        if threading.current_thread() is self._thread:
+            handle.session.stop()
+            for task in handle.tasks.values():
+                task.cancel()
+            return
+        if not self.is_running:
+            handle.session.stop()
+            if on_stopped is not None:
+                on_stopped(handle)
+            return
+        self.stop_session_async(handle, timeout, on_stopped).result(2 * timeout)
+
+    async def _cancel_groups(self):
+        current = asyncio.current_task()
+        for group in SHUTDOWN_ORDER:
+            tasks = [task for task in self._groups[group] if task is not current]
+            if group == GROUP_ALERT and tasks:
+                # Sıradaki ses işlerine (ör. uyarıyı durdurma) bitmeleri için kısa süre tanınır
+                await asyncio.wait(tasks, timeout=1.0)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def shutdown(self, timeout: float = 5.0):
+        """
+        Tüm görevleri tanımlı sırayla iptal et, executor'ları ve döngüyü kapat.
+        Birden fazla çağrılabilir.
+        """
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+
+        try:
+            asyncio.run_coroutine_threadsafe(self._cancel_groups(), self.loop).result(timeout)
+        finally:
+            for name in ("capture", "detection", "sound"):
+                self._executors[name].shutdown(wait=True)
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            thread.join(timeout)
+            self.loop.close()
+            self.loop = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown()
+        return False
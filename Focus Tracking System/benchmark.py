@@ -0,0 +1,245 @@
+"""
+Benchmark Module
+Bakış tespit hattının aşama bazında hız ölçümü.
+Sentetik veya kaydedilmiş frame'ler üzerinde çalışır; sonuçlar JSON olarak
+kaydedilir ve kayıtlı bir referansla karşılaştırılarak yavaşlamalar yakalanır.
+
+Kullanım:
+    python benchmark.py --output sonuc.json --baseline referans.json
+    python benchmark.py --recorded kayit_klasoru --resolutions 640x480
+"""
+
+import sys
+import json
+import time
+import platform
+import argparse
+from typing import Callable, Dict, List, Tuple
+
+import cv2
+import numpy as np
+
+from gaze_detector import GazeDetector
+from detector_backends import load_frames
+from synthetic_frames import generate_sequence
+from config import GAZE_SENSITIVITY, FRAME_SKIP
+
+DEFAULT_RESOLUTIONS = [(640, 480), (320, 240)]
+DEFAULT_SKIPS = [1, FRAME_SKIP]
+DEFAULT_SENSITIVITIES = [GAZE_SENSITIVITY]
+COMPARE_METRIC = "p95_ms"
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """
+    Süre örneklerinden (saniye) özet istatistik çıkar.
+
+    Returns:
+        dict: count, mean_ms, p50_ms, p95_ms, p99_ms, throughput_fps
+    """
+    if not samples:
+        return {"count": 0}
+    ms = np.asarray(samples) * 1000.0
+    p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+    mean = float(ms.mean())
+    return {
+        "count": len(samples),
+        "mean_ms": mean,
+        "p50_ms": float(p50),
+        "p95_ms": float(p95),
+        "p99_ms": float(p99),
+        "throughput_fps": 1000.0 / mean if mean > 0 else float("inf"),
+    }
+
+
+def _timed(fn: Callable, samples: List[float]):
+    start = time.perf_counter()
+    value = fn()
+    samples.append(time.perf_counter() - start)
+    return value
+
+
+def bench_stages(frames: List[np.ndarray], sensitivity: float = None) -> Dict[str, dict]:
+    """
+    Hattın her aşamasını ayrı ayrı ölç.
+
+    Aşamalar: cvtColor, face_detect, eye_detect, detect_pupil, analyze, render.
+    """
+    detector = GazeDetector(sensitivity=sensitivity)
+    samples = {name: [] for name in
+               ("cvtColor", "face_detect", "eye_detect", "detect_pupil", "analyze", "render")}
+
+    try:
+        for frame in frames:
+            gray = _timed(lambda: cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY), samples["cvtColor"])
+            faces = _timed(lambda: detector._detect_faces(gray), samples["face_detect"])
+
+            if len(faces) > 0:
+                (x, y, w, h) = (int(v) for v in faces[0])
+                roi = gray[y:y+h//2, x:x+w]
+                eyes = _timed(lambda: detector.backend.detect_eyes(roi), samples["eye_detect"])
+                for (ex, ey, ew, eh) in eyes:
+                    eye_roi = roi[ey:ey+eh, ex:ex+ew]
+                    _timed(lambda: detector.detect_pupil(eye_roi), samples["detect_pupil"])
+
+            detector.reset_tracking()
+            result = _timed(lambda: detector.analyze(frame), samples["analyze"])
+            _timed(lambda: detector.render(frame, result), samples["render"])
+    finally:
+        detector.release()
+
+    return {name: summarize(values) for name, values in samples.items()}
+
+
+def bench_loop(frames: List[np.ndarray], frame_skip: int, sensitivity: float = None) -> Dict[str, float]:
+    """
+    Video döngüsünün yakalanan frame başına maliyetini ölç
+    (her `frame_skip`'inci frame analiz edilir).
+    """
+    detector = GazeDetector(sensitivity=sensitivity)
+    samples = []
+    try:
+        for i, frame in enumerate(frames, start=1):
+            start = time.perf_counter()
+            flipped = cv2.flip(frame, 1)
+            if i % frame_skip == 0:
+                detector.analyze(flipped)
+            samples.append(time.perf_counter() - start)
+    finally:
+        detector.release()
+    return summarize(samples)
+
+
+def parse_resolution(text: str) -> Tuple[int, int]:
+    """"640x480" biçimindeki çözünürlüğü ayrıştır."""
+    width, height = text.lower().split("x")
+    return int(width), int(height)
+
+
+def run_suite(frame_count: int = 60, resolutions=None, skips=None, sensitivities=None,
+              recorded: str = None, seed: int = 0) -> dict:
+    """
+    Tüm benchmark'ları çalıştır.
+
+    Args:
+        frame_count: Her ölçümde kullanılacak frame sayısı
+        resolutions: (genişlik, yükseklik) listesi
+        skips: Denenecek FRAME_SKIP değerleri
+        sensitivities: Denenecek hassasiyet değerleri
+        recorded: Kaydedilmiş frame klasörü veya video (None ise sentetik)
+        seed: Sentetik frame tohumu
+
+    Returns:
+        dict: {"meta": ..., "results": {ölçüm_adı: istatistikler}}
+    """
+    resolutions = resolutions or DEFAULT_RESOLUTIONS
+    skips = skips or DEFAULT_SKIPS
+    sensitivities = sensitivities or DEFAULT_SENSITIVITIES
+
+    source_frames = load_frames(recorded, frame_count) if recorded else None
+    results = {}
+
+    for width, height in resolutions:
+        if source_frames is not None:
+            frames = [cv2.resize(f, (width, height), interpolation=cv2.INTER_AREA) for f in source_frames]
+        else:
+            frames = list(generate_sequence(frame_count, width, height, seed=seed))
+        res = f"{width}x{height}"
+
+        for sensitivity in sensitivities:
+            for stage, stats in bench_stages(frames, sensitivity).items():
+                results[f"{res}/sens={sensitivity}/stage/{stage}"] = stats
+            for skip in skips:
+                results[f"{res}/sens={sensitivity}/loop/skip={skip}"] = bench_loop(frames, skip, sensitivity)
+
+    return {
+        "meta": {
+            "source": recorded or "synthetic",
+            "frames": frame_count,
+            "seed": seed,
+            "opencv": cv2.__version__,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, tolerance: float = 0.2,
+            metric: str = COMPARE_METRIC) -> List[dict]:
+    """
+    Sonuçları referansla karşılaştır.
+
+    Args:
+        current: run_suite() çıktısı
+        baseline: Kayıtlı referans (aynı biçimde)
+        tolerance: İzin verilen göreli yavaşlama (0.2 = %20)
+        metric: Karşılaştırılacak istatistik
+
+    Returns:
+        list: Eşiği aşan ölçümler (name, baseline, current, ratio)
+    """
+    regressions = []
+    for name, stats in current["results"].items():
+        base = baseline.get("results", {}).get(name, {})
+        if metric not in stats or metric not in base or base[metric] <= 0:
+            continue
+        ratio = stats[metric] / base[metric]
+        if ratio > 1.0 + tolerance:
+            regressions.append({
+                "name": name,
+                "baseline": base[metric],
+                "current": stats[metric],
+                "ratio": ratio,
+            })
+    return regressions
+
+
+def print_report(report: dict):
+    """Sonuçları tablo olarak yazdır."""
+    print(f"{'ölçüm':52s} {'p50':>8s} {'p95':>8s} {'p99':>8s} {'FPS':>8s}")
+    for name, stats in report["results"].items():
+        if stats.get("count", 0) == 0:
+            continue
+        print(f"{name:52s} {stats['p50_ms']:8.2f} {stats['p95_ms']:8.2f} "
+              f"{stats['p99_ms']:8.2f} {stats['throughput_fps']:8.1f}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Bakış tespit hattı benchmark'ı.")
+    parser.add_argument("--frames", type=int, default=60, help="Ölçüm başına frame sayısı")
+    parser.add_argument("--resolutions", nargs="+", type=parse_resolution,
+                        help="Çözünürlükler (ör. 640x480 320x240)")
+    parser.add_argument("--skips", nargs="+", type=int, help="FRAME_SKIP değerleri")
+    parser.add_argument("--sensitivities", nargs="+", type=float, help="Hassasiyet değerleri")
+    parser.add_argument("--recorded", help="Kaydedilmiş frame klasörü veya video dosyası")
+    parser.add_argument("--seed", type=int, default=0, help="Sentetik frame tohumu")
+    parser.add_argument("--output", help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("--baseline", help="Karşılaştırılacak referans JSON dosyası")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="İzin verilen yavaşlama oranı")
+    args = parser.parse_args(argv)
+
+    report = run_suite(args.frames, args.resolutions, args.skips, args.sensitivities,
+                       args.recorded, args.seed)
+    print_report(report)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.tolerance)
+        for r in regressions:
+            print(f"[YAVAŞLAMA] {r['name']}: {r['baseline']:.2f} ms -> {r['current']:.2f} ms "
+                  f"({r['ratio']:.2f}x)")
+        if regressions:
+            return 1
+        print("Referansa göre yavaşlama yok.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
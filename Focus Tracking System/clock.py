@@ -0,0 +1,93 @@
+"""
+Clock Module
+Oturum motoru, frame kaynakları ve pacer için değiştirilebilir saatler.
+Saatler çağrıldığında şimdiki zamanı (saniye) döndürür ve sleep() metodu sunar:
+- MonotonicClock: gerçek zaman
+- ScaledClock: gerçek zamanın `speed` katı hızında akan saat (hızlandırılmış tekrar)
+- SimulatedClock: sadece sleep()/advance() ile ilerleyen saat (beklemesiz tekrar, testler)
+"""
+
+import threading
+import time
+
+
+class MonotonicClock:
+    """Gerçek monotonik saat."""
+
+    def __call__(self) -> float:
+        return time.monotonic()
+
+    def sleep(self, seconds: float):
+        if seconds > 0:
+            time.sleep(seconds)
+
+
+class ScaledClock:
+    """
+    Gerçek zamandan `speed` kat hızlı akan saat.
+    sleep(s) gerçekte s / speed saniye bekler.
+    """
+
+    def __init__(self, speed: float, start: float = 0.0):
+        """
+        ScaledClock'u başlat.
+
+        Args:
+            speed: Hız çarpanı (ör. 100 = 100 kat hızlı)
+            start: Saatin başlangıç değeri
+        """
+        if speed <= 0:
+            raise ValueError(f"speed pozitif olmalı: {speed}")
+        self.speed = speed
+        self._start = start
+        self._real_start = time.monotonic()
+
+    def __call__(self) -> float:
+        return self._start + (time.monotonic() - self._real_start) * self.speed
+
+    def sleep(self, seconds: float):
+        if seconds > 0:
+            time.sleep(seconds / self.speed)
+
+
+class SimulatedClock:
+    """
+    Sadece sleep() ve advance() ile ilerleyen saat.
+    Thread-safe. sleep() beklemez, saati hemen ilerletir.
+    """
+
+    def __init__(self, start: float = 0.0):
+        self._now = start
+        self._lock = threading.Lock()
+
+    def __call__(self) -> float:
+        with self._lock:
+            return self._now
+
+    def sleep(self, seconds: float):
+        self.advance(seconds)
+
+    def advance(self, seconds: float):
+        """Saati ileri al (negatif değerler yok sayılır)."""
+        if seconds > 0:
+            with self._lock:
+                self._now += seconds
+
+    def advance_to(self, timestamp: float):
+        """Saati verilen zamana ilerlet (geriye alınmaz)."""
+        with self._lock:
+            self._now = max(self._now, timestamp)
+
+
+def create_clock(speed: float = 1.0):
+    """
+    Hız çarpanına göre saat oluştur.
+
+    Args:
+        speed: 1 ise gerçek saat, 0 ise beklemesiz simülasyon, diğer değerlerde ölçekli saat
+    """
+    if speed == 1:
+        return MonotonicClock()
+    if speed == 0:
+        return SimulatedClock()
+    return ScaledClock(speed)
@@ -19,11 +19,71 @@ TIME_OPTIONS = {
 GAZE_SENSITIVITY = 0.25
 DISTRACTION_THRESHOLD = 100
 
+# Dikkat dağınıklığı süreye göre ölçülür (işleme hızından bağımsız):
+# DISTRACTION_SECONDS kesintisiz uzaklaşma uyarı verir, uyarı REFOCUS_SECONDS
+# kesintisiz bakıştan sonra kapanır. DISTRACTION_THRESHOLD eski frame tabanlı eşiktir.
+DISTRACTION_SECONDS = 6.0
+REFOCUS_SECONDS = 0.5
+
+# Çok yüzlü mod: ortak kamerada her kişi için ayrı odak durumu
+MULTI_FACE_MODE = False
+MULTI_FACE_IOU_THRESHOLD = 0.3
+MULTI_FACE_MAX_MISSED = 10
+
 TARGET_FPS = 30
 FRAME_SKIP = 2
 WEBCAM_WIDTH = 640
 WEBCAM_HEIGHT = 480
 
+# Uyarlanabilir frame işleme: kararlı bakışta her ADAPTIVE_MAX_SKIP frame'de bir,
+# sınırlara yaklaşınca veya yüz/göz kaybolunca her ADAPTIVE_MIN_SKIP frame'de bir işlenir.
+ADAPTIVE_SCHEDULING = True
+ADAPTIVE_MIN_SKIP = 1
+ADAPTIVE_MAX_SKIP = 6
+ADAPTIVE_MARGIN = 0.05
+
+FACE_TRACKING = True
+FACE_REDETECT_INTERVAL = 10
+FACE_TRACKING_PADDING = 0.5
+
+# Yüz tespiti bu ölçekte yapılır (1.0 = tam, 0.5 = yarım, 0.25 = çeyrek).
+# Göz ve göz bebeği tespiti her zaman tam çözünürlükte yapılır.
+DETECTION_SCALE = 0.5
+
+# Bakış analizi için işçi süreç sayısı (0 = uygulama sürecinde).
+# Frame'ler işçilere paylaşılan bellek yuvalarıyla aktarılır (bkz. process_detector.py)
+DETECTOR_PROCESSES = 0
+# İşçi süreçten sonuç bekleme süresi (saniye); işçi ölürse bekleyen istekler hata alır
+DETECTOR_TIMEOUT = 10.0
+
+# Yüz/göz tespit arka ucu: "haar", "lbp" (daha hızlı) veya "dnn" (açılı yüzlerde daha dayanıklı)
+DETECTOR_BACKEND = "haar"
+MODELS_DIR = os.path.join(BASE_DIR, "models")
+LBP_FACE_CASCADE = os.path.join(MODELS_DIR, "lbpcascade_frontalface_improved.xml")
+DNN_FACE_PROTOTXT = os.path.join(MODELS_DIR, "deploy.prototxt")
+DNN_FACE_MODEL = os.path.join(MODELS_DIR, "res10_300x300_ssd_iter_140000.caffemodel")
+DNN_CONFIDENCE = 0.5
+
+# Göz bebeği bulma yöntemi: "external" (tek geçiş), "components", "moments" veya "contours" (eski yöntem)
+PUPIL_METHOD = "external"
+
+# Aşama bazında süre ölçümü (kapalıyken maliyeti ihmal edilebilir)
+INSTRUMENTATION_ENABLED = False
+INSTRUMENTATION_WINDOW = 300
+
+# Önizleme ana thread'de bu aralıkla (ms) güncellenir; arada gelen eski frame'ler atlanır
+PREVIEW_REFRESH_MS = 15
+
+# Oturum zaman çizelgesi: işlenen her frame'in sonucu TIMELINE_DIR altındaki ikili günlüğe
+# eklenir; kayıtlar TIMELINE_FLUSH_RECORDS kayıtta veya TIMELINE_FLUSH_INTERVAL saniyede bir yazılır
+TIMELINE_ENABLED = True
+TIMELINE_DIR = os.path.join(BASE_DIR, "sessions")
+TIMELINE_FLUSH_RECORDS = 256
+TIMELINE_FLUSH_INTERVAL = 1.0
+
+# Kamera ayrı thread'de okunur; işleme için sadece en yeni CAPTURE_BUFFER_SIZE frame tutulur
+CAPTURE_BUFFER_SIZE = 2
+
 WINDOW_SIZE = (900, 700)
 MIN_WINDOW_SIZE = (800, 600)
 WINDOW_TITLE = "Odak Yardımcısı"
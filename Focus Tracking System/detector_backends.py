@@ -0,0 +1,296 @@
+"""
+Detector Backends Module
+Yüz ve göz tespiti için değiştirilebilir arka uçlar.
+Haar Cascade, LBP Cascade ve OpenCV DNN (CPU) desteklenir.
+"""
+
+import os
+import sys
+import time
+import argparse
+from typing import Dict, List
+
+import cv2
+import numpy as np
+
+from model_registry import get_registry
+from config import (
+    DETECTOR_BACKEND,
+    LBP_FACE_CASCADE,
+    DNN_FACE_PROTOTXT,
+    DNN_FACE_MODEL,
+    DNN_CONFIDENCE
+)
+
+HAAR_FACE_CASCADE = cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
+HAAR_EYE_CASCADE = cv2.data.haarcascades + 'haarcascade_eye.xml'
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp')
+
+
+def _load_cascade(path: str) -> cv2.CascadeClassifier:
+    """Cascade dosyasını yükle; dosya yoksa veya okunamazsa hata ver."""
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Cascade dosyası bulunamadı: {path}")
+    cascade = cv2.CascadeClassifier(path)
+    if cascade.empty():
+        raise RuntimeError(f"Cascade dosyası okunamadı: {path}")
+    return cascade
+
+
+def _load_dnn(prototxt: str, model: str):
+    """Caffe yüz tespit ağını CPU üzerinde çalışacak şekilde yükle."""
+    net = cv2.dnn.readNetFromCaffe(prototxt, model)
+    net.setPreferableBackend(cv2.dnn.DNN_BACKEND_OPENCV)
+    net.setPreferableTarget(cv2.dnn.DNN_TARGET_CPU)
+    return net
+
+
+class DetectorBackend:
+    """
+    Yüz/göz tespit arka ucu için temel sınıf.
+    Tüm kutular (x, y, w, h) formatında, verilen görüntünün koordinatlarında döner.
+    """
+
+    name = "base"
+
+    def _acquire(self, key, loader):
+        """Modeli süreç genelindeki havuzdan kirala; release() ile geri verilir."""
+        model = get_registry().acquire(key, loader)
+        if not hasattr(self, '_leases'):
+            self._leases = []
+        self._leases.append((key, model))
+        return model
+
+    def _acquire_cascade(self, path: str) -> cv2.CascadeClassifier:
+        return self._acquire(("cascade", path), lambda: _load_cascade(path))
+
+    def detect_faces(self, gray: np.ndarray):
+        """Gri tonlamalı görüntüde yüzleri bul."""
+        raise NotImplementedError
+
+    def detect_eyes(self, face_gray: np.ndarray):
+        """Gri tonlamalı yüz bölgesinde gözleri bul."""
+        raise NotImplementedError
+
+    def release(self):
+        """Kiralanan modelleri havuza geri ver. Birden fazla çağrılabilir."""
+        leases = getattr(self, '_leases', [])
+        self._leases = []
+        for key, model in leases:
+            get_registry().release(key, model)
+
+
+class CascadeBackend(DetectorBackend):
+    """Cascade sınıflandırıcı tabanlı arka uç (Haar veya LBP)."""
+
+    def __init__(self, face_cascade_path: str, eye_cascade_path: str = HAAR_EYE_CASCADE,
+                 scale_factor: float = 1.3, min_neighbors: int = 5):
+        """
+        CascadeBackend'i başlat.
+
+        Args:
+            face_cascade_path: Yüz cascade XML dosyası
+            eye_cascade_path: Göz cascade XML dosyası
+            scale_factor: detectMultiScale ölçek adımı
+            min_neighbors: detectMultiScale komşu sayısı
+        """
+        self.face_cascade = self._acquire_cascade(face_cascade_path)
+        self.eye_cascade = self._acquire_cascade(eye_cascade_path)
+        self.scale_factor = scale_factor
+        self.min_neighbors = min_neighbors
+
+    def detect_faces(self, gray: np.ndarray):
+        return self.face_cascade.detectMultiScale(gray, self.scale_factor, self.min_neighbors)
+
+    def detect_eyes(self, face_gray: np.ndarray):
+        return self.eye_cascade.detectMultiScale(face_gray)
+
+
+class HaarBackend(CascadeBackend):
+    """OpenCV ile gelen Haar Cascade arka ucu (varsayılan)."""
+
+    name = "haar"
+
+    def __init__(self):
+        super().__init__(HAAR_FACE_CASCADE)
+
+
+class LBPBackend(CascadeBackend):
+    """LBP Cascade arka ucu. Haar'dan hızlı, biraz daha az isabetli."""
+
+    name = "lbp"
+
+    def __init__(self, face_cascade_path: str = None):
+        super().__init__(
+            face_cascade_path if face_cascade_path is not None else LBP_FACE_CASCADE,
+            scale_factor=1.1,
+            min_neighbors=3
+        )
+
+
+class DnnBackend(DetectorBackend):
+    """
+    OpenCV DNN (ResNet-10 SSD) yüz tespiti, CPU üzerinde.
+    Açılı yüzlerde daha dayanıklı; göz tespiti Haar Cascade ile yapılır.
+    """
+
+    name = "dnn"
+    INPUT_SIZE = (300, 300)
+    MEAN = (104.0, 177.0, 123.0)
+
+    def __init__(self, prototxt: str = None, model: str = None, confidence: float = None):
+        """
+        DnnBackend'i başlat.
+
+        Args:
+            prototxt: Caffe ağ tanımı (deploy.prototxt)
+            model: Caffe ağırlık dosyası (.caffemodel)
+            confidence: Minimum tespit güveni (0.0-1.0 arası)
+        """
+        prototxt = prototxt if prototxt is not None else DNN_FACE_PROTOTXT
+        model = model if model is not None else DNN_FACE_MODEL
+        for path in (prototxt, model):
+            if not os.path.exists(path):
+                raise FileNotFoundError(f"DNN model dosyası bulunamadı: {path}")
+
+        self.net = self._acquire(("dnn", prototxt, model), lambda: _load_dnn(prototxt, model))
+        self.confidence = confidence if confidence is not None else DNN_CONFIDENCE
+        self.eye_cascade = self._acquire_cascade(HAAR_EYE_CASCADE)
+
+    def detect_faces(self, gray: np.ndarray):
+        h, w = gray.shape[:2]
+        bgr = cv2.cvtColor(gray, cv2.COLOR_GRAY2BGR)
+        blob = cv2.dnn.blobFromImage(
+            cv2.resize(bgr, self.INPUT_SIZE), 1.0, self.INPUT_SIZE, self.MEAN
+        )
+        self.net.setInput(blob)
+        detections = self.net.forward()[0, 0]
+
+        detections = detections[detections[:, 2] >= self.confidence]
+        if len(detections) == 0:
+            return ()
+
+        corners = np.clip(detections[:, 3:7] * np.array([w, h, w, h]), 0, [w, h, w, h])
+        boxes = np.empty((len(corners), 4), dtype=np.int32)
+        boxes[:, :2] = corners[:, :2]
+        boxes[:, 2:] = corners[:, 2:] - corners[:, :2]
+        return boxes[(boxes[:, 2] > 0) & (boxes[:, 3] > 0)]
+
+    def detect_eyes(self, face_gray: np.ndarray):
+        return self.eye_cascade.detectMultiScale(face_gray)
+
+
+BACKENDS = {
+    HaarBackend.name: HaarBackend,
+    LBPBackend.name: LBPBackend,
+    DnnBackend.name: DnnBackend,
+}
+
+
+def create_backend(name: str = None) -> DetectorBackend:
+    """
+    İsme göre arka uç oluştur.
+
+    Args:
+        name: "haar", "lbp" veya "dnn" (None ise config'den alınır)
+    """
+    name = name if name is not None else DETECTOR_BACKEND
+    if name not in BACKENDS:
+        raise ValueError(f"Bilinmeyen arka uç: {name} (seçenekler: {', '.join(BACKENDS)})")
+    return BACKENDS[name]()
+
+
+def warm_up(name: str = None, background: bool = True):
+    """
+    Arka ucun modellerini önceden yükleyip havuza koy.
+    Uygulama açılışında çağrılırsa oturum başlatma anında olur.
+
+    Returns:
+        Arka plan thread'i veya None
+    """
+    return get_registry().warm_up(lambda: create_backend(name).release(), background)
+
+
+def load_frames(path: str, limit: int = None) -> List[np.ndarray]:
+    """Video dosyasından veya resim klasöründen frame'leri oku."""
+    frames = []
+    if os.path.isdir(path):
+        for filename in sorted(os.listdir(path)):
+            if filename.lower().endswith(IMAGE_EXTENSIONS):
+                image = cv2.imread(os.path.join(path, filename))
+                if image is not None:
+                    frames.append(image)
+            if limit is not None and len(frames) >= limit:
+                break
+    else:
+        cap = cv2.VideoCapture(path)
+        while limit is None or len(frames) < limit:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            frames.append(frame)
+        cap.release()
+    return frames
+
+
+def benchmark_backends(frames: List[np.ndarray], names: List[str] = None) -> Dict[str, dict]:
+    """
+    Arka uçları aynı frame'ler üzerinde karşılaştır.
+
+    Args:
+        frames: BGR formatında frame listesi
+        names: Denenecek arka uçlar (None ise hepsi)
+
+    Returns:
+        dict: Arka uç adı -> {ms_per_frame, fps, detection_rate} veya {error}
+    """
+    grays = [cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) for frame in frames]
+    report = {}
+
+    for name in (names if names is not None else list(BACKENDS)):
+        try:
+            backend = create_backend(name)
+        except (FileNotFoundError, RuntimeError) as e:
+            report[name] = {"error": str(e)}
+            continue
+
+        detected = 0
+        start = time.perf_counter()
+        for gray in grays:
+            if len(backend.detect_faces(gray)) > 0:
+                detected += 1
+        elapsed = time.perf_counter() - start
+        backend.release()
+
+        count = max(1, len(grays))
+        report[name] = {
+            "ms_per_frame": elapsed * 1000.0 / count,
+            "fps": count / elapsed if elapsed > 0 else float('inf'),
+            "detection_rate": detected / count,
+        }
+
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Yüz tespit arka uçlarını karşılaştır.")
+    parser.add_argument("source", help="Video dosyası veya resim klasörü")
+    parser.add_argument("--frames", type=int, default=200, help="Kullanılacak frame sayısı")
+    parser.add_argument("--backends", nargs="+", choices=list(BACKENDS), help="Denenecek arka uçlar")
+    args = parser.parse_args()
+
+    frames = load_frames(args.source, args.frames)
+    if not frames:
+        print(f"Frame okunamadı: {args.source}")
+        sys.exit(1)
+
+    print(f"{len(frames)} frame üzerinde karşılaştırma yapılıyor...\n")
+    for name, stats in benchmark_backends(frames, args.backends).items():
+        if "error" in stats:
+            print(f"{name:6s} kullanılamıyor: {stats['error']}")
+        else:
+            print(
+                f"{name:6s} {stats['ms_per_frame']:7.2f} ms/frame  "
+                f"{stats['fps']:7.1f} FPS  tespit oranı: {stats['detection_rate']:.0%}"
+            )
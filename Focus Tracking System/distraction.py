@@ -0,0 +1,77 @@
+"""
+Distraction Module
+Dikkat dağınıklığını frame sayısı yerine geçen süreye göre izleyen durum makinesi.
+Uyarı gecikmesi işleme hızından (FRAME_SKIP, TARGET_FPS, uyarlanabilir zamanlama,
+makine yükü) bağımsızdır.
+"""
+
+from typing import Optional
+
+from config import DISTRACTION_SECONDS, REFOCUS_SECONDS
+
+DISTRACTED = "distracted"
+REFOCUSED = "refocused"
+
+
+class DistractionTracker:
+    """
+    Zaman damgalı bakış örneklerinden dikkat durumunu çıkaran sınıf.
+
+    Kullanıcı `seconds` boyunca kesintisiz ekrana bakmazsa dikkati dağılmış
+    sayılır. Histerezis: uzaklaşma süresi ancak kullanıcı `refocus_seconds`
+    boyunca kesintisiz baktığında sıfırlanır; daha kısa bakışlar uyarıyı
+    kapatmaz ve birikmiş uzaklaşma süresini silmez.
+    """
+
+    def __init__(self, seconds: float = None, refocus_seconds: float = None):
+        """
+        DistractionTracker'ı başlat.
+
+        Args:
+            seconds: Uyarı için kesintisiz uzaklaşma süresi
+            refocus_seconds: Odağa dönüş sayılması için kesintisiz bakış süresi
+        """
+        self.seconds = seconds if seconds is not None else DISTRACTION_SECONDS
+        self.refocus_seconds = refocus_seconds if refocus_seconds is not None else REFOCUS_SECONDS
+        self.reset()
+
+    def reset(self):
+        """Durumu sıfırla."""
+        self.is_distracted = False
+        self.away_since: Optional[float] = None
+        self.looking_since: Optional[float] = None
+
+    def update(self, is_looking: bool, timestamp: float) -> Optional[str]:
+        """
+        Yeni bir bakış örneği işle.
+
+        Args:
+            is_looking: Kullanıcı ekrana bakıyor mu
+            timestamp: Örneğin zamanı (saniye)
+
+        Returns:
+            str: Durum bu örnekte değiştiyse DISTRACTED veya REFOCUSED, yoksa None
+        """
+        if is_looking:
+            if self.looking_since is None:
+                self.looking_since = timestamp
+            if timestamp - self.looking_since >= self.refocus_seconds:
+                self.away_since = None
+                if self.is_distracted:
+                    self.is_distracted = False
+                    return REFOCUSED
+            return None
+
+        self.looking_since = None
+        if self.away_since is None:
+            self.away_since = timestamp
+        if not self.is_distracted and timestamp - self.away_since >= self.seconds:
+            self.is_distracted = True
+            return DISTRACTED
+        return None
+
+    def away_seconds(self, timestamp: float) -> float:
+        """Verilen ana kadar süren kesintisiz uzaklaşma süresi."""
+        if self.away_since is None:
+            return 0.0
+        return max(0.0, timestamp - self.away_since)
@@ -0,0 +1,126 @@
+"""
+Frame Capture Module
+Kameradan ayrı bir thread'de okuyup sadece en yeni frame'leri tutan yakalama katmanı.
+İşleme tarafı her zaman en taze frame'i alır; yetişemediği frame'ler atlanır ve sayılır.
+"""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional
+
+import cv2
+import numpy as np
+
+from config import CAPTURE_BUFFER_SIZE
+
+
+@dataclass
+class CapturedFrame:
+    """Yakalanan frame ve meta bilgileri."""
+    frame: np.ndarray
+    timestamp: float
+    index: int
+
+    @property
+    def age(self) -> float:
+        """Frame yakalandıktan bu yana geçen süre (saniye)."""
+        return time.monotonic() - self.timestamp
+
+
+class LatestFrameCapture:
+    """
+    Ayrı thread'de frame okuyan ve son `buffer_size` frame'i tutan sınıf.
+    Thread-safe.
+
+    Sürücü tamponunda frame birikmesini önlemek için kamera sürekli okunur;
+    read() her zaman henüz verilmemiş en yeni frame'i döndürür.
+    """
+
+    def __init__(self, cap, buffer_size: int = None):
+        """
+        LatestFrameCapture'ı başlat.
+
+        Args:
+            cap: read() metodu olan kaynak (ör. cv2.VideoCapture)
+            buffer_size: Tutulacak en yeni frame sayısı
+        """
+        self.cap = cap
+        self._frames = deque(maxlen=max(1, buffer_size if buffer_size is not None else CAPTURE_BUFFER_SIZE))
+        self._cond = threading.Condition()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self._next_index = 0
+        self._last_read_index = -1
+        self.captured_count = 0
+        self.dropped_count = 0
+        self.failed_reads = 0
+
+        if hasattr(cap, "set"):
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+    def start(self):
+        """Yakalama thread'ini başlat."""
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            ret, frame = self.cap.read()
+            timestamp = time.monotonic()
+            if not ret:
+                with self._cond:
+                    self.failed_reads += 1
+                time.sleep(0.005)
+                continue
+
+            with self._cond:
+                self._frames.append(CapturedFrame(frame, timestamp, self._next_index))
+                self._next_index += 1
+                self.captured_count += 1
+                self._cond.notify_all()
+
+    def read(self, timeout: float = None) -> Optional[CapturedFrame]:
+        """
+        Henüz verilmemiş en yeni frame'i bekle ve döndür.
+
+        Args:
+            timeout: Maksimum bekleme süresi (saniye, None ise süresiz)
+
+        Returns:
+            CapturedFrame veya zaman aşımında / durdurulmuşsa None
+        """
+        with self._cond:
+            has_new = self._cond.wait_for(
+                lambda: self._stop_event.is_set()
+                or (self._frames and self._frames[-1].index > self._last_read_index),
+                timeout
+            )
+            if not has_new or self._stop_event.is_set():
+                return None
+
+            latest = self._frames[-1]
+            self.dropped_count += latest.index - self._last_read_index - 1
+            self._last_read_index = latest.index
+            return latest
+
+    def stats(self) -> dict:
+        """Yakalanan, atlanan ve okunamayan frame sayıları."""
+        with self._cond:
+            return {
+                "captured": self.captured_count,
+                "dropped": self.dropped_count,
+                "failed_reads": self.failed_reads,
+            }
+
+    def stop(self, timeout: float = 1.0):
+        """Yakalama thread'ini durdur ve bekleyen okuyucuları uyandır."""
+        self._stop_event.set()
+        with self._cond:
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
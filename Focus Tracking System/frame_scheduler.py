@@ -0,0 +1,189 @@
+"""
+Frame Scheduler Module
+Hangi frame'lerin işleneceğine bakış durumuna göre karar veren zamanlayıcı
+ve döngüleri sabit frame sürelerine göre adımlayan pacer.
+"""
+
+import time
+from collections import deque
+from typing import Callable, Dict
+
+import numpy as np
+
+from config import (
+    TARGET_FPS,
+    FRAME_SKIP,
+    GAZE_SENSITIVITY,
+    ADAPTIVE_SCHEDULING,
+    ADAPTIVE_MIN_SKIP,
+    ADAPTIVE_MAX_SKIP,
+    ADAPTIVE_MARGIN
+)
+
+
+class AdaptiveFrameScheduler:
+    """
+    Bakış durumuna göre frame işleme aralığını ayarlayan sınıf.
+
+    Kullanıcı ekrana kararlı şekilde bakarken aralık her işlenen frame'de
+    bir artarak `max_skip`'e kadar çıkar. Yüz veya göz kaybolduğunda,
+    kullanıcı ekrana bakmadığında ya da ortalama oran hassasiyet sınırlarına
+    `margin` kadar yaklaştığında aralık hemen `min_skip`'e iner.
+    """
+
+    def __init__(self, min_skip: int = None, max_skip: int = None,
+                 margin: float = None, enabled: bool = None):
+        """
+        AdaptiveFrameScheduler'ı başlat.
+
+        Args:
+            min_skip: En sık işleme aralığı (1 = her frame)
+            max_skip: En seyrek işleme aralığı
+            margin: Hassasiyet sınırlarına bu kadar yakın oranlar kararsız sayılır
+            enabled: False ise her FRAME_SKIP'inci frame işlenir
+        """
+        self.enabled = enabled if enabled is not None else ADAPTIVE_SCHEDULING
+        self.min_skip = max(1, min_skip if min_skip is not None else ADAPTIVE_MIN_SKIP)
+        self.max_skip = max(self.min_skip, max_skip if max_skip is not None else ADAPTIVE_MAX_SKIP)
+        self.margin = margin if margin is not None else ADAPTIVE_MARGIN
+
+        self.interval = self.min_skip if self.enabled else max(1, FRAME_SKIP)
+        self._frames_since_processed = 0
+
+    def should_process(self) -> bool:
+        """Yeni gelen frame işlenmeli mi? Her frame için bir kez çağrılır."""
+        self._frames_since_processed += 1
+        if self._frames_since_processed >= self.interval:
+            self._frames_since_processed = 0
+            return True
+        return False
+
+    def update(self, result, sensitivity: float = None):
+        """
+        İşlenen frame'in sonucuna göre aralığı güncelle.
+
+        Args:
+            result: GazeDetector.analyze() sonucu
+            sensitivity: Detector'ın hassasiyeti (None ise config'den alınır)
+        """
+        if not self.enabled:
+            return
+
+        if self._is_steady(result, sensitivity if sensitivity is not None else GAZE_SENSITIVITY):
+            self.interval = min(self.interval + 1, self.max_skip)
+        else:
+            self.interval = self.min_skip
+
+    def update_many(self, results, sensitivity: float = None):
+        """
+        Çok yüzlü modda aralığı güncelle; tüm yüzler kararlıysa aralık artar.
+
+        Args:
+            results: GazeDetector.analyze_all() sonuçları
+            sensitivity: Detector'ın hassasiyeti (None ise config'den alınır)
+        """
+        if not self.enabled:
+            return
+
+        sensitivity = sensitivity if sensitivity is not None else GAZE_SENSITIVITY
+        if results and all(self._is_steady(r, sensitivity) for r in results):
+            self.interval = min(self.interval + 1, self.max_skip)
+        else:
+            self.interval = self.min_skip
+
+    def _is_steady(self, result, sensitivity: float) -> bool:
+        if not result.is_looking or result.avg_ratio is None:
+            return False
+        return abs(result.avg_ratio - 0.50) <= (sensitivity / 2) - self.margin
+
+    def reset(self):
+        """Zamanlayıcıyı başlangıç durumuna getir."""
+        self.interval = self.min_skip if self.enabled else max(1, FRAME_SKIP)
+        self._frames_since_processed = 0
+
+
+class FramePacer:
+    """
+    Döngüyü monotonik saatte sabit aralıklı hedef zamanlara (deadline) göre adımlayan sınıf.
+
+    Her wait() çağrısı bir sonraki hedef zamana kadar bekler; iş süresi
+    bekleme süresinden düşülür. Döngü geride kaldığında kaçırılan hedefler
+    atlanır (biriken gecikme telafi edilmeye çalışılmaz) ve sayılır.
+    """
+
+    def __init__(self, fps: float = None, clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], object] = time.sleep, window: int = 120):
+        """
+        FramePacer'ı başlat.
+
+        Args:
+            fps: Hedef adım hızı (None ise TARGET_FPS)
+            clock: Monotonik saat fonksiyonu (saniye)
+            sleep: Bekleme fonksiyonu (ör. time.sleep veya threading.Event.wait)
+            window: Hız/titreme hesabı için tutulacak son aralık sayısı
+        """
+        fps = fps if fps is not None else TARGET_FPS
+        if fps <= 0:
+            raise ValueError(f"fps pozitif olmalı: {fps}")
+        self.period = 1.0 / fps
+        self._clock = clock
+        self._sleep = sleep
+        self._intervals = deque(maxlen=window)
+        self.reset()
+
+    def reset(self):
+        """Hedef zamanları şimdiki andan yeniden başlat."""
+        now = self._clock()
+        self._deadline = now + self.period
+        self._last_tick = now
+        self._intervals.clear()
+        self.missed_deadlines = 0
+        self.ticks = 0
+
+    def wait(self) -> int:
+        """
+        Bir sonraki hedef zamana kadar bekle.
+
+        Returns:
+            int: Bu adımda kaçırılan hedef sayısı (0 = zamanında)
+        """
+        delay = self.remaining()
+        if delay > 0:
+            self._sleep(delay)
+        return self.tick()
+
+    def remaining(self) -> float:
+        """Bir sonraki hedef zamana kalan süre (geride kalındıysa 0)."""
+        return max(0.0, self._deadline - self._clock())
+
+    def tick(self) -> int:
+        """
+        Beklemeden adımı kaydet ve bir sonraki hedef zamanı belirle.
+        Beklemeyi kendisi yapan çağıranlar (ör. asyncio.sleep) remaining() ile birlikte kullanır.
+
+        Returns:
+            int: Bu adımda kaçırılan hedef sayısı (0 = zamanında)
+        """
+        now = self._clock()
+        missed = 0 if now < self._deadline else int((now - self._deadline) // self.period)
+        self._deadline += (missed + 1) * self.period
+        self.missed_deadlines += missed
+
+        self._intervals.append(now - self._last_tick)
+        self._last_tick = now
+        self.ticks += 1
+        return missed
+
+    def stats(self) -> Dict[str, float]:
+        """Hedef ve ulaşılan hız, aralıkların standart sapması (titreme) ve kaçırılan hedefler."""
+        stats = {
+            "target_fps": 1.0 / self.period,
+            "ticks": self.ticks,
+            "missed_deadlines": self.missed_deadlines,
+        }
+        if self._intervals:
+            intervals = np.asarray(self._intervals)
+            mean = float(intervals.mean())
+            stats["achieved_fps"] = 1.0 / mean if mean > 0 else float("inf")
+            stats["jitter_ms"] = float(intervals.std() * 1000.0)
+        return stats
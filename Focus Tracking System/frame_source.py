@@ -0,0 +1,275 @@
+"""
+Frame Source Module
+Oturum motoruna frame sağlayan kaynaklar: canlı kamera, video dosyası,
+resim klasörü ve deterministik sentetik yüz üretici.
+Her kaynak frame'leri zaman damgası ve sıra numarasıyla (CapturedFrame) verir.
+Kamera dışındaki kaynaklar kendi FPS'lerinde (realtime) veya olabildiğince hızlı okunabilir.
+"""
+
+import os
+import time
+from typing import Callable, Iterator, List, Optional
+
+import cv2
+import numpy as np
+
+from frame_capture import LatestFrameCapture, CapturedFrame
+from frame_scheduler import FramePacer
+from detector_backends import IMAGE_EXTENSIONS
+from synthetic_frames import generate_sequence
+from config import TARGET_FPS, WEBCAM_WIDTH, WEBCAM_HEIGHT
+
+
+class FrameSource:
+    """
+    Frame kaynağı temel sınıfı.
+
+    Alt sınıflar _next_frame() metodunu uygular. read() sıradaki frame'i
+    kaynak zamanıyla (index / fps) döndürür; kaynak bittiğinde None döndürür
+    ve `exhausted` True olur. `realtime` açıkken read() kaynağın FPS'ine göre adımlanır.
+    """
+
+    def __init__(self, fps: float = None, realtime: bool = False,
+                 clock: Callable[[], float] = time.monotonic, sleep: Callable[[float], object] = time.sleep):
+        """
+        FrameSource'u başlat.
+
+        Args:
+            fps: Kaynağın frame hızı (zaman damgaları ve realtime adımlama için)
+            realtime: True ise frame'ler fps hızında, False ise olabildiğince hızlı verilir
+            clock: Realtime adımlama saati
+            sleep: Realtime adımlama bekleme fonksiyonu
+        """
+        self.fps = fps if fps else TARGET_FPS
+        self.realtime = realtime
+        self._clock = clock
+        self._sleep = sleep
+        self._pacer: Optional[FramePacer] = None
+        self.index = 0
+        self.exhausted = False
+
+    def _next_frame(self) -> Optional[np.ndarray]:
+        raise NotImplementedError
+
+    def read(self, timeout: float = None) -> Optional[CapturedFrame]:
+        """
+        Sıradaki frame'i oku.
+
+        Args:
+            timeout: Kullanılmaz (canlı kaynaklarla aynı arayüz için)
+
+        Returns:
+            CapturedFrame veya kaynak bittiyse None
+        """
+        if self.exhausted:
+            return None
+
+        frame = self._next_frame()
+        if frame is None:
+            self.exhausted = True
+            return None
+
+        if self.realtime:
+            if self._pacer is None:
+                self._pacer = FramePacer(self.fps, clock=self._clock, sleep=self._sleep)
+            else:
+                self._pacer.wait()
+
+        captured = CapturedFrame(frame, self.index / self.fps, self.index)
+        self.index += 1
+        return captured
+
+    def start(self):
+        """Kaynağı başlat (gerekiyorsa)."""
+
+    def release(self):
+        """Kaynağın tuttuğu kaynakları bırak."""
+        self.exhausted = True
+
+    def stats(self) -> dict:
+        """Okunan frame sayısı."""
+        return {"captured": self.index, "dropped": 0}
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+        return False
+
+
+class CameraSource(FrameSource):
+    """
+    Canlı kamera kaynağı.
+    Kamera ayrı thread'de okunur, read() her zaman en yeni frame'i verir;
+    zaman damgaları monotonik saattendir.
+    """
+
+    def __init__(self, index: int = 0, width: int = None, height: int = None, buffer_size: int = None):
+        """
+        CameraSource'u başlat.
+
+        Args:
+            index: Kamera numarası
+            width: İstenen genişlik
+            height: İstenen yükseklik
+            buffer_size: Tutulacak en yeni frame sayısı
+
+        Raises:
+            IOError: Kamera açılamazsa
+        """
+        self.cap = cv2.VideoCapture(index)
+        if not self.cap.isOpened():
+            raise IOError(f"Kamera açılamadı: {index}")
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width if width is not None else WEBCAM_WIDTH)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height if height is not None else WEBCAM_HEIGHT)
+        super().__init__(fps=self.cap.get(cv2.CAP_PROP_FPS), realtime=False)
+        self.capture = LatestFrameCapture(self.cap, buffer_size)
+
+    def start(self):
+        self.capture.start()
+
+    def read(self, timeout: float = None) -> Optional[CapturedFrame]:
+        """En yeni frame'i bekle (zaman aşımında None)."""
+        if self.exhausted:
+            return None
+        return self.capture.read(timeout)
+
+    def stats(self) -> dict:
+        return self.capture.stats()
+
+    def release(self):
+        if self.exhausted:
+            return
+        super().release()
+        self.capture.stop()
+        self.cap.release()
+
+
+class VideoFileSource(FrameSource):
+    """Video dosyası kaynağı; zaman damgaları videonun kendi zamanıdır."""
+
+    def __init__(self, path: str, realtime: bool = False, loop: bool = False, **kwargs):
+        """
+        VideoFileSource'u başlat.
+
+        Args:
+            path: Video dosyası
+            realtime: True ise videonun FPS'inde oynatılır
+            loop: True ise video bitince başa sarılır
+
+        Raises:
+            IOError: Video açılamazsa
+        """
+        self.path = path
+        self.cap = cv2.VideoCapture(path)
+        if not self.cap.isOpened():
+            raise IOError(f"Video açılamadı: {path}")
+        self.loop = loop
+        super().__init__(fps=self.cap.get(cv2.CAP_PROP_FPS), realtime=realtime, **kwargs)
+
+    def _next_frame(self) -> Optional[np.ndarray]:
+        ret, frame = self.cap.read()
+        if not ret and self.loop and self.index > 0:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ret, frame = self.cap.read()
+        return frame if ret else None
+
+    def release(self):
+        super().release()
+        self.cap.release()
+
+
+class ImageFolderSource(FrameSource):
+    """Klasördeki resimleri ad sırasıyla veren kaynak."""
+
+    def __init__(self, path: str, fps: float = None, realtime: bool = False, loop: bool = False, **kwargs):
+        """
+        ImageFolderSource'u başlat.
+
+        Args:
+            path: Resim klasörü
+            fps: Zaman damgaları için varsayılan frame hızı
+            realtime: True ise resimler fps hızında verilir
+            loop: True ise son resimden sonra başa dönülür
+
+        Raises:
+            IOError: Klasörde resim yoksa
+        """
+        self.files: List[str] = [
+            os.path.join(path, name) for name in sorted(os.listdir(path))
+            if name.lower().endswith(IMAGE_EXTENSIONS)
+        ]
+        if not self.files:
+            raise IOError(f"Klasörde resim bulunamadı: {path}")
+        self.loop = loop
+        super().__init__(fps=fps, realtime=realtime, **kwargs)
+
+    def _next_frame(self) -> Optional[np.ndarray]:
+        # Tam bir tur boyunca hiçbir resim okunamazsa kaynak tükenmiş sayılır
+        for _ in range(len(self.files)):
+            if self.index >= len(self.files) and not self.loop:
+                return None
+            image = cv2.imread(self.files[self.index % len(self.files)])
+            if image is not None:
+                return image
+            # Okunamayan dosya atlanır; sıra numarası yine de ilerler
+            self.index += 1
+        return None
+
+
+class SyntheticSource(FrameSource):
+    """Deterministik sentetik yüz frame'leri veren kaynak (bkz. synthetic_frames)."""
+
+    def __init__(self, count: int = 300, width: int = None, height: int = None, seed: int = 0,
+                 absent_every: int = 0, fps: float = None, realtime: bool = False, **kwargs):
+        """
+        SyntheticSource'u başlat.
+
+        Args:
+            count: Üretilecek frame sayısı
+            width: Frame genişliği
+            height: Frame yüksekliği
+            seed: Rastgelelik tohumu
+            absent_every: 0'dan büyükse yüz periyodik olarak kaybolur
+            fps: Zaman damgaları için frame hızı
+            realtime: True ise frame'ler fps hızında verilir
+        """
+        super().__init__(fps=fps, realtime=realtime, **kwargs)
+        self.count = count
+        self._frames: Iterator[np.ndarray] = generate_sequence(
+            count, width or WEBCAM_WIDTH, height or WEBCAM_HEIGHT, seed, absent_every
+        )
+
+    def _next_frame(self) -> Optional[np.ndarray]:
+        return next(self._frames, None)
+
+
+def open_source(spec, realtime: bool = False, clock=None) -> FrameSource:
+    """
+    Tanımdan frame kaynağı oluştur.
+
+    Args:
+        spec: Kamera numarası (ör. 0 veya "0"), "synthetic[:frame_sayısı]",
+              resim klasörü veya video dosyası yolu
+        realtime: Dosya ve sentetik kaynaklar kendi FPS'lerinde mi verilsin
+        clock: Realtime adımlamada kullanılacak saat (bkz. clock.py); verilirse realtime açılır
+
+    Returns:
+        FrameSource
+    """
+    text = str(spec)
+    if text.isdigit():
+        return CameraSource(int(text))
+
+    kwargs = {"realtime": realtime}
+    if clock is not None:
+        kwargs.update(realtime=True, clock=clock, sleep=clock.sleep)
+
+    if text == "synthetic" or text.startswith("synthetic:"):
+        _, _, count = text.partition(":")
+        return SyntheticSource(int(count) if count else 300, **kwargs)
+    if os.path.isdir(text):
+        return ImageFolderSource(text, **kwargs)
+    return VideoFileSource(text, **kwargs)
@@ -5,33 +5,95 @@ Işık değişimlerine karşı Histogram Eşitleme ve Dinamik Eşikleme içerir.
 
 import cv2
 import numpy as np
-from typing import Tuple
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
 
-from config import GAZE_SENSITIVITY, COLORS
+from detector_backends import DetectorBackend, create_backend
+from instrumentation import get_profiler
+from config import (
+    GAZE_SENSITIVITY,
+    COLORS,
+    FACE_TRACKING,
+    FACE_REDETECT_INTERVAL,
+    FACE_TRACKING_PADDING,
+    DETECTION_SCALE,
+    PUPIL_METHOD
+)
+
+
+Box = Tuple[int, int, int, int]
+
+_profiler = get_profiler()
+
+
+@dataclass
+class GazeResult:
+    """
+    Tek bir frame'in analiz sonucu.
+    Tüm koordinatlar tam frame koordinatlarındadır.
+    """
+    face: Optional[Box] = None
+    eyes: List[Box] = field(default_factory=list)
+    pupils: List[Tuple[Tuple[int, int], int]] = field(default_factory=list)
+    avg_ratio: Optional[float] = None
+    direction: str = "merkez"
+    is_looking: bool = False
+    
+    @property
+    def face_detected(self) -> bool:
+        return self.face is not None
+    
+    @property
+    def pupil_detected(self) -> bool:
+        return self.avg_ratio is not None
 
 
 class GazeDetector:
     """
     OpenCV tabanlı bakış yönü tespit sınıfı.
-    Haar Cascade kullanarak yüz ve göz tespiti yapar.
+    Yüz ve göz tespiti seçilen arka uç ile yapılır (varsayılan: Haar Cascade).
     """
     
-    def __init__(self, sensitivity: float = None):
+    def __init__(self, sensitivity: float = None, tracking: bool = None,
+                 detection_scale: float = None, backend=None, pupil_method: str = None):
         """
         GazeDetector'ı başlat.
         
         Args:
             sensitivity: Bakış hassasiyeti (0.0-1.0 arası)
+            tracking: Yüz takip modu (None ise config'den alınır)
+            detection_scale: Yüz tespitinin yapılacağı ölçek (0.0-1.0 arası)
+            backend: Arka uç adı ("haar", "lbp", "dnn") veya DetectorBackend nesnesi
+            pupil_method: Göz bebeği bulma yöntemi
+                ("external", "components", "moments", "contours")
         """
-        self.face_cascade = cv2.CascadeClassifier(
-            cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
-        )
-        self.eye_cascade = cv2.CascadeClassifier(
-            cv2.data.haarcascades + 'haarcascade_eye.xml'
-        )
+        if isinstance(backend, DetectorBackend):
+            self.backend = backend
+        else:
+            self.backend = create_backend(backend)
         
         self.sensitivity = sensitivity if sensitivity is not None else GAZE_SENSITIVITY
         
+        self.tracking = tracking if tracking is not None else FACE_TRACKING
+        self.redetect_interval = max(1, FACE_REDETECT_INTERVAL)
+        self.tracking_padding = FACE_TRACKING_PADDING
+        self._last_face = None
+        self._frames_since_detect = 0
+        
+        self.detection_scale = detection_scale if detection_scale is not None else DETECTION_SCALE
+        if not 0.0 < self.detection_scale <= 1.0:
+            raise ValueError(f"detection_scale 0.0-1.0 aralığında olmalı: {self.detection_scale}")
+        
+        self._pupil_locators = {
+            "external": self._pupil_from_external,
+            "components": self._pupil_from_components,
+            "moments": self._pupil_from_moments,
+            "contours": self._pupil_from_contours,
+        }
+        self.pupil_method = pupil_method if pupil_method is not None else PUPIL_METHOD
+        if self.pupil_method not in self._pupil_locators:
+            raise ValueError(f"Bilinmeyen göz bebeği yöntemi: {self.pupil_method}")
+        
         self.COLOR_FACE = COLORS.get("face", (155, 152, 229))
         self.COLOR_EYE = COLORS.get("eye", (141, 131, 181))
         self.COLOR_TEXT = COLORS.get("text", (155, 152, 229))
@@ -42,136 +104,401 @@ class GazeDetector:
         self._gaze_direction = "merkez"
         self._face_detected = False
 
-    def detect_pupil(self, eye_roi_gray):
+    @property
+    def face_cascade(self):
+        """Arka ucun yüz cascade'i (cascade tabanlı olmayan arka uçlarda None)."""
+        return getattr(self.backend, 'face_cascade', None)
+    
+    @face_cascade.setter
+    def face_cascade(self, cascade):
+        self.backend.face_cascade = cascade
+    
+    @property
+    def eye_cascade(self):
+        """Arka ucun göz cascade'i."""
+        return getattr(self.backend, 'eye_cascade', None)
+    
+    @eye_cascade.setter
+    def eye_cascade(self, cascade):
+        self.backend.eye_cascade = cascade
+
+    def _detect_in_region(self, gray: np.ndarray, x0: int, y0: int, x1: int, y1: int):
+        """
+        Verilen bölgede yüz ara.
+        
+        Bölge `detection_scale` oranında küçültülerek taranır, bulunan
+        kutular tam çözünürlüğe geri ölçeklenir.
+        
+        Returns:
+            Yüz kutuları (x, y, w, h) - tam frame koordinatlarında
+        """
+        region = gray[y0:y1, x0:x1]
+        scale = self.detection_scale
+        
+        if scale < 1.0:
+            small_w = max(1, int(region.shape[1] * scale))
+            small_h = max(1, int(region.shape[0] * scale))
+            region = cv2.resize(region, (small_w, small_h), interpolation=cv2.INTER_AREA)
+        
+        faces = self.backend.detect_faces(region)
+        if len(faces) == 0:
+            return faces
+        
+        if scale < 1.0:
+            faces = (np.asarray(faces) / scale).astype(np.int32)
+        return faces + np.array([x0, y0, 0, 0])
+
+    def _detect_faces(self, gray: np.ndarray):
+        """
+        Yüz tespiti yap.
+        
+        Takip modunda son yüz kutusunun etrafındaki genişletilmiş pencerede
+        arar. Her `redetect_interval` frame'de bir veya takip kaybolduğunda
+        tüm frame taranır.
+        
+        Args:
+            gray: Gri tonlamalı tam frame
+            
+        Returns:
+            Yüz kutuları (x, y, w, h) - tam frame koordinatlarında
+        """
+        if (self.tracking and self._last_face is not None
+                and self._frames_since_detect < self.redetect_interval):
+            x, y, w, h = self._last_face
+            pad_w = int(w * self.tracking_padding)
+            pad_h = int(h * self.tracking_padding)
+            x0, y0 = max(0, x - pad_w), max(0, y - pad_h)
+            x1 = min(gray.shape[1], x + w + pad_w)
+            y1 = min(gray.shape[0], y + h + pad_h)
+            
+            faces = self._detect_in_region(gray, x0, y0, x1, y1)
+            if len(faces) > 0:
+                self._last_face = tuple(int(v) for v in faces[0])
+                self._frames_since_detect += 1
+                return faces
+        
+        faces = self._detect_in_region(gray, 0, 0, gray.shape[1], gray.shape[0])
+        self._frames_since_detect = 0
+        self._last_face = tuple(int(v) for v in faces[0]) if len(faces) > 0 else None
+        return faces
+
+    def reset_tracking(self):
+        """Yüz takibini sıfırla; sonraki frame tam taramayla başlar."""
+        self._last_face = None
+        self._frames_since_detect = 0
+
+    def _threshold_eye(self, eye_roi_gray: np.ndarray) -> np.ndarray:
+        """Göz bölgesini eşitle, bulanıklaştır ve en koyu bölgeyi eşikle."""
+        eye_roi_gray = cv2.equalizeHist(eye_roi_gray)
+        blur = cv2.GaussianBlur(eye_roi_gray, (7, 7), 0)
+        min_val = cv2.minMaxLoc(blur)[0]
+        _, threshold = cv2.threshold(blur, min_val + 20, 255, cv2.THRESH_BINARY_INV)
+        return threshold
+
+    @staticmethod
+    def _pupil_from_external(threshold: np.ndarray):
+        """En büyük dış konturun çevreleyen çemberi; sıralama yapmadan tek geçişte."""
+        contours, _ = cv2.findContours(threshold, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        best, best_area = None, -1.0
+        for cnt in contours:
+            area = cv2.contourArea(cnt)
+            if area > best_area:
+                best, best_area = cnt, area
+        
+        if best is None:
+            return None, 0
+        return cv2.minEnclosingCircle(best)
+
+    @staticmethod
+    def _pupil_from_components(threshold: np.ndarray):
+        """En büyük bağlı bileşenin ağırlık merkezi; tek geçişte bulunur."""
+        count, _, stats, centroids = cv2.connectedComponentsWithStats(threshold, connectivity=8)
+        if count < 2:
+            return None, 0
+        
+        label = 1 + int(np.argmax(stats[1:, cv2.CC_STAT_AREA]))
+        radius = max(stats[label, cv2.CC_STAT_WIDTH], stats[label, cv2.CC_STAT_HEIGHT]) / 2
+        return tuple(centroids[label]), radius
+
+    @staticmethod
+    def _pupil_from_moments(threshold: np.ndarray):
+        """Tüm koyu piksellerin moment tabanlı ağırlık merkezi."""
+        moments = cv2.moments(threshold, binaryImage=True)
+        if moments["m00"] == 0:
+            return None, 0
+        
+        center = (moments["m10"] / moments["m00"], moments["m01"] / moments["m00"])
+        return center, np.sqrt(moments["m00"] / np.pi)
+
+    @staticmethod
+    def _pupil_from_contours(threshold: np.ndarray):
+        """Eski yöntem: en büyük konturun çevreleyen çemberi (karşılaştırma için)."""
+        contours, _ = cv2.findContours(threshold, cv2.RETR_TREE, cv2.CHAIN_APPROX_SIMPLE)
+        contours = sorted(contours, key=lambda x: cv2.contourArea(x), reverse=True)
+        if len(contours) == 0:
+            return None, 0
+        
+        return cv2.minEnclosingCircle(contours[0])
+
+    def detect_pupil(self, eye_roi_gray, method: str = None):
         """
         Işık değişimlerine dayanıklı göz bebeği tespiti.
         
         Args:
             eye_roi_gray: Gri tonlamalı göz bölgesi
+            method: "external", "components", "moments" veya "contours"
+                (None ise pupil_method)
             
         Returns:
             tuple: (center, radius) veya (None, 0)
         """
+        locate = self._pupil_locators[method if method is not None else self.pupil_method]
         try:
-            eye_roi_gray = cv2.equalizeHist(eye_roi_gray)
-            blur = cv2.GaussianBlur(eye_roi_gray, (7, 7), 0)
-            min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(blur)
-            threshold_value = min_val + 20 
-            _, threshold = cv2.threshold(blur, threshold_value, 255, cv2.THRESH_BINARY_INV)
-            contours, _ = cv2.findContours(threshold, cv2.RETR_TREE, cv2.CHAIN_APPROX_SIMPLE)
-            contours = sorted(contours, key=lambda x: cv2.contourArea(x), reverse=True)
+            center, radius = locate(self._threshold_eye(eye_roi_gray))
             
-            if len(contours) > 0:
-                cnt = contours[0]
-                (cx, cy), radius = cv2.minEnclosingCircle(cnt)
-                area = cv2.contourArea(cnt)
-                if 2 < radius < (eye_roi_gray.shape[0] * 0.4):
-                    return (int(cx), int(cy)), int(radius)
+            if center is not None and 2 < radius < (eye_roi_gray.shape[0] * 0.4):
+                return (int(center[0]), int(center[1])), int(radius)
             
             return None, 0
         except Exception as e:
             return None, 0
 
-    def process_frame(self, frame: np.ndarray) -> Tuple[np.ndarray, bool, str]:
+    @staticmethod
+    def _to_gray(frame: np.ndarray) -> np.ndarray:
+        """BGR frame'i gri tonlamaya çevir; zaten gri ise olduğu gibi döndür."""
+        if frame.ndim == 2:
+            return frame
+        with _profiler.probe("cvtColor"):
+            return cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+
+    def _classify(self, avg_ratio: float) -> Tuple[str, bool]:
+        """Ortalama göz bebeği oranından bakış yönünü belirle."""
+        limit_low = 0.50 - (self.sensitivity / 2)
+        limit_high = 0.50 + (self.sensitivity / 2)
+        
+        if limit_low <= avg_ratio <= limit_high:
+            return "merkez", True
+        if avg_ratio < limit_low:
+            return "sol", False
+        return "sag", False
+
+    def _analyze_face(self, gray: np.ndarray, face: Box, eyes, previous_direction: str) -> GazeResult:
         """
-        Video frame'ini işle ve bakış yönünü tespit et.
+        Tek bir yüzün gözlerinde göz bebeği ara ve bakış yönünü belirle.
         
         Args:
-            frame: BGR formatında video frame
-            
-        Returns:
-            tuple: (işlenmiş_frame, ekrana_bakıyor_mu, bakış_yönü)
+            gray: Gri tonlamalı tam frame
+            face: Yüz kutusu (tam frame koordinatlarında)
+            eyes: Yüzün üst yarısına göre göz kutuları
+            previous_direction: Göz bebeği bulunamazsa korunacak yön
         """
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        output_frame = frame.copy()
+        (x, y, w, h) = face
+        roi_gray_face = gray[y:y+h//2, x:x+w]
         
-        faces = self.face_cascade.detectMultiScale(gray, 1.3, 5)
+        eye_boxes = []
+        pupils = []
+        pupil_ratios = []
         
-        if len(faces) > 0:
-            self._face_detected = True
-            (x, y, w, h) = faces[0]
+        for (ex, ey, ew, eh) in eyes:
+            eye_boxes.append((x + int(ex), y + int(ey), int(ew), int(eh)))
             
-            cv2.rectangle(output_frame, (x, y), (x+w, y+h), self.COLOR_FACE, 2)
+            eye_roi = roi_gray_face[ey:ey+eh, ex:ex+ew]
+            with _profiler.probe("detect_pupil"):
+                pupil_center, radius = self.detect_pupil(eye_roi)
             
-            roi_gray_face = gray[y:y+h//2, x:x+w]
-            roi_color_face = output_frame[y:y+h//2, x:x+w]
+            if pupil_center:
+                pupils.append(((int(x + ex + pupil_center[0]), int(y + ey + pupil_center[1])), radius))
+                pupil_ratios.append(pupil_center[0] / ew)
+        
+        if len(pupil_ratios) == 0:
+            return GazeResult(face=face, eyes=eye_boxes, direction=previous_direction, is_looking=False)
+        
+        avg_ratio = sum(pupil_ratios) / len(pupil_ratios)
+        direction, is_looking = self._classify(avg_ratio)
+        return GazeResult(
+            face=face,
+            eyes=eye_boxes,
+            pupils=pupils,
+            avg_ratio=avg_ratio,
+            direction=direction,
+            is_looking=is_looking
+        )
+
+    def analyze(self, frame: np.ndarray) -> GazeResult:
+        """
+        Frame'i analiz et; kopya oluşturmaz ve çizim yapmaz.
+        
+        Args:
+            frame: BGR formatında video frame veya gri tonlamalı frame
             
-            eyes = self.eye_cascade.detectMultiScale(roi_gray_face)
+        Returns:
+            GazeResult: Tespit edilen kutular, göz bebekleri ve bakış durumu
+        """
+        gray = self._to_gray(frame)
+        
+        with _profiler.probe("face_detect"):
+            faces = self._detect_faces(gray)
+        
+        if len(faces) == 0:
+            self._face_detected = False
+            self._is_looking_at_screen = False
+            return GazeResult(direction=self._gaze_direction, is_looking=False)
+        
+        self._face_detected = True
+        (x, y, w, h) = face = tuple(int(v) for v in faces[0])
+        with _profiler.probe("eye_detect"):
+            eyes = self.backend.detect_eyes(gray[y:y+h//2, x:x+w])
+        
+        result = self._analyze_face(gray, face, eyes, self._gaze_direction)
+        self._gaze_direction = result.direction
+        self._is_looking_at_screen = result.is_looking
+        return result
+
+    def _detect_eyes_batched(self, gray: np.ndarray, faces: List[Box]) -> list:
+        """
+        Birden fazla yüzün gözlerini tek bir tespit çağrısıyla bul.
+        
+        Yüzlerin üst yarıları yan yana tek bir mozaik görüntüye kopyalanır
+        ve göz tespiti bir kez çalıştırılır. Karo sınırını aşan kutular atılır.
+        
+        Returns:
+            Her yüz için, yüzün üst yarısına göre göz kutuları listesi
+        """
+        rois = [gray[y:y+h//2, x:x+w] for (x, y, w, h) in faces]
+        if len(rois) <= 1:
+            return [self.backend.detect_eyes(roi) for roi in rois]
+        
+        offsets = np.cumsum([0] + [roi.shape[1] for roi in rois])
+        mosaic = np.zeros((max(roi.shape[0] for roi in rois), offsets[-1]), dtype=gray.dtype)
+        for roi, offset in zip(rois, offsets):
+            mosaic[:roi.shape[0], offset:offset + roi.shape[1]] = roi
+        
+        eyes_per_face = [[] for _ in rois]
+        for (ex, ey, ew, eh) in self.backend.detect_eyes(mosaic):
+            i = int(np.searchsorted(offsets, ex, side='right')) - 1
+            if ex + ew <= offsets[i + 1] and ey + eh <= rois[i].shape[0]:
+                eyes_per_face[i].append((int(ex - offsets[i]), int(ey), int(ew), int(eh)))
+        return eyes_per_face
+
+    def analyze_all(self, frame: np.ndarray) -> List[GazeResult]:
+        """
+        Frame'deki tüm yüzleri analiz et (çok yüzlü mod).
+        
+        Her çağrıda tüm frame taranır; göz tespiti tüm yüzler için
+        tek seferde yapılır. Yüzlerin frame'ler arası eşleştirilmesi
+        MultiFaceTracker ile yapılır.
+        
+        Args:
+            frame: BGR formatında video frame veya gri tonlamalı frame
+            
+        Returns:
+            Her yüz için bir GazeResult
+        """
+        gray = self._to_gray(frame)
+        
+        with _profiler.probe("face_detect"):
+            faces = [tuple(int(v) for v in f)
+                     for f in self._detect_in_region(gray, 0, 0, gray.shape[1], gray.shape[0])]
+        self._face_detected = len(faces) > 0
+        
+        with _profiler.probe("eye_detect"):
+            eyes_per_face = self._detect_eyes_batched(gray, faces)
+        return [self._analyze_face(gray, face, eyes, "merkez")
+                for face, eyes in zip(faces, eyes_per_face)]
+
+    def _draw_boxes(self, output_frame: np.ndarray, result: GazeResult):
+        """Yüz, göz ve göz bebeği işaretlerini çiz."""
+        (x, y, w, h) = result.face
+        cv2.rectangle(output_frame, (x, y), (x+w, y+h), self.COLOR_FACE, 2)
+        
+        for (ex, ey, ew, eh) in result.eyes:
+            cv2.rectangle(output_frame, (ex, ey), (ex+ew, ey+eh), self.COLOR_EYE, 1)
+        
+        for center, radius in result.pupils:
+            cv2.circle(output_frame, center, radius, self.COLOR_PUPIL, 2)
+
+    def render(self, frame: np.ndarray, result: GazeResult, copy: bool = True) -> np.ndarray:
+        """
+        Analiz sonucunu frame üzerine çiz.
+        
+        Args:
+            frame: BGR formatında video frame
+            result: analyze() sonucu
+            copy: False ise doğrudan verilen frame üzerine çizilir
             
-            pupil_ratios = [] 
+        Returns:
+            np.ndarray: Üzerine çizim yapılmış frame
+        """
+        output_frame = frame.copy() if copy else frame
+        
+        if result.face is None:
+            message, color = "Yuz tespit edilemedi!", self.COLOR_TEXT
+        else:
+            self._draw_boxes(output_frame, result)
             
-            for (ex, ey, ew, eh) in eyes:
-                cv2.rectangle(roi_color_face, (ex, ey), (ex+ew, ey+eh), self.COLOR_EYE, 1)
-                
-                eye_roi = roi_gray_face[ey:ey+eh, ex:ex+ew]
-                pupil_center, radius = self.detect_pupil(eye_roi)
-                
-                if pupil_center:
-                    cv2.circle(
-                        roi_color_face, 
-                        (ex + pupil_center[0], ey + pupil_center[1]), 
-                        radius, 
-                        self.COLOR_PUPIL, 
-                        2
-                    )
-                    
-                    ratio = pupil_center[0] / ew
-                    pupil_ratios.append(ratio)
-
-            if len(pupil_ratios) > 0:
-                avg_ratio = sum(pupil_ratios) / len(pupil_ratios)
-                
-                limit_low = 0.50 - (self.sensitivity / 2)
-                limit_high = 0.50 + (self.sensitivity / 2)
-                
-                if limit_low <= avg_ratio <= limit_high:
-                    self._gaze_direction = "merkez"
-                    self._is_looking_at_screen = True
-                else:
-                    self._is_looking_at_screen = False
-                    if avg_ratio < limit_low:
-                        self._gaze_direction = "sol" 
-                    else:
-                        self._gaze_direction = "sag"
-                
-                cv2.putText(
-                    output_frame, 
-                    f"Bakis: {self._gaze_direction}", 
-                    (10, 30),
-                    cv2.FONT_HERSHEY_SIMPLEX, 
-                    0.7, 
-                    self.COLOR_TEXT, 
-                    2
-                )
+            if result.avg_ratio is not None:
+                message, color = f"Bakis: {result.direction}", self.COLOR_TEXT
             else:
-                self._is_looking_at_screen = False 
-                cv2.putText(
-                    output_frame, 
-                    "Goz tespit edilemiyor", 
-                    (10, 30),
-                    cv2.FONT_HERSHEY_SIMPLEX, 
-                    0.7, 
-                    self.COLOR_ALERT, 
-                    2
-                )
-        else:
-            self._face_detected = False
-            self._is_looking_at_screen = False
-            cv2.putText(
-                output_frame, 
-                "Yuz tespit edilemedi!", 
-                (10, 30),
-                cv2.FONT_HERSHEY_SIMPLEX, 
-                0.7, 
-                self.COLOR_TEXT, 
-                2
-            )
-        
-        return output_frame, self._is_looking_at_screen, self._gaze_direction
+                message, color = "Goz tespit edilemiyor", self.COLOR_ALERT
+        
+        cv2.putText(
+            output_frame, 
+            message, 
+            (10, 30),
+            cv2.FONT_HERSHEY_SIMPLEX, 
+            0.7, 
+            color, 
+            2
+        )
+        return output_frame
+
+    def render_all(self, frame: np.ndarray, results: List[GazeResult],
+                   labels: List[str] = None, copy: bool = True) -> np.ndarray:
+        """
+        Çok yüzlü analiz sonuçlarını çiz; her yüzün etiketi kutusunun üstüne yazılır.
+        
+        Args:
+            frame: BGR formatında video frame
+            results: analyze_all() sonuçları
+            labels: Her yüz için etiket (None ise bakış yönü yazılır)
+            copy: False ise doğrudan verilen frame üzerine çizilir
+        """
+        output_frame = frame.copy() if copy else frame
+        
+        if len(results) == 0:
+            cv2.putText(output_frame, "Yuz tespit edilemedi!", (10, 30),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.7, self.COLOR_TEXT, 2)
+            return output_frame
+        
+        for i, result in enumerate(results):
+            self._draw_boxes(output_frame, result)
+            label = labels[i] if labels is not None else result.direction
+            color = self.COLOR_TEXT if result.is_looking else self.COLOR_ALERT
+            (x, y, _, _) = result.face
+            cv2.putText(output_frame, label, (x, max(15, y - 8)),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
+        return output_frame
+
+    def process_frame(self, frame: np.ndarray) -> Tuple[np.ndarray, bool, str]:
+        """
+        Video frame'ini işle ve bakış yönünü tespit et.
+        
+        analyze() + render() kısayolu; sadece analiz gerekiyorsa
+        analyze() kullanılmalı.
+        
+        Args:
+            frame: BGR formatında video frame
+            
+        Returns:
+            tuple: (işlenmiş_frame, ekrana_bakıyor_mu, bakış_yönü)
+        """
+        result = self.analyze(frame)
+        output_frame = self.render(frame, result)
+        return output_frame, result.is_looking, result.direction
 
     def release(self):
         """Kaynakları serbest bırak."""
-        pass
+        self.backend.release()
 
     def is_looking_at_screen(self) -> bool:
         return self._is_looking_at_screen
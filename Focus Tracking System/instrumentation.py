@@ -0,0 +1,153 @@
+"""
+Instrumentation Module
+Video döngüsü ve detector aşamaları için düşük maliyetli zaman ölçüm probları.
+Ölçümler aşama başına kayan pencereli histogramlarda tutulur ve
+uygulama içinden okunabilir. Kapalıyken probların maliyeti ihmal edilebilir düzeydedir.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Dict
+
+import numpy as np
+
+from config import INSTRUMENTATION_ENABLED, INSTRUMENTATION_WINDOW
+
+
+class StageHistogram:
+    """Bir aşamanın son `window` ölçümünü tutan kayan pencere."""
+
+    def __init__(self, window: int):
+        self._samples = deque(maxlen=window)
+        self.total_count = 0
+
+    def record(self, seconds: float):
+        self._samples.append(seconds)
+        self.total_count += 1
+
+    def snapshot(self) -> Dict[str, float]:
+        """Penceredeki ölçümlerin özeti (milisaniye)."""
+        samples = list(self._samples)
+        if not samples:
+            return {"count": self.total_count}
+        ms = np.asarray(samples) * 1000.0
+        p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+        return {
+            "count": self.total_count,
+            "window": len(samples),
+            "mean_ms": float(ms.mean()),
+            "p50_ms": float(p50),
+            "p95_ms": float(p95),
+            "p99_ms": float(p99),
+            "max_ms": float(ms.max()),
+        }
+
+
+class _Probe:
+    """Süreyi ölçüp histograma yazan context manager."""
+
+    __slots__ = ("_histogram", "_start")
+
+    def __init__(self, histogram: StageHistogram):
+        self._histogram = histogram
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._histogram.record(time.perf_counter() - self._start)
+        return False
+
+
+class _NullProbe:
+    """Ölçüm kapalıyken kullanılan, hiçbir şey yapmayan prob."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_PROBE = _NullProbe()
+
+
+class Profiler:
+    """
+    Aşama bazında süre ölçen sınıf.
+    Thread-safe.
+
+    Kullanım:
+        with get_profiler().probe("face_detect"):
+            ...
+    """
+
+    def __init__(self, enabled: bool = None, window: int = None):
+        """
+        Profiler'ı başlat.
+
+        Args:
+            enabled: Ölçüm açık mı (None ise config'den alınır)
+            window: Aşama başına tutulacak son ölçüm sayısı
+        """
+        self.enabled = enabled if enabled is not None else INSTRUMENTATION_ENABLED
+        self.window = window if window is not None else INSTRUMENTATION_WINDOW
+        self._histograms: Dict[str, StageHistogram] = {}
+        self._lock = threading.Lock()
+
+    def _histogram(self, name: str) -> StageHistogram:
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(name, StageHistogram(self.window))
+        return histogram
+
+    def probe(self, name: str):
+        """Aşama süresini ölçen context manager döndür."""
+        if not self.enabled:
+            return _NULL_PROBE
+        return _Probe(self._histogram(name))
+
+    def record(self, name: str, seconds: float):
+        """Dışarıda ölçülmüş bir süreyi kaydet."""
+        if self.enabled:
+            self._histogram(name).record(seconds)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Tüm aşamaların özet istatistikleri."""
+        with self._lock:
+            histograms = dict(self._histograms)
+        return {name: histogram.snapshot() for name, histogram in histograms.items()}
+
+    def format_report(self) -> str:
+        """Özetleri okunabilir tablo olarak döndür."""
+        lines = [f"{'aşama':16s} {'adet':>8s} {'ort.':>8s} {'p50':>8s} {'p95':>8s} {'p99':>8s}"]
+        for name, stats in sorted(self.snapshot().items()):
+            if "mean_ms" not in stats:
+                continue
+            lines.append(
+                f"{name:16s} {stats['count']:8d} {stats['mean_ms']:8.2f} {stats['p50_ms']:8.2f} "
+                f"{stats['p95_ms']:8.2f} {stats['p99_ms']:8.2f}"
+            )
+        return "\n".join(lines)
+
+    def set_enabled(self, enabled: bool):
+        """Ölçümü aç/kapat."""
+        self.enabled = enabled
+
+    def reset(self):
+        """Tüm ölçümleri sil."""
+        with self._lock:
+            self._histograms.clear()
+
+
+_profiler = Profiler()
+
+
+def get_profiler() -> Profiler:
+    """Süreç genelindeki Profiler örneği."""
+    return _profiler
@@ -6,18 +6,21 @@ Cross-platform destek: Windows, macOS, Linux
 
 import tkinter as tk
 from tkinter import ttk, font
-import cv2
-from PIL import Image, ImageTk
+import queue
 import threading
-import time
 from datetime import timedelta
 
-from gaze_detector import GazeDetector
+from detector_backends import warm_up
+from process_detector import ProcessPoolDetector
+from async_runtime import AsyncRuntime
+from timeline import TimelineWriter, session_path
+from frame_source import CameraSource
+from preview import PreviewRenderer, FrameMailbox
+from session_engine import FocusSession, EVENT_DISTRACTED, EVENT_REFOCUSED, EVENT_COMPLETED
+from instrumentation import get_profiler
 from alert_manager import AlertManager
 from config import (
     TIME_OPTIONS, 
-    DISTRACTION_THRESHOLD, 
-    FRAME_SKIP, 
     TARGET_FPS,
     WEBCAM_WIDTH,
     WEBCAM_HEIGHT,
@@ -25,13 +28,19 @@ from config import (
     MIN_WINDOW_SIZE,
     WINDOW_TITLE,
     ALERT_COOLDOWN,
-    GAZE_SENSITIVITY
+    GAZE_SENSITIVITY,
+    PREVIEW_REFRESH_MS,
+    DETECTOR_PROCESSES,
+    TIMELINE_ENABLED,
+    TIMELINE_DIR
 )
 
 
 class FocusTrackerApp:
     """
     Odaklanma Asistanı ana uygulama sınıfı.
+    Oturum mantığı FocusSession'dadır; bu sınıf kamerayı, önizlemeyi
+    ve uyarıları yöneten arayüz katmanıdır.
     Thread-safe ve cross-platform.
     """
     
@@ -45,25 +54,32 @@ class FocusTrackerApp:
         
         self.root.minsize(MIN_WINDOW_SIZE[0], MIN_WINDOW_SIZE[1])
         
-        self.gaze_detector = None
+        self.session = None
+        if DETECTOR_PROCESSES > 0:
+            self.detector_pool = ProcessPoolDetector(DETECTOR_PROCESSES)
+        else:
+            self.detector_pool = None
+            warm_up()
         self.alert_manager = AlertManager(cooldown_seconds=ALERT_COOLDOWN)
-        self.cap = None
+        self.runtime = AsyncRuntime().start()
+        self.session_handle = None
+        self.timeline = None
+        self.source = None
         
         self.is_running = False
         self.remaining_seconds = 0
         self.selected_duration = tk.StringVar(value="10 Dakika")
         
-        self.video_thread = None
-        self.timer_thread = None
-        self.stop_event = threading.Event()
         self._state_lock = threading.Lock()
         
         self.warning_visible = False
-        self.consecutive_distraction_frames = 0
-        self.distraction_threshold = DISTRACTION_THRESHOLD
         
-        self.frame_counter = 0
-        self.frame_skip = FRAME_SKIP
+        self.preview = PreviewRenderer()
+        self.preview_mailbox = FrameMailbox()
+        self._preview_job = None
+        # Runtime thread'lerinden gelen arayüz çağrıları; pump_preview ana thread'de çalıştırır
+        self.ui_calls = queue.SimpleQueue()
+        self.profiler = get_profiler()
         
         self.title_font = font.Font(family="Segoe UI", size=28, weight="bold")
         self.subtitle_font = font.Font(family="Segoe UI", size=14)
@@ -266,6 +282,8 @@ class FocusTrackerApp:
         
         self.video_label = tk.Label(video_container, bg="#000000")
         self.video_label.pack(expand=True, fill="both")
+        self.preview.reset()
+        self.preview.bind(self.video_label)
         
         self.warning_frame = tk.Frame(main_frame, bg="#E57373")
         
@@ -286,135 +304,128 @@ class FocusTrackerApp:
         duration_minutes = TIME_OPTIONS[duration_label]
         self.remaining_seconds = duration_minutes * 60
         
-        self.gaze_detector = GazeDetector(sensitivity=GAZE_SENSITIVITY)
-        
-        self.cap = cv2.VideoCapture(0)
-        if not self.cap.isOpened():
+        try:
+            self.source = CameraSource(0, WEBCAM_WIDTH, WEBCAM_HEIGHT)
+        except IOError:
             self.show_error("Webcam açılamadı! Lütfen webcam bağlantınızı kontrol edin.")
             return
         
-        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, WEBCAM_WIDTH)
-        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, WEBCAM_HEIGHT)
+        detector = self.detector_pool.detector(GAZE_SENSITIVITY) if self.detector_pool is not None else None
+        if TIMELINE_ENABLED:
+            try:
+                self.timeline = TimelineWriter(session_path(TIMELINE_DIR))
+            except OSError as e:
+                print(f"Zaman çizelgesi açılamadı: {e}")
+        self.session = FocusSession(self.source, self.remaining_seconds, detector=detector,
+                                    sensitivity=GAZE_SENSITIVITY, recorder=self.timeline)
+        self.session.add_listener(self.on_session_event)
         
         with self._state_lock:
             self.is_running = True
-            self.stop_event.clear()
-            self.consecutive_distraction_frames = 0
             self.warning_visible = False
-            self.frame_counter = 0
         
         self.create_focus_screen()
+        self.ui_calls = queue.SimpleQueue()
+        self.preview_mailbox.clear()
+        self.start_preview_pump()
         
-        threading.Thread(target=self.alert_manager.play_start_sound, daemon=True).start()
-        
-        self.video_thread = threading.Thread(target=self.video_loop, daemon=True)
-        self.video_thread.start()
+        self.runtime.play(self.alert_manager.play_start_sound)
         
-        self.timer_thread = threading.Thread(target=self.timer_loop, daemon=True)
-        self.timer_thread.start()
+        self.source.start()
+        self.session_handle = self.runtime.start_session(
+            self.session, on_frame=self.on_frame, on_tick=self.on_tick, fps=TARGET_FPS
+        )
     
-    def video_loop(self):
-        """Video işleme döngüsü (ayrı thread'de çalışır)."""
-        last_processed_frame = None
-        last_is_looking = True
-        last_direction = "merkez"
-        
-        while self.is_running and not self.stop_event.is_set():
-            if self.cap is None or not self.cap.isOpened():
-                break
-            
-            ret, frame = self.cap.read()
-            if not ret:
-                continue
-            
-            frame = cv2.flip(frame, 1)
-            
-            with self._state_lock:
-                self.frame_counter += 1
-                should_process = (self.frame_counter % self.frame_skip == 0)
-            
-            if should_process:
-                processed_frame, is_looking, direction = self.gaze_detector.process_frame(frame)
-                last_processed_frame = processed_frame
-                last_is_looking = is_looking
-                last_direction = direction
-                
-                with self._state_lock:
-                    if not is_looking:
-                        self.consecutive_distraction_frames += 1
-                        
-                        if self.consecutive_distraction_frames >= self.distraction_threshold:
-                            if not self.warning_visible:
-                                    print(f"[UYARI] Eşik aşıldı! Uyarı tetikleniyor...")
-                                    self.root.after(0, self.show_warning)
-                                    threading.Thread(target=self.alert_manager.trigger_alert, daemon=True).start()
-                    else:
-                        if self.consecutive_distraction_frames > 0:
-                            print(f"[DEBUG] Odaklanma geri döndü.")
-                        self.consecutive_distraction_frames = 0
-                        if self.warning_visible:
-                            self.root.after(0, self.hide_warning)
-            else:
-                if last_processed_frame is not None:
-                    processed_frame = last_processed_frame
-                else:
-                    processed_frame = frame
-            
+    def on_frame(self, session, frame, captured):
+        """İşlenen frame'i önizlemeye hazırla (runtime'ın analiz executor'ünde çalışır)."""
+        self.profiler.record("frame_age", captured.age)
+        try:
+            if self.preview.target_size is not None:
+                with self.profiler.probe("draw"):
+                    if session.last_results is not None:
+                        frame = session.detector.render_all(frame, session.last_results,
+                                                            session.last_labels, copy=False)
+                    elif session.last_result is not None:
+                        frame = session.detector.render(frame, session.last_result, copy=False)
+                with self.profiler.probe("preview"):
+                    rgb = self.preview.render(frame, key=captured.index)
+                if rgb is not None:
+                    self.preview_mailbox.put(rgb)
+        except Exception as e:
+            pass
+    
+    def call_in_ui(self, fn, *args):
+        """
+        Fonksiyonu ana thread'de çalıştırılmak üzere sıraya koy (herhangi bir thread'den).
+        root.after yerine kullanılır: runtime thread'leri Tk'yı hiç çağırmaz, böylece
+        ana thread runtime'ı beklerken kilitlenme olmaz.
+        """
+        self.ui_calls.put((fn, args))
+    
+    def on_session_event(self, event):
+        """Oturum olaylarını arayüze yansıt (olayı üreten thread'de çağrılır)."""
+        if event.kind == EVENT_DISTRACTED:
+            print(f"[UYARI] Eşik aşıldı! Uyarı tetikleniyor...")
+            self.call_in_ui(self.show_warning)
+            self.runtime.play(self.alert_manager.trigger_alert, True)
+        elif event.kind == EVENT_REFOCUSED:
+            print(f"[DEBUG] Odaklanma geri döndü.")
+            self.call_in_ui(self.hide_warning)
+        elif event.kind == EVENT_COMPLETED:
+            self.call_in_ui(self.session_complete)
+    
+    def start_preview_pump(self):
+        """Önizleme posta kutusunu ana thread'de düzenli olarak boşaltmaya başla."""
+        self.stop_preview_pump()
+        self._preview_job = self.root.after(PREVIEW_REFRESH_MS, self.pump_preview)
+    
+    def stop_preview_pump(self):
+        """Bekleyen önizleme güncellemesini iptal et."""
+        if self._preview_job is not None:
             try:
-                frame_rgb = cv2.cvtColor(processed_frame, cv2.COLOR_BGR2RGB)
-                img = Image.fromarray(frame_rgb)
-                
-                if hasattr(self, 'video_label') and self.video_label.winfo_exists():
-                    label_width = self.video_label.winfo_width()
-                    label_height = self.video_label.winfo_height()
-                    
-                    if label_width > 1 and label_height > 1:
-                        img_ratio = img.width / img.height
-                        label_ratio = label_width / label_height
-                        
-                        if img_ratio > label_ratio:
-                            new_width = label_width
-                            new_height = int(label_width / img_ratio)
-                        else:
-                            new_height = label_height
-                            new_width = int(label_height * img_ratio)
-                        
-                        img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                    
-                    imgtk = ImageTk.PhotoImage(image=img)
-                    
-                    self.root.after(0, lambda: self.update_video_label(imgtk))
-            except Exception as e:
+                self.root.after_cancel(self._preview_job)
+            except tk.TclError:
                 pass
-            
-            time.sleep(1.0 / TARGET_FPS)
+            self._preview_job = None
+    
+    def pump_preview(self):
+        """Sıradaki arayüz çağrılarını çalıştır ve en yeni frame'i göster (ana thread'de)."""
+        self._preview_job = None
+        while self.is_running:
+            try:
+                fn, args = self.ui_calls.get_nowait()
+            except queue.Empty:
+                break
+            fn(*args)
+        if not self.is_running:
+            return
+        
+        rgb = self.preview_mailbox.take()
+        if rgb is not None:
+            self.update_video_label(rgb)
+        
+        self._preview_job = self.root.after(PREVIEW_REFRESH_MS, self.pump_preview)
     
-    def update_video_label(self, imgtk):
+    def update_video_label(self, rgb):
         """Video label'ı güncelle (ana thread'de)."""
         try:
             if hasattr(self, 'video_label') and self.video_label.winfo_exists():
-                self.video_label.imgtk = imgtk
-                self.video_label.configure(image=imgtk)
+                with self.profiler.probe("photoimage"):
+                    self.preview.show(self.video_label, rgb)
         except tk.TclError:
             pass
     
-    def timer_loop(self):
-        """Zamanlayıcı döngüsü (ayrı thread'de çalışır)."""
-        while self.is_running and self.remaining_seconds > 0 and not self.stop_event.is_set():
-            time_str = str(timedelta(seconds=self.remaining_seconds))
-            
-            if len(time_str.split(':')) == 2:
-                time_str = "0:" + time_str
-            
-            self.root.after(0, lambda t=time_str: self.update_timer_label(t))
-            
-            time.sleep(1)
-            with self._state_lock:
-                self.remaining_seconds -= 1
-        
+    def on_tick(self, remaining):
+        """Kalan süreyi göster (runtime'ın süre sayacı coroutine'inden her saniye çağrılır)."""
         with self._state_lock:
-            if self.remaining_seconds <= 0 and self.is_running:
-                self.root.after(0, self.session_complete)
+            self.remaining_seconds = remaining
+        
+        time_str = str(timedelta(seconds=remaining))
+        
+        if len(time_str.split(':')) == 2:
+            time_str = "0:" + time_str
+        
+        self.call_in_ui(self.update_timer_label, time_str)
     
     def update_timer_label(self, time_str):
         """Timer label'ı güncelle (ana thread'de)."""
@@ -425,8 +436,8 @@ class FocusTrackerApp:
             pass
     
     def show_warning(self):
-    """Uyarı mesajını göster (ana thread'de çağrılmalı)."""
-    self.warning_visible = True
+        """Uyarı mesajını göster (ana thread'de çağrılmalı)."""
+        self.warning_visible = True
         try:
             if hasattr(self, 'warning_frame') and self.warning_frame.winfo_exists():
                 self.warning_frame.place(relx=0.5, rely=0.5, anchor="center")
@@ -436,9 +447,9 @@ class FocusTrackerApp:
             pass
 
     def hide_warning(self):
-    """Uyarı mesajını gizle (ana thread'de çağrılmalı)."""
+        """Uyarı mesajını gizle (ana thread'de çağrılmalı)."""
         self.warning_visible = False
-        threading.Thread(target=self.alert_manager.stop_alert, daemon=True).start()
+        self.runtime.play(self.alert_manager.stop_alert)
         try:
             if hasattr(self, 'warning_frame') and self.warning_frame.winfo_exists():
                 self.warning_frame.place_forget()
@@ -447,21 +458,89 @@ class FocusTrackerApp:
         except tk.TclError:
             pass
         
+    def release_camera(self):
+        """Önizlemeyi durdur; oturum yoksa kamerayı da serbest bırak."""
+        self.stop_preview_pump()
+        if self.preview_mailbox.put_count:
+            print(f"[DEBUG] Önizleme: {self.preview_mailbox.put_count} frame, "
+                  f"{self.preview_mailbox.dropped_count} eski frame atlandı")
+            self.preview_mailbox.clear()
+        
+        if self.source is not None:
+            self._release_source(self.source)
+            self.source = None
+    
+    @staticmethod
+    def _release_source(source):
+        source.release()
+        stats = source.stats()
+        print(f"[DEBUG] Yakalanan: {stats['captured']}, atlanan: {stats['dropped']} frame")
+        
+    def close_session(self):
+        """
+        Oturumu beklemeden durdur.
+        Detector, zaman çizelgesi ve kamera, runtime'da süren son okuma/analiz
+        adımı bittikten sonra okuma executor'ünde bırakılır.
+        
+        Returns:
+            Future: Bırakma bitince tamamlanır (oturum yoksa None)
+        """
+        handle, self.session_handle = self.session_handle, None
+        session, self.session = self.session, None
+        timeline, self.timeline = self.timeline, None
+        source, self.source = self.source, None
+        if session is None:
+            self.source = source
+            return None
+        
+        def release(_handle=None):
+            session.close()
+            if self.detector_pool is not None:
+                session.detector.release()
+            if timeline is not None:
+                try:
+                    timeline.close()
+                    print(f"[DEBUG] Zaman çizelgesi: {timeline.record_count} kayıt -> {timeline.path}")
+                except OSError as e:
+                    print(f"Zaman çizelgesi yazılamadı ({timeline.path}): {e}")
+            if source is not None:
+                self._release_source(source)
+        
+        if handle is None or not self.runtime.is_running:
+            session.stop()
+            release()
+            return None
+        future = self.runtime.stop_session_async(handle, on_stopped=release)
+        future.add_done_callback(self._on_session_closed)
+        return future
+    
+    @staticmethod
+    def _on_session_closed(future):
+        error = future.exception()
+        if isinstance(error, TimeoutError):
+            print(f"[UYARI] {error}; kaynaklar analiz bitince bırakılacak.")
+        elif error is not None:
+            print(f"Oturum kapatma hatası: {error!r}")
+        
     def stop_focus_session(self):
         """Odaklanma oturumunu durdur."""
         with self._state_lock:
             self.is_running = False
-            self.stop_event.set()
         
-        if self.cap is not None:
-            self.cap.release()
-            self.cap = None
+        pacer = self.session_handle.pacer if self.session_handle is not None else None
+        self.close_session()
+        self.release_camera()
         
-        if self.gaze_detector is not None:
-            self.gaze_detector.release()
-            self.gaze_detector = None
+        self.runtime.play(self.alert_manager.play_end_sound)
         
-        threading.Thread(target=self.alert_manager.play_end_sound, daemon=True).start()
+        if pacer is not None:
+            stats = pacer.stats()
+            if "achieved_fps" in stats:
+                print(f"[DEBUG] Hedef {stats['target_fps']:.0f} FPS, ulaşılan {stats['achieved_fps']:.1f} FPS, "
+                      f"titreme {stats['jitter_ms']:.1f} ms, kaçırılan {stats['missed_deadlines']}")
+        
+        if self.profiler.enabled:
+            print(self.profiler.format_report())
         
         self.root.after(500, self.create_start_screen)
     
@@ -469,20 +548,11 @@ class FocusTrackerApp:
         """Oturum tamamlandığında çalışır."""
         with self._state_lock:
             self.is_running = False
-            self.stop_event.set()
-        
-        if self.cap is not None:
-            self.cap.release()
-            self.cap = None
         
-        if self.gaze_detector is not None:
-            self.gaze_detector.release()
-            self.gaze_detector = None
+        self.close_session()
+        self.release_camera()
         
-        threading.Thread(
-            target=self.alert_manager.play_complete_sound, 
-            daemon=True
-        ).start()
+        self.runtime.play(self.alert_manager.play_complete_sound)
         
         self.show_completion_screen()
     
@@ -561,13 +631,21 @@ class FocusTrackerApp:
         """Pencere kapatılırken çalışır."""
         with self._state_lock:
             self.is_running = False
-            self.stop_event.set()
         
-        if self.cap is not None:
-            self.cap.release()
-        
-        if self.gaze_detector is not None:
-            self.gaze_detector.release()
+        closing = self.close_session()
+        self.release_camera()
+        if closing is not None:
+            # Runtime Tk'yı çağırmadığı için burada beklemek güvenlidir
+            try:
+                closing.result(10)
+            except TimeoutError:
+                print("[UYARI] Oturum kapatılamadı; kaynaklar runtime kapanırken bırakılacak.")
+            except Exception:
+                # Hata _on_session_closed tarafından raporlandı
+                pass
+        self.runtime.shutdown()
+        if self.detector_pool is not None:
+            self.detector_pool.close()
         
         self.root.destroy()
     
@@ -0,0 +1,101 @@
+"""
+Model Registry Module
+Süreç genelinde paylaşılan model (cascade / DNN) önbelleği.
+Her model diskten bir kez yüklenir ve kullanıcılar arasında tekrar kullanılır.
+"""
+
+import threading
+from collections import defaultdict
+from typing import Callable, Dict, Hashable, List, Optional
+
+
+class ModelRegistry:
+    """
+    Yüklenmiş modelleri anahtar bazında havuzda tutan sınıf.
+    Thread-safe.
+
+    OpenCV sınıflandırıcıları aynı anda birden fazla thread'den kullanılmaya
+    uygun değildir. Bu yüzden her model bir seferde tek bir kullanıcıya
+    (detector) kiralanır: acquire() boştaki örneği verir, yoksa yenisini
+    yükler; release() örneği havuza geri koyar.
+    """
+
+    def __init__(self):
+        """ModelRegistry'yi başlat."""
+        self._lock = threading.Lock()
+        self._idle: Dict[Hashable, List[object]] = defaultdict(list)
+        self._load_counts: Dict[Hashable, int] = defaultdict(int)
+
+    def acquire(self, key: Hashable, loader: Callable[[], object]) -> object:
+        """
+        Modeli kirala.
+
+        Args:
+            key: Model anahtarı (ör. ("cascade", dosya_yolu))
+            loader: Havuz boşsa modeli yükleyecek fonksiyon
+
+        Returns:
+            Sadece çağırana ait model örneği
+        """
+        with self._lock:
+            if self._idle[key]:
+                return self._idle[key].pop()
+
+        model = loader()
+        with self._lock:
+            self._load_counts[key] += 1
+        return model
+
+    def release(self, key: Hashable, model: object):
+        """Kiralanan modeli havuza geri ver."""
+        with self._lock:
+            self._idle[key].append(model)
+
+    def load_count(self, key: Hashable) -> int:
+        """Bu anahtar için diskten kaç kez model yüklendiği."""
+        with self._lock:
+            return self._load_counts[key]
+
+    def idle_count(self, key: Hashable) -> int:
+        """Havuzda bekleyen model sayısı."""
+        with self._lock:
+            return len(self._idle[key])
+
+    def warm_up(self, task: Callable[[], None], background: bool = True) -> Optional[threading.Thread]:
+        """
+        Modelleri önceden yükle.
+
+        Args:
+            task: Modelleri kiralayıp geri veren fonksiyon
+            background: True ise ayrı thread'de çalıştır
+
+        Returns:
+            Arka plan thread'i veya None
+        """
+        def run():
+            try:
+                task()
+            except Exception as e:
+                print(f"Model ön yükleme hatası: {e}")
+
+        if not background:
+            run()
+            return None
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        return thread
+
+    def clear(self):
+        """Havuzdaki tüm modelleri bırak."""
+        with self._lock:
+            self._idle.clear()
+            self._load_counts.clear()
+
+
+_registry = ModelRegistry()
+
+
+def get_registry() -> ModelRegistry:
+    """Süreç genelindeki ModelRegistry örneği."""
+    return _registry
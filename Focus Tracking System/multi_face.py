@@ -0,0 +1,159 @@
+"""
+Multi Face Module
+Ortak kamera kullanımında her kişi için ayrı odak durumu tutan takipçi.
+Yüzler frame'ler arasında kutu örtüşmesine (IoU) göre eşleştirilir.
+"""
+
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from distraction import DistractionTracker
+from config import (
+    MULTI_FACE_IOU_THRESHOLD,
+    MULTI_FACE_MAX_MISSED
+)
+
+
+def box_iou(boxes_a: np.ndarray, boxes_b: np.ndarray) -> np.ndarray:
+    """
+    İki kutu kümesi arasındaki IoU matrisini hesapla.
+
+    Args:
+        boxes_a: (N, 4) kutular, (x, y, w, h)
+        boxes_b: (M, 4) kutular, (x, y, w, h)
+
+    Returns:
+        (N, M) IoU matrisi
+    """
+    a = np.asarray(boxes_a, dtype=np.float64).reshape(-1, 1, 4)
+    b = np.asarray(boxes_b, dtype=np.float64).reshape(1, -1, 4)
+
+    inter_w = np.clip(np.minimum(a[..., 0] + a[..., 2], b[..., 0] + b[..., 2])
+                      - np.maximum(a[..., 0], b[..., 0]), 0, None)
+    inter_h = np.clip(np.minimum(a[..., 1] + a[..., 3], b[..., 1] + b[..., 3])
+                      - np.maximum(a[..., 1], b[..., 1]), 0, None)
+    inter = inter_w * inter_h
+    union = a[..., 2] * a[..., 3] + b[..., 2] * b[..., 3] - inter
+    return np.where(union > 0, inter / np.maximum(union, 1e-9), 0.0)
+
+
+class PersonState:
+    """Takip edilen bir kişinin bakış durumu ve dikkat takibi."""
+
+    def __init__(self, person_id: int, box, distraction_seconds: float = None,
+                 refocus_seconds: float = None):
+        self.person_id = person_id
+        self.box = tuple(box)
+        self.direction = "merkez"
+        self.is_looking = True
+        self.missed_frames = 0
+        self.last_result = None
+        self.distraction = DistractionTracker(distraction_seconds, refocus_seconds)
+
+    @property
+    def is_distracted(self) -> bool:
+        return self.distraction.is_distracted
+
+    def mark_missed(self, timestamp: float):
+        """Kişi bu frame'de görünmedi; ekrana bakmıyor sayılır."""
+        self.missed_frames += 1
+        self.is_looking = False
+        self.distraction.update(False, timestamp)
+
+    def update(self, result, timestamp: float):
+        """Eşleşen analiz sonucuyla durumu güncelle."""
+        self.box = result.face
+        self.missed_frames = 0
+        self.last_result = result
+        self.is_looking = result.is_looking
+        if result.avg_ratio is not None:
+            self.direction = result.direction
+        self.distraction.update(result.is_looking, timestamp)
+
+
+class MultiFaceTracker:
+    """
+    GazeDetector.analyze_all() sonuçlarını kişilere bağlayan sınıf.
+
+    Her update() çağrısında sonuçlar mevcut kişilerle en yüksek IoU'dan
+    başlayarak eşleştirilir. Eşleşmeyen yüzler yeni kişi olur. Görünmeyen
+    kişiler ekrana bakmıyor sayılır ve `max_missed` frame sonra silinir.
+    """
+
+    def __init__(self, iou_threshold: float = None, max_missed: int = None,
+                 distraction_seconds: float = None, refocus_seconds: float = None):
+        """
+        MultiFaceTracker'ı başlat.
+
+        Args:
+            iou_threshold: Eşleşme için minimum kutu örtüşmesi
+            max_missed: Kişinin silinmeden önce görünmeyebileceği frame sayısı
+            distraction_seconds: Kişinin dikkati dağılmış sayılacağı kesintisiz uzaklaşma süresi
+            refocus_seconds: Odağa dönüş için kesintisiz bakış süresi
+        """
+        self.iou_threshold = iou_threshold if iou_threshold is not None else MULTI_FACE_IOU_THRESHOLD
+        self.max_missed = max_missed if max_missed is not None else MULTI_FACE_MAX_MISSED
+        self.distraction_seconds = distraction_seconds
+        self.refocus_seconds = refocus_seconds
+        self._people: Dict[int, PersonState] = {}
+        self._next_id = 1
+
+    @property
+    def people(self) -> List[PersonState]:
+        """Takip edilen kişiler (id sırasıyla)."""
+        return [self._people[pid] for pid in sorted(self._people)]
+
+    def update(self, results, timestamp: float = None) -> List[PersonState]:
+        """
+        Yeni frame'in sonuçlarıyla kişileri güncelle.
+
+        Args:
+            results: GazeDetector.analyze_all() sonuçları
+            timestamp: Frame zamanı (None ise monotonik saat)
+
+        Returns:
+            Bu frame'de görünen kişiler (sonuçlarla aynı sırada)
+        """
+        timestamp = timestamp if timestamp is not None else time.monotonic()
+        people = list(self._people.values())
+        matched: List[Optional[PersonState]] = [None] * len(results)
+
+        if people and results:
+            iou = box_iou([r.face for r in results], [p.box for p in people])
+            for flat in np.argsort(iou, axis=None)[::-1]:
+                ri, pi = np.unravel_index(flat, iou.shape)
+                if iou[ri, pi] < self.iou_threshold:
+                    break
+                if matched[ri] is None and people[pi] not in matched:
+                    matched[ri] = people[pi]
+
+        for i, result in enumerate(results):
+            if matched[i] is None:
+                matched[i] = PersonState(self._next_id, result.face,
+                                         self.distraction_seconds, self.refocus_seconds)
+                self._people[self._next_id] = matched[i]
+                self._next_id += 1
+            matched[i].update(result, timestamp)
+
+        for person in people:
+            if person not in matched:
+                person.mark_missed(timestamp)
+                if person.missed_frames > self.max_missed:
+                    del self._people[person.person_id]
+
+        return matched
+
+    def is_distracted(self, person: PersonState) -> bool:
+        """Kişinin dikkat dağınıklığı süresi aşıldı mı?"""
+        return person.is_distracted
+
+    def distracted_people(self) -> List[PersonState]:
+        """Dikkati dağılmış kişiler."""
+        return [p for p in self.people if self.is_distracted(p)]
+
+    def reset(self):
+        """Tüm kişileri unut."""
+        self._people.clear()
+        self._next_id = 1
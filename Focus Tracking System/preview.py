@@ -0,0 +1,175 @@
+"""
+Preview Module
+Kamera önizlemesini Tkinter label'ına çizen hafif render yolu.
+Hedef boyut <Configure> olaylarında önbelleğe alınır, frame tek adımda
+küçültülüp RGB'ye çevrilir ve aynı PhotoImage üzerine yapıştırılır.
+İşçi thread ile ana thread arasında tek yuvalı bir posta kutusu kullanılır.
+"""
+
+import threading
+from typing import Any, Hashable, Optional, Tuple
+
+import cv2
+import numpy as np
+from PIL import Image
+
+
+def fit_size(frame_width: int, frame_height: int,
+             target_width: int, target_height: int) -> Tuple[int, int]:
+    """
+    En-boy oranını koruyarak hedef alana sığan boyutu hesapla.
+
+    Returns:
+        tuple: (genişlik, yükseklik), en az 1x1
+    """
+    frame_ratio = frame_width / frame_height
+    if frame_ratio > target_width / target_height:
+        width, height = target_width, int(target_width / frame_ratio)
+    else:
+        width, height = int(target_height * frame_ratio), target_height
+    return max(1, width), max(1, height)
+
+
+class FrameMailbox:
+    """
+    Tek yuvalı, thread-safe posta kutusu.
+
+    İşçi thread put() ile en yeni öğeyi bırakır; ana thread take() ile alır.
+    Alınmadan üzerine yazılan öğeler kuyrukta birikmez, atlanmış olarak sayılır.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._item = None
+        self._has_item = False
+        self.put_count = 0
+        self.dropped_count = 0
+
+    def put(self, item: Any):
+        """Öğeyi bırak; alınmamış önceki öğe atılır."""
+        with self._lock:
+            if self._has_item:
+                self.dropped_count += 1
+            self._item = item
+            self._has_item = True
+            self.put_count += 1
+
+    def take(self) -> Optional[Any]:
+        """Bekleyen öğeyi al ve yuvayı boşalt (boşsa None)."""
+        with self._lock:
+            item, self._item = self._item, None
+            self._has_item = False
+            return item
+
+    def clear(self):
+        """Yuvayı boşalt ve sayaçları sıfırla."""
+        with self._lock:
+            self._item = None
+            self._has_item = False
+            self.put_count = 0
+            self.dropped_count = 0
+
+
+class PreviewRenderer:
+    """
+    Önizleme frame'lerini label boyutuna getiren sınıf.
+
+    render() işçi thread'de çağrılır ve RGB diziyi döndürür;
+    show() ana thread'de çağrılır ve diziyi label'daki PhotoImage'a yapıştırır.
+    Çıktı dizileri sırayla yeniden kullanılan `buffer_count` tampondan gelir.
+    """
+
+    def __init__(self, buffer_count: int = 3):
+        """
+        PreviewRenderer'ı başlat.
+
+        Args:
+            buffer_count: Dönüşümlü kullanılacak çıktı tamponu sayısı
+        """
+        self._lock = threading.Lock()
+        self._target_size: Optional[Tuple[int, int]] = None
+        self._buffers = [None] * max(2, buffer_count)
+        self._resized = None
+        self._next_buffer = 0
+        self._last_key = None
+        self._last_size = None
+        self._photo = None
+        self.rendered_count = 0
+        self.skipped_count = 0
+
+    def bind(self, widget):
+        """Widget'ın <Configure> olaylarında hedef boyutu güncelle."""
+        widget.bind("<Configure>", lambda event: self.set_target_size(event.width, event.height), add="+")
+
+    def set_target_size(self, width: int, height: int):
+        """Hedef alan boyutunu ayarla (1x1 ve altı henüz yerleşmemiş widget demektir)."""
+        with self._lock:
+            self._target_size = (width, height) if width > 1 and height > 1 else None
+
+    @property
+    def target_size(self) -> Optional[Tuple[int, int]]:
+        with self._lock:
+            return self._target_size
+
+    def render(self, frame: np.ndarray, key: Hashable = None) -> Optional[np.ndarray]:
+        """
+        BGR frame'i hedef boyutta RGB diziye çevir.
+
+        Args:
+            frame: BGR frame
+            key: Frame kimliği (ör. yakalama sırası); önceki çağrıyla aynıysa iş yapılmaz
+
+        Returns:
+            np.ndarray: RGB dizi veya hedef boyut bilinmiyor / frame değişmemişse None
+        """
+        target = self.target_size
+        if target is None:
+            return None
+
+        size = fit_size(frame.shape[1], frame.shape[0], *target)
+        if key is not None and key == self._last_key and size == self._last_size:
+            self.skipped_count += 1
+            return None
+
+        shape = (size[1], size[0], 3)
+        out = self._buffers[self._next_buffer]
+        if out is None or out.shape != shape:
+            out = self._buffers[self._next_buffer] = np.empty(shape, dtype=np.uint8)
+        self._next_buffer = (self._next_buffer + 1) % len(self._buffers)
+
+        if size == (frame.shape[1], frame.shape[0]):
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=out)
+        else:
+            if self._resized is None or self._resized.shape != shape:
+                self._resized = np.empty(shape, dtype=np.uint8)
+            cv2.resize(frame, size, dst=self._resized, interpolation=cv2.INTER_LINEAR)
+            cv2.cvtColor(self._resized, cv2.COLOR_BGR2RGB, dst=out)
+
+        self._last_key = key
+        self._last_size = size
+        self.rendered_count += 1
+        return out
+
+    def show(self, label, rgb: np.ndarray):
+        """
+        RGB diziyi label'da göster (ana thread'de çağrılmalı).
+        Boyut değişmediyse mevcut PhotoImage'a yapıştırılır, yenisi oluşturulmaz.
+        """
+        from PIL import ImageTk
+
+        img = Image.fromarray(rgb)
+        if self._photo is not None and (self._photo.width(), self._photo.height()) == img.size:
+            self._photo.paste(img)
+            return
+
+        self._photo = ImageTk.PhotoImage(image=img)
+        label.imgtk = self._photo
+        label.configure(image=self._photo)
+
+    def reset(self):
+        """Widget'a bağlı durumu temizle (ekran yeniden oluşturulurken)."""
+        with self._lock:
+            self._target_size = None
+        self._photo = None
+        self._last_key = None
+        self._last_size = None
@@ -0,0 +1,378 @@
+"""
+Process Detector Module
+Bakış analizini ayrı işçi süreçlerde çalıştıran detector havuzu.
+Frame'ler pickle edilmeden paylaşılan bellekteki (multiprocessing.shared_memory)
+halka yuvalarına kopyalanır; işçilere sadece yuva numarası gider, geri sadece
+küçük sonuç kayıtları döner. Tespit, yakalama ve arayüz ile aynı yorumlayıcıda
+yarışmaz ve birden çok çekirdeğe yayılır.
+"""
+
+import itertools
+import multiprocessing
+import os
+import threading
+from collections import deque
+from concurrent.futures import Future
+from multiprocessing import shared_memory
+from multiprocessing.connection import wait
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from detector_backends import DetectorBackend
+from gaze_detector import GazeDetector, GazeResult
+from config import WEBCAM_WIDTH, WEBCAM_HEIGHT, DETECTOR_TIMEOUT
+
+_ANALYZE = "analyze"
+_ANALYZE_ALL = "analyze_all"
+_RELEASE = "release"
+
+
+def pack_result(result: GazeResult) -> tuple:
+    """GazeResult'ı süreçler arası gönderilecek küçük bir kayda çevir."""
+    return (
+        tuple(int(v) for v in result.face) if result.face is not None else None,
+        [tuple(int(v) for v in eye) for eye in result.eyes],
+        [((int(c[0]), int(c[1])), int(r)) for c, r in result.pupils],
+        float(result.avg_ratio) if result.avg_ratio is not None else None,
+        result.direction,
+        bool(result.is_looking),
+    )
+
+
+def unpack_result(record: tuple) -> GazeResult:
+    """pack_result() kaydından GazeResult oluştur."""
+    face, eyes, pupils, avg_ratio, direction, is_looking = record
+    return GazeResult(face=face, eyes=list(eyes), pupils=list(pupils),
+                      avg_ratio=avg_ratio, direction=direction, is_looking=is_looking)
+
+
+def _worker_main(tasks, results, detector_kwargs: dict):
+    """
+    İşçi süreç döngüsü.
+    Her akış için ayrı GazeDetector tutulur; böylece yüz takibi ve önceki
+    bakış yönü akış başına korunur. Sonuçlar işçiye ait tek yönlü pipe'a
+    (results) yazılır.
+    """
+    detectors: Dict[int, GazeDetector] = {}
+    shm = None
+    try:
+        while True:
+            task = tasks.get()
+            if task is None:
+                break
+            request_id, stream, command, shm_name, offset, shape, sensitivity, reset = task
+
+            if command == _RELEASE:
+                detector = detectors.pop(stream, None)
+                if detector is not None:
+                    detector.release()
+                continue
+
+            try:
+                if shm is None or shm.name != shm_name:
+                    if shm is not None:
+                        shm.close()
+                    shm = shared_memory.SharedMemory(name=shm_name)
+                detector = detectors.get(stream)
+                if detector is None:
+                    detector = detectors[stream] = GazeDetector(**detector_kwargs)
+                detector.sensitivity = sensitivity
+                if reset:
+                    detector.reset_tracking()
+
+                frame = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf, offset=offset)
+                if command == _ANALYZE_ALL:
+                    payload = [pack_result(r) for r in detector.analyze_all(frame)]
+                else:
+                    payload = pack_result(detector.analyze(frame))
+                del frame
+                results.send((request_id, payload, None))
+            except Exception as e:
+                results.send((request_id, None, f"{type(e).__name__}: {e}"))
+    finally:
+        for detector in detectors.values():
+            detector.release()
+        if shm is not None:
+            shm.close()
+
+
+class ProcessPoolDetector:
+    """
+    İşçi süreçlerde GazeDetector çalıştıran havuz.
+    Thread-safe.
+
+    Frame'ler paylaşılan bellekteki `slots` adet yuvadan birine kopyalanır;
+    tüm yuvalar doluysa yeni istek bir yuva boşalana kadar bekler. Yuvadan
+    büyük bir frame gelirse bellek, uçuştaki istekler bittikten sonra
+    büyütülür. Her akış sabit bir işçiye atanır, sonuçlar akış içinde sırayla döner.
+    Her işçinin kendi görev kuyruğu ve sonuç pipe'ı vardır. Bir işçi süreç
+    ölürse (ör. cv2 çökmesi, bellek yetersizliği) pipe'ı kapanır; bekleyen
+    istekleri RuntimeError ile sonuçlanır, yuvaları boşaltılır ve işçi yeni
+    kuyruk ve pipe ile yeniden başlatılır. Diğer işçiler etkilenmez.
+
+    Akışlar detector() ile alınan ProcessDetector üzerinden kullanılır.
+    """
+
+    def __init__(self, processes: int = None, slots: int = None, slot_bytes: int = None,
+                 timeout: float = None, **detector_kwargs):
+        """
+        ProcessPoolDetector'ı başlat.
+
+        Args:
+            processes: İşçi süreç sayısı (None ise CPU sayısı)
+            slots: Paylaşılan bellekteki frame yuvası sayısı (None ise süreç sayısının iki katı)
+            slot_bytes: Bir yuvanın bayt cinsinden boyutu (None ise kamera çözünürlüğüne göre)
+            timeout: Sonuç bekleme süresi (None ise DETECTOR_TIMEOUT)
+            **detector_kwargs: İşçilerdeki GazeDetector'lara iletilecek parametreler
+        """
+        self.processes = processes or os.cpu_count() or 1
+        self.slots = slots or self.processes * 2
+        self.timeout = timeout if timeout is not None else DETECTOR_TIMEOUT
+        self.restarts = 0
+
+        self._cond = threading.Condition()
+        self._free = deque(range(self.slots))
+        # istek numarası -> (Future, yuva, işçi)
+        self._pending: Dict[int, Tuple[Future, int, int]] = {}
+        self._request_ids = itertools.count()
+        self._stream_ids = itertools.count()
+        self._shm = None
+        self.slot_bytes = 0
+        self._allocate(slot_bytes or WEBCAM_WIDTH * WEBCAM_HEIGHT * 3)
+        self._closed = False
+
+        # fork, Tk ve yakalama thread'leri olan süreçte güvenli değildir
+        self._context = multiprocessing.get_context("spawn")
+        self._detector_kwargs = detector_kwargs
+        self._tasks = [None] * self.processes
+        self._results = [None] * self.processes
+        self._workers = [None] * self.processes
+        for index in range(self.processes):
+            self._start_worker(index)
+        # close() toplayıcıyı bu pipe ile uyandırır
+        self._wakeup_reader, self._wakeup_writer = self._context.Pipe(duplex=False)
+
+        self._collector = threading.Thread(target=self._collect, name="gaze-results", daemon=True)
+        self._collector.start()
+
+    def _start_worker(self, index: int):
+        """İşçiyi yeni görev kuyruğu ve sonuç pipe'ı ile başlat. Kilit altında veya başlangıçta çağrılır."""
+        reader, writer = self._context.Pipe(duplex=False)
+        self._tasks[index] = self._context.Queue()
+        self._results[index] = reader
+        self._workers[index] = self._context.Process(
+            target=_worker_main, args=(self._tasks[index], writer, self._detector_kwargs),
+            name=f"gaze-worker-{index}", daemon=True
+        )
+        self._workers[index].start()
+        # Yazma ucu sadece işçide kalır; işçi ölünce okuma ucu EOF verir
+        writer.close()
+
+    def _allocate(self, slot_bytes: int):
+        """Paylaşılan belleği yuva boyutuyla (yeniden) oluştur. Kilit altında çağrılır."""
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+        self._shm = shared_memory.SharedMemory(create=True, size=slot_bytes * self.slots)
+        self.slot_bytes = slot_bytes
+
+    def _acquire_slot(self, nbytes: int) -> int:
+        with self._cond:
+            if nbytes > self.slot_bytes:
+                self._cond.wait_for(lambda: len(self._free) == self.slots or self._closed)
+                if not self._closed:
+                    self._allocate(nbytes)
+            self._cond.wait_for(lambda: self._free or self._closed)
+            if self._closed:
+                raise RuntimeError("Havuz kapatıldı")
+            return self._free.popleft()
+
+    def detector(self, sensitivity: float = None) -> "ProcessDetector":
+        """Yeni bir akış için detector oluştur."""
+        return ProcessDetector(self, next(self._stream_ids), sensitivity)
+
+    def submit(self, stream: int, frame: np.ndarray, multi: bool = False,
+               sensitivity: float = None, reset: bool = False) -> Future:
+        """
+        Frame'i akışın işçisine gönder.
+
+        Args:
+            stream: Akış numarası
+            frame: uint8 BGR veya gri tonlamalı frame
+            multi: True ise tüm yüzler analiz edilir (analyze_all)
+            sensitivity: Bakış hassasiyeti
+            reset: Analizden önce yüz takibi sıfırlansın mı
+
+        Returns:
+            Future: GazeResult veya multi ise GazeResult listesi
+        """
+        if frame.dtype != np.uint8:
+            raise ValueError(f"Frame uint8 olmalı: {frame.dtype}")
+        slot = self._acquire_slot(frame.nbytes)
+        future = Future()
+        command = _ANALYZE_ALL if multi else _ANALYZE
+        worker = stream % self.processes
+        with self._cond:
+            offset = slot * self.slot_bytes
+            np.ndarray(frame.shape, dtype=np.uint8, buffer=self._shm.buf, offset=offset)[...] = frame
+            request_id = next(self._request_ids)
+            self._pending[request_id] = (future, slot, worker)
+            # İşçi yeniden başlatılırken istek ya eski işçiyle birlikte hata alır ya da yeni kuyruğa gider
+            self._tasks[worker].put(
+                (request_id, stream, command, self._shm.name, offset, frame.shape, sensitivity, reset)
+            )
+        return future
+
+    def release_stream(self, stream: int):
+        """Akışın işçideki detector'ını bırak."""
+        with self._cond:
+            if not self._closed:
+                self._tasks[stream % self.processes].put((None, stream, _RELEASE, None, 0, None, None, False))
+
+    def _restart_worker(self, index: int):
+        """Ölen işçinin bekleyen isteklerini hata ile sonuçlandır ve işçiyi yeniden başlat."""
+        failed = []
+        with self._cond:
+            if self._closed:
+                return
+            worker = self._workers[index]
+            if worker.is_alive():
+                # Pipe'ı bozulan ama hâlâ çalışan işçi
+                worker.kill()
+            worker.join(1.0)
+            error = RuntimeError(f"Bakış işçisi {index} sonlandı (çıkış kodu {worker.exitcode})")
+            for request_id, (future, slot, owner) in list(self._pending.items()):
+                if owner == index:
+                    del self._pending[request_id]
+                    self._free.append(slot)
+                    failed.append(future)
+            self._results[index].close()
+            self._tasks[index].cancel_join_thread()
+            self._tasks[index].close()
+            self._start_worker(index)
+            self.restarts += 1
+            self._cond.notify_all()
+        for future in failed:
+            future.set_exception(error)
+
+    def _collect(self):
+        while True:
+            with self._cond:
+                if self._closed:
+                    return
+                readers = {reader: index for index, reader in enumerate(self._results)}
+            for reader in wait(list(readers) + [self._wakeup_reader]):
+                if reader is self._wakeup_reader:
+                    return
+                try:
+                    message = reader.recv()
+                except Exception:
+                    # EOF veya yarım kalmış mesaj: işçi öldü
+                    self._restart_worker(readers[reader])
+                    continue
+                self._complete(message)
+
+    def _complete(self, message: tuple):
+        request_id, payload, error = message
+        with self._cond:
+            entry = self._pending.pop(request_id, None)
+            if entry is None:
+                return
+            future, slot, _ = entry
+            self._free.append(slot)
+            self._cond.notify_all()
+        if error is not None:
+            future.set_exception(RuntimeError(error))
+        elif isinstance(payload, list):
+            future.set_result([unpack_result(record) for record in payload])
+        else:
+            future.set_result(unpack_result(payload))
+
+    def close(self, timeout: float = 5.0):
+        """İşçileri durdur, bekleyen istekleri iptal et ve paylaşılan belleği sil."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+
+        self._wakeup_writer.send(None)
+        self._collector.join(timeout)
+        for tasks in self._tasks:
+            tasks.put(None)
+        for worker, tasks, results in zip(self._workers, self._tasks, self._results):
+            worker.join(timeout)
+            if worker.is_alive():
+                worker.terminate()
+            tasks.cancel_join_thread()
+            results.close()
+        self._wakeup_reader.close()
+        self._wakeup_writer.close()
+
+        with self._cond:
+            pending, self._pending = self._pending, {}
+            self._shm.close()
+            self._shm.unlink()
+        for future, _, _ in pending.values():
+            future.set_exception(RuntimeError("Havuz kapatıldı"))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+class RemoteBackend(DetectorBackend):
+    """Tespiti işçi süreçlere bırakan detector'ın yer tutucu arka ucu; model yüklemez."""
+
+    name = "process"
+
+
+class ProcessDetector(GazeDetector):
+    """
+    Analizi ProcessPoolDetector işçisinde yapan, GazeDetector ile aynı
+    arayüze sahip detector. Çizim (render) yerel süreçte yapılır.
+    FocusSession'a detector olarak verilebilir.
+    """
+
+    def __init__(self, pool: ProcessPoolDetector, stream: int, sensitivity: float = None):
+        """
+        ProcessDetector'ı başlat.
+
+        Args:
+            pool: İşçi havuzu
+            stream: Akış numarası (işçi ataması ve işçideki takip durumu için)
+            sensitivity: Bakış hassasiyeti
+        """
+        super().__init__(sensitivity=sensitivity, backend=RemoteBackend())
+        self.pool = pool
+        self.stream = stream
+        self._reset_pending = False
+
+    def submit(self, frame: np.ndarray, multi: bool = False) -> Future:
+        """Frame'i analiz için gönder ve hemen Future döndür."""
+        reset, self._reset_pending = self._reset_pending, False
+        return self.pool.submit(self.stream, frame, multi, self.sensitivity, reset)
+
+    def analyze(self, frame: np.ndarray) -> GazeResult:
+        result = self.submit(frame).result(self.pool.timeout)
+        self._face_detected = result.face_detected
+        self._is_looking_at_screen = result.is_looking
+        self._gaze_direction = result.direction
+        return result
+
+    def analyze_all(self, frame: np.ndarray) -> List[GazeResult]:
+        results = self.submit(frame, multi=True).result(self.pool.timeout)
+        self._face_detected = len(results) > 0
+        return results
+
+    def reset_tracking(self):
+        super().reset_tracking()
+        self._reset_pending = True
+
+    def release(self):
+        """İşçideki detector'ı bırak."""
+        self.pool.release_stream(self.stream)
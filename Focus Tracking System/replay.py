@@ -0,0 +1,148 @@
+"""
+Replay Module
+Kaydedilmiş veya sentetik odaklanma oturumlarını hızlandırılmış olarak tekrar oynatır.
+Oturum motoru değiştirilebilir bir saatle çalıştırılır; uyarı ve tamamlanma
+davranışı gerçek zamanlı oturumla aynıdır, sadece saat daha hızlı akar.
+
+İki tekrar türü vardır:
+- Zaman çizelgesi (video_analyzer.py çıktısı .npy veya oturum günlüğü .timeline):
+  kayıtlı sonuçlar tespit yapılmadan uygulanır
+- Frame kaynağı (video, resim klasörü, "synthetic:N"): frame'ler yeniden analiz edilir
+
+Kullanım:
+    python replay.py zaman_cizelgesi.npy --duration 7200 --speed 0
+    python replay.py synthetic:600 --duration 20 --speed 100
+"""
+
+import sys
+import argparse
+from typing import Callable
+
+import numpy as np
+
+from clock import SimulatedClock, create_clock
+from frame_source import open_source
+from gaze_detector import GazeResult
+from session_engine import FocusSession, FocusEvent
+from timeline import EXTENSION as TIMELINE_EXTENSION, DIRECTION_CODES, read_timeline
+
+DIRECTION_NAMES = {code: name for name, code in DIRECTION_CODES.items()}
+
+
+def result_from_row(row) -> GazeResult:
+    """Zaman çizelgesi kaydını GazeResult'a çevir (kayıttaki yön kullanılır)."""
+    ratio = float(row["ratio"])
+    direction = int(row["direction"])
+    if np.isnan(ratio):
+        ratio = None
+    return GazeResult(
+        face=(0, 0, 0, 0) if row["face"] else None,
+        avg_ratio=ratio,
+        direction=DIRECTION_NAMES.get(direction, "merkez"),
+        is_looking=direction == DIRECTION_CODES["merkez"],
+    )
+
+
+def replay_timeline(timeline: np.ndarray, duration_seconds: float, clock=None, loop: bool = True,
+                    listener: Callable[[FocusEvent], None] = None, **session_kwargs) -> FocusSession:
+    """
+    Zaman çizelgesini oturum motoruna uygula.
+
+    Args:
+        timeline: TIMELINE_DTYPE veya timeline.RECORD_DTYPE tipinde kayıtlar
+        duration_seconds: Oturum süresi
+        clock: Saat (None ise beklemesiz SimulatedClock)
+        loop: Zaman çizelgesi oturumdan kısaysa başa dönülsün mü
+        listener: Olay dinleyicisi
+        **session_kwargs: FocusSession'a iletilecek ek parametreler
+
+    Returns:
+        FocusSession: Tamamlanmış (veya zaman çizelgesi bitmiş) oturum
+    """
+    clock = clock if clock is not None else SimulatedClock()
+    session = FocusSession(None, duration_seconds, clock=clock, multi_face=False, **session_kwargs)
+    if listener is not None:
+        session.add_listener(listener)
+
+    results = [result_from_row(row) for row in timeline]
+    timestamps = timeline["timestamp"].astype(float)
+    if len(timestamps) > 1:
+        span = timestamps[-1] - timestamps[0] + float(np.median(np.diff(timestamps)))
+    else:
+        span = 1.0
+
+    try:
+        session.start()
+        base = session.started_at - (timestamps[0] if len(timestamps) else 0.0)
+        while session.is_running and results:
+            for timestamp, result in zip(timestamps, results):
+                clock.sleep(base + timestamp - clock())
+                session.apply_result(result, clock())
+                if session.tick() is not None:
+                    break
+            if not loop:
+                break
+            base += span
+    finally:
+        session.close()
+
+    return session
+
+
+def replay_source(spec, duration_seconds: float, clock=None,
+                  listener: Callable[[FocusEvent], None] = None, **session_kwargs) -> FocusSession:
+    """
+    Frame kaynağını saat üzerinde kendi FPS'inde oynatarak oturumu çalıştır.
+
+    Args:
+        spec: open_source() tanımı (video, resim klasörü, "synthetic:N")
+        duration_seconds: Oturum süresi
+        clock: Saat (None ise beklemesiz SimulatedClock)
+        listener: Olay dinleyicisi
+        **session_kwargs: FocusSession'a iletilecek ek parametreler
+    """
+    clock = clock if clock is not None else SimulatedClock()
+    source = open_source(spec, clock=clock)
+    session = FocusSession(source, duration_seconds, clock=clock, **session_kwargs)
+    if listener is not None:
+        session.add_listener(listener)
+    try:
+        session.run()
+    finally:
+        session.close()
+        source.release()
+    return session
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Odaklanma oturumunu hızlandırılmış tekrar oynat.")
+    parser.add_argument("input", help="Zaman çizelgesi (.npy / .timeline), video, resim klasörü veya synthetic:N")
+    parser.add_argument("--duration", type=float, required=True, help="Oturum süresi (saniye)")
+    parser.add_argument("--speed", type=float, default=0,
+                        help="Hız çarpanı (0 = beklemeden, 1 = gerçek zaman, 100 = 100 kat)")
+    parser.add_argument("--no-loop", action="store_true", help="Zaman çizelgesi bitince durdur")
+    args = parser.parse_args(argv)
+
+    clock = create_clock(args.speed)
+    start = clock()
+
+    def print_event(event: FocusEvent):
+        print(f"[{event.timestamp - start:10.1f} s] {event.kind} {event.data or ''}")
+
+    if args.input.endswith((".npy", TIMELINE_EXTENSION)):
+        if args.input.endswith(".npy"):
+            timeline = np.load(args.input, allow_pickle=False)
+        else:
+            timeline = read_timeline(args.input)
+        session = replay_timeline(timeline, args.duration, clock, not args.no_loop, print_event)
+    else:
+        session = replay_source(args.input, args.duration, clock, print_event)
+
+    state = "tamamlandı" if session.is_completed else "tamamlanmadı"
+    print(f"Oturum {state}: {session.frame_count} frame, {session.processed_count} sonuç, "
+          f"{session.alert_count} uyarı")
+    return 0 if session.is_completed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,210 @@
+"""
+Sensitivity Sweep Module
+Kaydedilmiş ham göz bebeği oranlarını (timeline `ratio` alanı) bir hassasiyet ve
+dikkat dağınıklığı süresi ızgarası için yeniden sınıflandırır ve her ızgara
+noktasında kaç uyarı verileceğini hesaplar. Video yeniden işlenmez; tüm ızgara
+oturum başına tek vektörel geçişte hesaplanır.
+
+Sınıflandırma GazeDetector._classify ile, uyarı sayımı DistractionTracker
+(histerezis dahil) ile aynı kuralları izler.
+
+Kullanım:
+    python sensitivity_sweep.py sessions/
+    python sensitivity_sweep.py sessions/ --sensitivity 0.1:0.5:0.05 --seconds 3,6,10
+"""
+
+import sys
+import time
+import argparse
+from dataclasses import dataclass
+from typing import Iterable, List, Sequence
+
+import numpy as np
+
+from analytics import find_sessions, record_durations
+from timeline import read_timeline
+from config import GAZE_SENSITIVITY, DISTRACTION_SECONDS, REFOCUS_SECONDS
+
+
+@dataclass
+class SweepResult:
+    """Izgara sonucu: alerts[i, j] = sensitivities[i] ve seconds[j] için uyarı sayısı."""
+    sensitivities: np.ndarray
+    seconds: np.ndarray
+    alerts: np.ndarray
+    looking_seconds: np.ndarray
+    duration: float
+    sessions: int
+
+    def alerts_at(self, sensitivity: float, seconds: float) -> int:
+        """Izgaradaki en yakın noktanın uyarı sayısı."""
+        i = int(np.abs(self.sensitivities - sensitivity).argmin())
+        j = int(np.abs(self.seconds - seconds).argmin())
+        return int(self.alerts[i, j])
+
+
+def looking_masks(ratios: np.ndarray, sensitivities: Sequence[float]) -> np.ndarray:
+    """
+    Oranları her hassasiyet için sınıflandır (GazeDetector._classify ile aynı sınırlar).
+
+    Returns:
+        np.ndarray: (hassasiyet sayısı, kayıt sayısı) boyutunda "ekrana bakıyor" maskesi.
+                    Oranı olmayan (NaN) kayıtlar bakmıyor sayılır.
+    """
+    sens = np.asarray(sensitivities, dtype=np.float64)[:, None]
+    ratios = np.asarray(ratios, dtype=np.float64)[None, :]
+    return (ratios >= 0.50 - sens / 2) & (ratios <= 0.50 + sens / 2)
+
+
+def count_alerts(masks: np.ndarray, timestamps: np.ndarray, seconds: Sequence[float],
+                 refocus_seconds: float = None) -> np.ndarray:
+    """
+    Her maske satırı ve her uyarı süresi için DistractionTracker'ın vereceği uyarı sayısı.
+
+    Uzaklaşma bölümü, en az `refocus_seconds` süren bir bakış dizisiyle biter;
+    daha kısa bakışlar bölümü bölmez. Bölümde ilk ve son uzak örnek arasındaki
+    süre eşiği geçerse tek uyarı verilir.
+
+    Args:
+        masks: (satır, kayıt) boyutunda bakış maskeleri
+        timestamps: Kayıt zamanları (saniye, artan)
+        seconds: Uyarı süreleri ızgarası
+        refocus_seconds: Odağa dönüş süresi (None ise REFOCUS_SECONDS)
+
+    Returns:
+        np.ndarray: (satır, süre sayısı) boyutunda uyarı sayıları
+    """
+    refocus_seconds = refocus_seconds if refocus_seconds is not None else REFOCUS_SECONDS
+    seconds = np.asarray(seconds, dtype=np.float64)
+    rows, n = masks.shape
+    alerts = np.zeros((rows, len(seconds)), dtype=np.int64)
+    if n == 0 or rows == 0:
+        return alerts
+
+    # Tüm satırlardaki ardışık aynı değerli bölümler (satır başları da bölüm başıdır)
+    change = np.ones((rows, n), dtype=bool)
+    change[:, 1:] = masks[:, 1:] != masks[:, :-1]
+    starts = np.flatnonzero(change)
+    ends = np.append(starts[1:], rows * n) - 1
+    run_row = starts // n
+    run_looking = masks.ravel()[starts]
+    timestamps = np.asarray(timestamps, dtype=np.float64)
+    first_ts = timestamps[starts % n]
+    last_ts = timestamps[ends % n]
+
+    # Yeni uzaklaşma bölümü: satır başı veya yeterince uzun bakış dizisi
+    resets = run_looking & (last_ts - first_ts >= refocus_seconds)
+    breaks = resets.copy()
+    breaks[np.flatnonzero(np.diff(run_row, prepend=-1))] = True
+    episode = np.cumsum(breaks)
+
+    away = ~run_looking
+    if not away.any():
+        return alerts
+    away_episode = episode[away]
+    bounds = np.flatnonzero(np.diff(away_episode, prepend=-1))
+    span = np.maximum.reduceat(last_ts[away], bounds) - first_ts[away][bounds]
+    hits = span[:, None] >= seconds[None, :]
+    np.add.at(alerts, run_row[away][bounds], hits)
+    return alerts
+
+
+def sweep_records(records: np.ndarray, sensitivities: Sequence[float], seconds: Sequence[float],
+                  refocus_seconds: float = None) -> np.ndarray:
+    """Tek oturumun kayıtları için uyarı sayısı ızgarası."""
+    masks = looking_masks(records["ratio"], sensitivities)
+    return count_alerts(masks, records["timestamp"], seconds, refocus_seconds)
+
+
+def load_records(path: str) -> np.ndarray:
+    """.timeline veya video_analyzer .npy zaman çizelgesini kopyalamadan aç."""
+    if path.endswith(".npy"):
+        return np.load(path, mmap_mode="r")
+    return read_timeline(path)
+
+
+def sweep(paths: Iterable[str], sensitivities: Sequence[float], seconds: Sequence[float],
+          refocus_seconds: float = None) -> SweepResult:
+    """
+    Oturumların tamamı için ızgarayı hesapla.
+
+    Args:
+        paths: .timeline/.npy dosyaları veya .timeline içeren klasörler
+        sensitivities: Hassasiyet değerleri
+        seconds: Uyarı süresi (DISTRACTION_SECONDS) değerleri
+        refocus_seconds: Odağa dönüş süresi
+
+    Returns:
+        SweepResult
+    """
+    sensitivities = np.asarray(sensitivities, dtype=np.float64)
+    seconds = np.asarray(seconds, dtype=np.float64)
+    alerts = np.zeros((len(sensitivities), len(seconds)), dtype=np.int64)
+    looking = np.zeros(len(sensitivities))
+    duration = 0.0
+    files = find_sessions(paths)
+    for path in files:
+        records = load_records(path)
+        if len(records) == 0:
+            continue
+        masks = looking_masks(records["ratio"], sensitivities)
+        timestamps = records["timestamp"]
+        alerts += count_alerts(masks, timestamps, seconds, refocus_seconds)
+        # Bakış süresi analytics ile aynı kuralla (sınırlanmış boşluklar) hesaplanır
+        durations = record_durations(np.asarray(timestamps))
+        looking += masks @ durations
+        duration += float(durations.sum())
+    return SweepResult(sensitivities, seconds, alerts, looking, duration, len(files))
+
+
+def parse_grid(text: str) -> List[float]:
+    """ "0.1,0.2" veya "başlangıç:bitiş:adım" (bitiş dahil) biçimindeki ızgarayı çöz."""
+    if ":" in text:
+        start, stop, step = (float(part) for part in text.split(":"))
+        count = int(round((stop - start) / step)) + 1
+        return [round(start + i * step, 10) for i in range(count)]
+    return [float(part) for part in text.split(",")]
+
+
+def format_sweep(result: SweepResult, baseline: int = None) -> str:
+    """Izgarayı tablo olarak biçimlendir; baseline verilirse farkları da yazar."""
+    header = "hassasiyet  bakış %" + "".join(f"{f'{s:g} s':>14}" for s in result.seconds)
+    lines = [header]
+    for i, sensitivity in enumerate(result.sensitivities):
+        percent = 100.0 * result.looking_seconds[i] / result.duration if result.duration > 0 else 0.0
+        cells = []
+        for count in result.alerts[i]:
+            cell = f"{count}" if baseline is None else f"{count} ({count - baseline:+d})"
+            cells.append(f"{cell:>14}")
+        lines.append(f"{sensitivity:>10.3f}  {percent:>7.1f}" + "".join(cells))
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Kaydedilmiş oturumlarda hassasiyet ve uyarı süresinin uyarı sayısına etkisi."
+    )
+    parser.add_argument("paths", nargs="+", help=".timeline/.npy dosyaları veya klasörler")
+    parser.add_argument("--sensitivity", default="0.1:0.5:0.05",
+                        help="Hassasiyet ızgarası: 0.2,0.3 veya başlangıç:bitiş:adım")
+    parser.add_argument("--seconds", default="3,6,10,15",
+                        help="Uyarı süresi ızgarası (saniye)")
+    parser.add_argument("--refocus", type=float, default=None,
+                        help="Odağa dönüş süresi (varsayılan REFOCUS_SECONDS)")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    result = sweep(args.paths, parse_grid(args.sensitivity), parse_grid(args.seconds), args.refocus)
+    if result.sessions == 0:
+        print("Oturum bulunamadı.")
+        return 1
+    baseline = sweep(args.paths, [GAZE_SENSITIVITY], [DISTRACTION_SECONDS], args.refocus).alerts[0, 0]
+    print(f"{result.sessions} oturum, {result.duration / 60:.1f} dk. "
+          f"Şu anki ayarlar (hassasiyet {GAZE_SENSITIVITY}, {DISTRACTION_SECONDS:g} s): {baseline} uyarı")
+    print(format_sweep(result, int(baseline)))
+    print(f"\nIzgara {time.perf_counter() - started:.2f} s içinde hesaplandı.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
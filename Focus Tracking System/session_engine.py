@@ -0,0 +1,303 @@
+"""
+Session Engine Module
+Tkinter'dan bağımsız odaklanma oturumu motoru.
+Frame kaynağından frame alır, bakışı analiz eder, dikkat dağınıklığını takip eder,
+süreyi sayar ve olay yayınlar. Arayüz bu olayları dinleyen ince bir katmandır;
+motor başsız (headless) makinelerde ve testlerde doğrudan çalıştırılabilir.
+"""
+
+import math
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+import cv2
+import numpy as np
+
+from gaze_detector import GazeDetector
+from frame_scheduler import AdaptiveFrameScheduler
+from multi_face import MultiFaceTracker
+from distraction import DistractionTracker, DISTRACTED, REFOCUSED
+from instrumentation import get_profiler
+from config import MULTI_FACE_MODE
+
+EVENT_STARTED = "started"
+EVENT_DISTRACTED = "distracted"
+EVENT_REFOCUSED = "refocused"
+EVENT_COMPLETED = "completed"
+EVENT_STOPPED = "stopped"
+
+_profiler = get_profiler()
+
+
+@dataclass
+class FocusEvent:
+    """Oturum olayı."""
+    kind: str
+    timestamp: float
+    data: Dict[str, Any] = field(default_factory=dict)
+
+
+class FocusSession:
+    """
+    Arayüzden bağımsız odaklanma oturumu.
+    Thread-safe.
+
+    Frame kaynağı, `read(timeout)` metodu CapturedFrame benzeri
+    (frame, timestamp, index alanları olan) nesne veya None döndüren
+    herhangi bir nesnedir. Kaynağın `exhausted` özelliği True olduğunda
+    run() döngüsü biter.
+
+    Bir frame'in işlenmesi üç adıma ayrılmıştır: next_frame(), analyze()
+    ve apply_result(). process() üçünü birleştirir; analizi başka bir
+    yerde (ör. ortak işçi havuzunda) yapan çağıranlar adımları ayrı kullanabilir.
+    """
+
+    def __init__(self, source, duration_seconds: float, clock: Callable[[], float] = time.monotonic,
+                 detector: GazeDetector = None, sensitivity: float = None,
+                 distraction_seconds: float = None, refocus_seconds: float = None,
+                 scheduler: AdaptiveFrameScheduler = None, multi_face: bool = None,
+                 mirror: bool = True, recorder=None):
+        """
+        FocusSession'ı başlat.
+
+        Args:
+            source: Frame kaynağı
+            duration_seconds: Oturum süresi (saniye)
+            clock: Oturum süresi için saat (time.monotonic veya clock.py saatleri)
+            detector: Kullanılacak GazeDetector (None ise oluşturulur ve close() ile bırakılır)
+            sensitivity: Bakış hassasiyeti (detector verilmemişse)
+            distraction_seconds: Uyarı için kesintisiz uzaklaşma süresi
+            refocus_seconds: Uyarının kapanması için kesintisiz bakış süresi
+            scheduler: Frame işleme zamanlayıcısı
+            multi_face: Çok yüzlü mod (None ise config'den alınır)
+            mirror: Frame'ler analizden önce yatay çevrilsin mi (ayna görüntüsü)
+            recorder: Her sonucun eklendiği zaman çizelgesi (ör. TimelineWriter);
+                      sadece tek yüzlü modda kaydedilir
+        """
+        self.source = source
+        self.duration_seconds = duration_seconds
+        self.clock = clock
+        self._owns_detector = detector is None
+        self.detector = detector if detector is not None else GazeDetector(sensitivity=sensitivity)
+        self.scheduler = scheduler if scheduler is not None else AdaptiveFrameScheduler()
+        self.distraction = DistractionTracker(distraction_seconds, refocus_seconds)
+        multi_face = multi_face if multi_face is not None else MULTI_FACE_MODE
+        self.face_tracker = (
+            MultiFaceTracker(distraction_seconds=self.distraction.seconds,
+                             refocus_seconds=self.distraction.refocus_seconds)
+            if multi_face else None
+        )
+        self.mirror = mirror
+        self.recorder = recorder
+
+        self._listeners: List[Callable[[FocusEvent], None]] = []
+        self._lock = threading.Lock()
+        self._reset_state()
+
+    def _reset_state(self):
+        self.started_at: Optional[float] = None
+        self.end_time: Optional[float] = None
+        self.is_running = False
+        self.is_completed = False
+        self.is_distracted = False
+        self.frame_count = 0
+        self.processed_count = 0
+        self.alert_count = 0
+        self.last_result = None
+        self.last_results = None
+        self.last_labels = None
+        self._record_origin: Optional[float] = None
+
+    def add_listener(self, callback: Callable[[FocusEvent], None]):
+        """Olay dinleyicisi ekle. Dinleyiciler olayı üreten thread'de çağrılır."""
+        self._listeners.append(callback)
+
+    def _emit(self, kind: str, timestamp: float, **data) -> FocusEvent:
+        event = FocusEvent(kind, timestamp, data)
+        for listener in list(self._listeners):
+            listener(event)
+        return event
+
+    def start(self) -> FocusEvent:
+        """Oturumu başlat ve süreyi saymaya başla."""
+        with self._lock:
+            self._reset_state()
+            self.scheduler.reset()
+            self.distraction.reset()
+            self.detector.reset_tracking()
+            if self.face_tracker is not None:
+                self.face_tracker.reset()
+            self.started_at = self.clock()
+            self.end_time = self.started_at + self.duration_seconds
+            self.is_running = True
+        return self._emit(EVENT_STARTED, self.started_at, duration=self.duration_seconds)
+
+    def remaining_seconds(self, now: float = None) -> int:
+        """Kalan tam saniye sayısı (yukarı yuvarlanır)."""
+        if self.end_time is None:
+            return int(math.ceil(self.duration_seconds))
+        now = now if now is not None else self.clock()
+        return max(0, int(math.ceil(self.end_time - now)))
+
+    def tick(self, now: float = None) -> Optional[FocusEvent]:
+        """
+        Süreyi kontrol et; süre dolduysa oturumu tamamla.
+
+        Returns:
+            FocusEvent: Oturum bu çağrıda tamamlandıysa EVENT_COMPLETED, yoksa None
+        """
+        now = now if now is not None else self.clock()
+        with self._lock:
+            if not self.is_running or now < self.end_time:
+                return None
+            self.is_running = False
+            self.is_completed = True
+        return self._emit(EVENT_COMPLETED, now, alerts=self.alert_count,
+                          frames=self.frame_count, processed=self.processed_count)
+
+    def stop(self) -> Optional[FocusEvent]:
+        """Oturumu süre dolmadan durdur."""
+        with self._lock:
+            if not self.is_running:
+                return None
+            self.is_running = False
+        now = self.clock()
+        return self._emit(EVENT_STOPPED, now, remaining=self.remaining_seconds(now))
+
+    def next_frame(self, timeout: float = None):
+        """Kaynaktan sıradaki frame'i al (yoksa None)."""
+        return self.source.read(timeout)
+
+    def prepare(self, frame: np.ndarray) -> np.ndarray:
+        """Frame'i analiz ve gösterim için hazırla (ayna çevirme)."""
+        if not self.mirror:
+            return frame
+        with _profiler.probe("flip"):
+            return cv2.flip(frame, 1)
+
+    def should_process(self) -> bool:
+        """Bu frame analiz edilmeli mi? Her frame için bir kez çağrılır."""
+        with self._lock:
+            self.frame_count += 1
+            return self.scheduler.should_process()
+
+    def analyze(self, frame: np.ndarray):
+        """
+        Frame'i analiz et (oturum durumunu değiştirmez).
+
+        Returns:
+            GazeResult veya çok yüzlü modda GazeResult listesi
+        """
+        if self.face_tracker is not None:
+            return self.detector.analyze_all(frame)
+        return self.detector.analyze(frame)
+
+    def apply_result(self, result, timestamp: float = None) -> List[FocusEvent]:
+        """
+        Analiz sonucunu oturum durumuna uygula.
+
+        Args:
+            result: analyze() çıktısı
+            timestamp: Frame zamanı (None ise saat)
+
+        Returns:
+            list: Bu sonuçla oluşan olaylar (EVENT_DISTRACTED / EVENT_REFOCUSED)
+        """
+        timestamp = timestamp if timestamp is not None else self.clock()
+        sensitivity = self.detector.sensitivity
+        pending = []
+
+        with self._lock:
+            if not self.is_running:
+                return []
+            self.processed_count += 1
+
+            if self.face_tracker is not None:
+                self.last_results = result
+                people = self.face_tracker.update(result, timestamp)
+                self.last_labels = [f"#{p.person_id} {p.direction}" for p in people]
+                self.scheduler.update_many(result, sensitivity)
+                distracted = [p.person_id for p in self.face_tracker.distracted_people()]
+                if distracted and not self.is_distracted:
+                    change = DISTRACTED
+                elif not distracted and self.is_distracted:
+                    change = REFOCUSED
+                else:
+                    change = None
+                data = {"people": distracted}
+            else:
+                self.last_result = result
+                self.scheduler.update(result, sensitivity)
+                if self.recorder is not None:
+                    # Kayıt zamanı ilk sonuca göredir (kaynak zamanı ile oturum saati farklı olabilir)
+                    if self._record_origin is None:
+                        self._record_origin = timestamp
+                    try:
+                        self.recorder.append(self.processed_count - 1, timestamp - self._record_origin, result)
+                    except OSError as e:
+                        # Kayıt hatası odak takibini durdurmamalı; kayıt bırakılır
+                        print(f"Zaman çizelgesi yazılamadı, kayıt durduruldu: {e}")
+                        self.recorder = None
+                change = self.distraction.update(result.is_looking, timestamp)
+                data = {"away_seconds": self.distraction.away_seconds(timestamp)}
+
+            if change == DISTRACTED:
+                self.is_distracted = True
+                self.alert_count += 1
+                pending.append((EVENT_DISTRACTED, data))
+            elif change == REFOCUSED:
+                self.is_distracted = False
+                pending.append((EVENT_REFOCUSED, {}))
+
+        return [self._emit(kind, timestamp, **data) for kind, data in pending]
+
+    def process(self, captured) -> np.ndarray:
+        """
+        Yakalanan frame'i hazırla, gerekiyorsa analiz et ve sonucu uygula.
+
+        Returns:
+            np.ndarray: Hazırlanmış (gösterime uygun) frame
+        """
+        frame = self.prepare(captured.frame)
+        if self.should_process():
+            self.apply_result(self.analyze(frame), captured.timestamp)
+        return frame
+
+    def run(self, max_frames: int = None, timeout: float = 0.5, pacer=None) -> "FocusSession":
+        """
+        Oturumu başsız olarak sonuna kadar çalıştır.
+
+        Döngü süre dolunca, stop() çağrılınca, kaynak tükenince veya
+        `max_frames` frame işlendiğinde biter.
+
+        Args:
+            max_frames: En fazla okunacak frame sayısı
+            timeout: Kaynaktan frame bekleme süresi
+            pacer: Her adımdan sonra wait() çağrılacak FramePacer (None ise beklenmez)
+        """
+        if not self.is_running and not self.is_completed:
+            self.start()
+
+        while self.is_running:
+            if max_frames is not None and self.frame_count >= max_frames:
+                break
+
+            captured = self.next_frame(timeout)
+            if captured is None:
+                if getattr(self.source, "exhausted", False):
+                    break
+            else:
+                self.process(captured)
+
+            self.tick()
+            if pacer is not None:
+                pacer.wait()
+
+        return self
+
+    def close(self):
+        """Oturumun oluşturduğu detector'ı bırak."""
+        if self._owns_detector:
+            self.detector.release()
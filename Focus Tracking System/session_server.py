@@ -0,0 +1,425 @@
+"""
+Session Server Module
+Tek süreçte birden çok kamera/akış için başsız odaklanma oturumları çalıştırır.
+Her akışın okuma thread'i frame'leri alır ve hazırlar; analizler ortak bir işçi
+havuzunda akışlar arasında sırayla (round-robin) yapılır. Her akış için frame,
+düşürülen frame ve gecikme istatistikleri tutulur.
+
+Kullanım:
+    python session_server.py 0 1 2 --duration 1500
+    python session_server.py synthetic:600 synthetic:600 oturum.mp4 --duration 60 --workers 4
+"""
+
+import os
+import sys
+import argparse
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, Hashable, List, Optional
+
+import numpy as np
+
+from frame_source import CameraSource, open_source
+from process_detector import ProcessPoolDetector
+from instrumentation import StageHistogram
+from session_engine import FocusSession
+from config import INSTRUMENTATION_WINDOW
+
+
+class FairDetectionPool:
+    """
+    Akışlar arasında adil sırayla iş çalıştıran ortak işçi havuzu.
+    Thread-safe.
+
+    Her akışın (anahtarın) en fazla bir bekleyen ve bir çalışan işi olur.
+    Bekleyen iş varken gelen yeni iş eskisinin yerine geçer (eski iş düşürülmüş
+    sayılır) veya block=True ise yer açılana kadar beklenir. İşçiler sıradaki
+    akışı round-robin sırasıyla seçer; hızlı bir akış diğerlerini aç bırakamaz.
+    Aynı akışın işleri hiçbir zaman aynı anda çalışmaz, bu yüzden akışın
+    detector'ı ve takip durumu başka thread'lerle paylaşılmaz.
+    """
+
+    def __init__(self, workers: int = None):
+        """
+        FairDetectionPool'u başlat.
+
+        Args:
+            workers: İşçi thread sayısı (None ise CPU sayısı)
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self._cond = threading.Condition()
+        self._pending: Dict[Hashable, Callable[[], None]] = {}
+        self._busy = set()
+        self._ready = deque()
+        self._closed = False
+        self.dropped: Dict[Hashable, int] = {}
+        self._threads = [
+            threading.Thread(target=self._work, name=f"detection-{i}", daemon=True)
+            for i in range(self.workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, key: Hashable, job: Callable[[], None], block: bool = False) -> bool:
+        """
+        Akış için iş ekle.
+
+        Args:
+            key: Akış anahtarı
+            job: Çalıştırılacak fonksiyon
+            block: True ise akışın bekleyen işi bitene kadar beklenir, False ise eski iş düşürülür
+
+        Returns:
+            bool: Eski bir bekleyen iş düşürüldüyse True
+        """
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Havuz kapatıldı")
+            if block:
+                while key in self._pending and not self._closed:
+                    self._cond.wait()
+            replaced = key in self._pending
+            if replaced:
+                self.dropped[key] = self.dropped.get(key, 0) + 1
+            elif key not in self._busy:
+                self._ready.append(key)
+            self._pending[key] = job
+            self._cond.notify_all()
+            return replaced
+
+    def _work(self):
+        while True:
+            with self._cond:
+                while not self._ready and not self._closed:
+                    self._cond.wait()
+                if not self._ready:
+                    return
+                key = self._ready.popleft()
+                job = self._pending.pop(key)
+                self._busy.add(key)
+                self._cond.notify_all()
+
+            try:
+                job()
+            except Exception as e:
+                # Hatalı bir iş işçi thread'ini sonlandırmamalı
+                print(f"Analiz işi hatası ({key}): {e!r}")
+            finally:
+                with self._cond:
+                    self._busy.discard(key)
+                    if key in self._pending:
+                        self._ready.append(key)
+                    self._cond.notify_all()
+
+    def wait_idle(self, key: Hashable, timeout: float = None) -> bool:
+        """Akışın bekleyen ve çalışan işi bitene kadar bekle."""
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: key not in self._pending and key not in self._busy, timeout
+            )
+
+    def close(self, timeout: float = None):
+        """Bekleyen işler bittikten sonra işçileri durdur."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        for thread in self._threads:
+            thread.join(timeout)
+
+
+class StreamStats:
+    """Bir akışın frame sayaçları ve gecikme histogramları."""
+
+    def __init__(self, window: int = None):
+        window = window or INSTRUMENTATION_WINDOW
+        self.frames = 0
+        self.submitted = 0
+        self.completed = 0
+        self.errors = 0
+        # Frame'in okunmasından sonucun uygulanmasına kadar geçen süre
+        self.latency = StageHistogram(window)
+        # İşin havuzda işçi beklediği süre
+        self.queue_wait = StageHistogram(window)
+        # Sadece analiz süresi
+        self.analyze = StageHistogram(window)
+
+    def snapshot(self, dropped: int = 0) -> dict:
+        return {
+            "frames": self.frames,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "dropped": dropped,
+            "errors": self.errors,
+            "latency": self.latency.snapshot(),
+            "queue_wait": self.queue_wait.snapshot(),
+            "analyze": self.analyze.snapshot(),
+        }
+
+
+class _Stream:
+    """Sunucudaki bir akış: oturum, okuma thread'i ve istatistikler."""
+
+    def __init__(self, name: str, session: FocusSession, drop_stale: bool):
+        self.name = name
+        self.session = session
+        self.drop_stale = drop_stale
+        self.stats = StreamStats()
+        self.thread: Optional[threading.Thread] = None
+        self.remote_detector = None
+
+
+class SessionServer:
+    """
+    Birden çok başsız FocusSession'ı ortak bir analiz havuzuyla çalıştıran sunucu.
+
+    Her akışın kendi oturumu, detector'ı ve okuma thread'i vardır; okuma
+    thread'leri kaynak beklerken boştadır. Yoğun iş (bakış analizi) ortak
+    FairDetectionPool'da yapılır. OpenCV tespit çağrıları GIL'i bıraktığından
+    toplam verim işçi sayısıyla çekirdek sayısına kadar artar.
+
+    `processes` verilirse analiz işçi süreçlerde (ProcessPoolDetector) yapılır;
+    havuz thread'leri sadece sonuç bekler ve Python tarafındaki göz bebeği
+    işlemleri de çekirdeklere yayılır.
+
+    Canlı kaynaklarda (kamera, realtime kaynaklar) işçiler yetişemezse eski
+    frame'ler düşürülür; dosya ve sentetik kaynaklarda okuma analizi bekler
+    ve her frame işlenir.
+    """
+
+    def __init__(self, workers: int = None, read_timeout: float = 0.5, processes: int = 0):
+        """
+        SessionServer'ı başlat.
+
+        Args:
+            workers: Ortak analiz havuzundaki işçi sayısı (None ise CPU sayısı)
+            read_timeout: Kaynaktan frame bekleme süresi
+            processes: Analiz için işçi süreç sayısı (0 ise sunucu sürecinde)
+        """
+        self.workers = workers
+        self.detector_pool = ProcessPoolDetector(processes) if processes else None
+        self.read_timeout = read_timeout
+        self.pool: Optional[FairDetectionPool] = None
+        self._closed = False
+        self._streams: List[_Stream] = []
+        self._stop_event = threading.Event()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    def add_stream(self, source, duration_seconds: float, name: str = None,
+                   drop_stale: bool = None, **session_kwargs) -> FocusSession:
+        """
+        Akış ekle.
+
+        Args:
+            source: Frame kaynağı (bkz. frame_source.py)
+            duration_seconds: Oturum süresi
+            name: Akış adı (None ise sıra numarası)
+            drop_stale: Analiz yetişemezse eski frame'ler düşürülsün mü
+                        (None ise canlı kaynaklarda evet, diğerlerinde hayır)
+            **session_kwargs: FocusSession'a iletilecek ek parametreler
+
+        Returns:
+            FocusSession: Akışın oturumu (olay dinleyicisi eklemek için)
+        """
+        if self.pool is not None or self._closed:
+            raise RuntimeError("Sunucu çalışırken veya kapatıldıktan sonra akış eklenemez")
+        if drop_stale is None:
+            drop_stale = isinstance(source, CameraSource) or getattr(source, "realtime", False)
+        remote = None
+        if self.detector_pool is not None and "detector" not in session_kwargs:
+            remote = self.detector_pool.detector(session_kwargs.pop("sensitivity", None))
+            session_kwargs["detector"] = remote
+        session = FocusSession(source, duration_seconds, **session_kwargs)
+        name = name if name is not None else str(len(self._streams))
+        stream = _Stream(name, session, drop_stale)
+        stream.remote_detector = remote
+        self._streams.append(stream)
+        return session
+
+    @property
+    def sessions(self) -> Dict[str, FocusSession]:
+        return {stream.name: stream.session for stream in self._streams}
+
+    def start(self):
+        """Havuzu ve tüm akışları başlat."""
+        if self.pool is not None or self._closed:
+            return
+        self._stop_event.clear()
+        self.pool = FairDetectionPool(self.workers)
+        self.started_at = time.perf_counter()
+        self.finished_at = None
+        for stream in self._streams:
+            start = getattr(stream.session.source, "start", None)
+            if start is not None:
+                start()
+            stream.session.start()
+            stream.thread = threading.Thread(
+                target=self._feed, args=(stream,), name=f"stream-{stream.name}", daemon=True
+            )
+            stream.thread.start()
+
+    def _feed(self, stream: _Stream):
+        session = stream.session
+        while session.is_running and not self._stop_event.is_set():
+            captured = session.next_frame(self.read_timeout)
+            if captured is None:
+                if getattr(session.source, "exhausted", False):
+                    break
+            else:
+                stream.stats.frames += 1
+                frame = session.prepare(captured.frame)
+                if session.should_process():
+                    stream.stats.submitted += 1
+                    job = self._make_job(stream, frame, captured.timestamp, time.perf_counter())
+                    self.pool.submit(stream.name, job, block=not stream.drop_stale)
+            session.tick()
+        self.pool.wait_idle(stream.name)
+
+    @staticmethod
+    def _make_job(stream: _Stream, frame: np.ndarray, timestamp: float, read_at: float):
+        def job():
+            started = time.perf_counter()
+            try:
+                result = stream.session.analyze(frame)
+                analyzed = time.perf_counter()
+                stream.session.apply_result(result, timestamp)
+                stream.stats.completed += 1
+                stream.stats.queue_wait.record(started - read_at)
+                stream.stats.analyze.record(analyzed - started)
+                stream.stats.latency.record(time.perf_counter() - read_at)
+            except Exception as e:
+                # Analiz, dinleyici veya kayıt hatası sadece bu frame'i etkiler
+                stream.stats.errors += 1
+                print(f"Akış {stream.name} frame hatası: {e!r}")
+        return job
+
+    def wait(self, timeout: float = None) -> bool:
+        """
+        Tüm akışlar bitene kadar bekle.
+
+        Returns:
+            bool: Tüm akışlar bittiyse True
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for stream in self._streams:
+            if stream.thread is None:
+                continue
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            stream.thread.join(remaining)
+            if stream.thread.is_alive():
+                return False
+        if self.finished_at is None:
+            self.finished_at = time.perf_counter()
+        return True
+
+    def stop(self):
+        """Tüm oturumları durdur."""
+        self._stop_event.set()
+        for stream in self._streams:
+            stream.session.stop()
+
+    def close(self):
+        """Akışları durdur, havuzu kapat, kaynakları ve detector'ları bırak."""
+        if self._closed:
+            return
+        self._closed = True
+        self.stop()
+        self.wait()
+        if self.pool is not None:
+            self.pool.close()
+            self.pool = None
+        for stream in self._streams:
+            stream.session.close()
+            if stream.remote_detector is not None:
+                stream.remote_detector.release()
+            release = getattr(stream.session.source, "release", None)
+            if release is not None:
+                release()
+        if self.detector_pool is not None:
+            self.detector_pool.close()
+
+    def run(self, timeout: float = None) -> Dict[str, dict]:
+        """Başlat, akışlar bitene kadar bekle, kapat ve istatistikleri döndür."""
+        self.start()
+        try:
+            self.wait(timeout)
+        finally:
+            stats = self.stats()
+            self.close()
+        return stats
+
+    def stats(self) -> Dict[str, dict]:
+        """
+        Akış başına istatistikler ve toplam verim.
+
+        Returns:
+            dict: Akış adı -> istatistikler; "_total" anahtarında toplam analiz hızı
+        """
+        dropped = self.pool.dropped if self.pool is not None else {}
+        result = {
+            stream.name: dict(stream.stats.snapshot(dropped.get(stream.name, 0)),
+                              alerts=stream.session.alert_count,
+                              completed_session=stream.session.is_completed)
+            for stream in self._streams
+        }
+        if self.started_at is not None:
+            end = self.finished_at if self.finished_at is not None else time.perf_counter()
+            elapsed = max(end - self.started_at, 1e-9)
+            completed = sum(stream.stats.completed for stream in self._streams)
+            result["_total"] = {
+                "elapsed_seconds": elapsed,
+                "completed": completed,
+                "throughput_fps": completed / elapsed,
+            }
+        return result
+
+
+def format_stats(stats: Dict[str, dict]) -> str:
+    """İstatistikleri tablo olarak biçimlendir."""
+    lines = [f"{'akış':<12}{'frame':>8}{'analiz':>8}{'düşen':>8}{'uyarı':>7}"
+             f"{'p50 ms':>9}{'p95 ms':>9}{'max ms':>9}"]
+    for name, item in stats.items():
+        if name == "_total":
+            continue
+        latency = item["latency"]
+        lines.append(
+            f"{name:<12}{item['frames']:>8}{item['completed']:>8}{item['dropped']:>8}{item['alerts']:>7}"
+            f"{latency.get('p50_ms', 0):>9.1f}{latency.get('p95_ms', 0):>9.1f}{latency.get('max_ms', 0):>9.1f}"
+        )
+    total = stats.get("_total")
+    if total:
+        lines.append(f"Toplam: {total['completed']} analiz, {total['elapsed_seconds']:.1f} s, "
+                     f"{total['throughput_fps']:.1f} frame/s")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Birden çok akış için başsız odaklanma oturumları çalıştır.")
+    parser.add_argument("sources", nargs="+", help="Kamera numarası, video, resim klasörü veya synthetic:N")
+    parser.add_argument("--duration", type=float, required=True, help="Oturum süresi (saniye)")
+    parser.add_argument("--workers", type=int, default=None, help="Analiz işçi sayısı")
+    parser.add_argument("--processes", type=int, default=0,
+                        help="Analiz için işçi süreç sayısı (0 = sunucu sürecinde)")
+    parser.add_argument("--realtime", action="store_true",
+                        help="Dosya ve sentetik kaynakları kendi FPS'lerinde oynat")
+    args = parser.parse_args(argv)
+
+    server = SessionServer(args.workers, processes=args.processes)
+    for i, spec in enumerate(args.sources):
+        server.add_stream(open_source(spec, realtime=args.realtime), args.duration, name=f"{i}:{spec}"[:12])
+
+    server.start()
+    try:
+        server.wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stats = server.stats()
+        server.close()
+    print(format_stats(stats))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+"""
+Synthetic Frames Module
+Benchmark ve testler için deterministik sentetik yüz/göz frame'leri üretir.
+Üretilen yüzler Haar Cascade ile tespit edilebilecek şekilde çizilir.
+"""
+
+import math
+from typing import Iterator, Tuple
+
+import cv2
+import numpy as np
+
+SKIN_COLOR = (150, 175, 215)
+BACKGROUND_COLOR = (90, 100, 110)
+
+
+def generate_face_frame(width: int = 640, height: int = 480, gaze: float = 0.5,
+                        offset: Tuple[int, int] = (0, 0), seed: int = 0,
+                        face_visible: bool = True) -> np.ndarray:
+    """
+    Tek bir sentetik frame üret.
+
+    Args:
+        width: Frame genişliği
+        height: Frame yüksekliği
+        gaze: Göz bebeğinin göz içindeki yatay konumu (0.0 sol - 1.0 sağ)
+        offset: Yüzün frame merkezinden kayması (piksel)
+        seed: Gürültü için rastgelelik tohumu
+        face_visible: False ise sadece arka plan çizilir
+
+    Returns:
+        np.ndarray: BGR formatında frame
+    """
+    rng = np.random.default_rng(seed)
+    frame = np.full((height, width, 3), BACKGROUND_COLOR, dtype=np.uint8)
+
+    if face_visible:
+        scale = min(width, height) / 480
+        cx, cy = width // 2 + offset[0], height // 2 + offset[1]
+        fw = int(280 * scale)
+        fh = int(fw * 1.3)
+        cv2.ellipse(frame, (cx, cy), (fw // 2, fh // 2), 0, 0, 360, SKIN_COLOR, -1)
+
+        ey = cy - int(fh * 0.12)
+        ex = int(fw * 0.21)
+        erx, ery = int(fw * 0.10), int(fw * 0.055)
+        for side in (-1, 1):
+            center = (cx + side * ex, ey)
+            cv2.ellipse(frame, (center[0], center[1] - ery * 2 - 4), (erx + 4, ery // 2 + 2),
+                        0, 180, 360, (40, 50, 60), 4)
+            cv2.ellipse(frame, center, (erx + 3, ery + 3), 0, 0, 360, (90, 100, 120), -1)
+            cv2.ellipse(frame, center, (erx, ery), 0, 0, 360, (235, 235, 235), -1)
+
+            pupil = (int(center[0] - erx + 2 * erx * gaze), center[1])
+            cv2.circle(frame, pupil, int(ery * 0.9), (60, 80, 90), -1)
+            cv2.circle(frame, pupil, int(ery * 0.45), (15, 15, 15), -1)
+
+        cv2.line(frame, (cx, ey + fh // 12), (cx, cy + fh // 10), (120, 140, 180), 3)
+        cv2.ellipse(frame, (cx, cy + fh // 4), (fw // 6, fh // 20), 0, 0, 180, (70, 70, 140), 3)
+
+    frame = cv2.GaussianBlur(frame, (5, 5), 0)
+    return cv2.add(frame, rng.integers(0, 8, frame.shape, dtype=np.uint8))
+
+
+def generate_sequence(count: int, width: int = 640, height: int = 480,
+                      seed: int = 0, absent_every: int = 0) -> Iterator[np.ndarray]:
+    """
+    Bakışın yavaşça sağa sola gidip geldiği, başın hafifçe kaydığı frame dizisi.
+
+    Args:
+        count: Frame sayısı
+        width: Frame genişliği
+        height: Frame yüksekliği
+        seed: Rastgelelik tohumu
+        absent_every: 0'dan büyükse her N frame'lik bloğun son çeyreğinde yüz görünmez
+    """
+    for i in range(count):
+        phase = i / 30.0
+        gaze = 0.5 + 0.3 * math.sin(phase)
+        offset = (int(10 * math.sin(phase * 0.7)), int(6 * math.cos(phase * 0.5)))
+        visible = not (absent_every > 0 and i % absent_every >= absent_every * 3 // 4)
+        yield generate_face_frame(width, height, gaze, offset, seed + i, visible)
@@ -34,6 +34,12 @@ class TestAlertManager(unittest.TestCase):
         self.manager.trigger_alert()
         self.assertTrue(self.manager.should_show_warning())
     
+    def test_trigger_alert_blocking(self):
+        """blocking=True iken ses çağıran thread'de başlatılmalı, yeni thread açılmamalı."""
+        self.manager.trigger_alert(blocking=True)
+        self.assertTrue(self.manager.should_show_warning())
+        self.assertIsNone(self.manager._sound_thread)
+    
     def test_stop_alert(self):
         """Uyarı durdurma testi."""
         self.manager.trigger_alert()
@@ -0,0 +1,141 @@
+"""
+Unit tests for analytics module.
+"""
+
+import unittest
+import sys
+import os
+import io
+import tempfile
+import time
+from contextlib import redirect_stdout
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analytics import analyze_records, analyze_sessions, record_durations, runs, main
+from timeline import TimelineWriter, RECORD_DTYPE, session_path
+
+
+def make_records(directions, fps=10.0):
+    """Verilen yön kodlarıyla sabit aralıklı kayıtlar oluştur."""
+    records = np.zeros(len(directions), dtype=RECORD_DTYPE)
+    records["frame"] = np.arange(len(directions))
+    records["timestamp"] = np.arange(len(directions)) / fps
+    records["direction"] = directions
+    return records
+
+
+def write_session(path, records, start_epoch):
+    with TimelineWriter(path, start_epoch=start_epoch) as writer:
+        for record in records.tolist():
+            writer.append_record(record)
+
+
+# 10 s odak, 7 s uzak, 3 s odak, 2 s uzak (10 fps)
+PATTERN = [0] * 100 + [1] * 40 + [-1] * 30 + [0] * 30 + [2] * 20
+
+
+class TestAnalyzeRecords(unittest.TestCase):
+    """analyze_records fonksiyonu için unit testler."""
+
+    def test_focus_episodes_and_streak(self):
+        """Odak yüzdesi, bölümler ve en uzun seri süreye göre hesaplanmalı."""
+        stats = analyze_records(make_records(PATTERN), min_episode=6.0)
+        self.assertAlmostEqual(stats.duration, 22.0)
+        self.assertAlmostEqual(stats.focused, 13.0)
+        self.assertAlmostEqual(stats.focus_percent, 100 * 13 / 22)
+        self.assertEqual(stats.episodes, 1)
+        self.assertAlmostEqual(stats.episode_seconds, 7.0)
+        self.assertAlmostEqual(stats.longest_episode, 7.0)
+        self.assertAlmostEqual(stats.longest_streak, 10.0)
+
+        stats = analyze_records(make_records(PATTERN), min_episode=1.0)
+        self.assertEqual(stats.episodes, 2)
+        self.assertAlmostEqual(stats.episode_seconds, 9.0)
+
+    def test_gaps_are_capped(self):
+        """Kayıtlar arasındaki uzun boşluklar sınırlanmalı."""
+        durations = record_durations(np.array([0.0, 0.1, 60.0, 60.1]), max_gap=1.0)
+        np.testing.assert_allclose(durations, [0.1, 1.0, 0.1, 0.1])
+
+    def test_runs(self):
+        """Ardışık aynı değerler tek bölüm olmalı."""
+        values, seconds = runs(np.array([True, True, False, True]), np.array([1.0, 2.0, 3.0, 4.0]))
+        np.testing.assert_array_equal(values, [True, False, True])
+        np.testing.assert_array_equal(seconds, [3.0, 3.0, 4.0])
+
+    def test_empty(self):
+        """Kayıt yoksa sıfır dönmeli."""
+        stats = analyze_records(np.zeros(0, dtype=RECORD_DTYPE))
+        self.assertEqual(stats.duration, 0.0)
+        self.assertEqual(stats.focus_percent, 0.0)
+        self.assertEqual(stats.episodes, 0)
+
+    def test_hourly_split(self):
+        """Saat sınırını geçen oturum yerel saatlere bölünmeli."""
+        start = time.mktime((2025, 3, 4, 9, 59, 0, 0, 0, -1))
+        stats = analyze_records(make_records([0] * 600 + [1] * 600, fps=5.0), start_epoch=start)
+        self.assertAlmostEqual(stats.hourly_total[9], 60.0)
+        self.assertAlmostEqual(stats.hourly_focused[9], 60.0)
+        self.assertAlmostEqual(stats.hourly_total[10], 180.0)
+        self.assertAlmostEqual(stats.hourly_focused[10], 60.0)
+
+
+class TestAnalyzeSessions(unittest.TestCase):
+    """Dosyalar üzerinden toplu analiz için unit testler."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.start = time.mktime((2025, 3, 4, 14, 0, 0, 0, 0, -1))
+
+    def test_aggregates_directory(self):
+        """Klasördeki oturumlar toplanmalı."""
+        for day in range(3):
+            write_session(session_path(self.tmpdir.name, self.start + day * 86400),
+                          make_records(PATTERN), self.start + day * 86400)
+        with open(os.path.join(self.tmpdir.name, "notlar.txt"), "w") as f:
+            f.write("yok sayılmalı")
+
+        report = analyze_sessions([self.tmpdir.name], min_episode=6.0)
+        self.assertEqual(len(report.sessions), 3)
+        self.assertAlmostEqual(report.duration, 66.0)
+        self.assertAlmostEqual(report.focus_percent, 100 * 13 / 22)
+        self.assertEqual(report.episodes, 3)
+        self.assertAlmostEqual(report.longest_streak, 10.0)
+        self.assertAlmostEqual(report.hourly_total[14], 66.0)
+        self.assertTrue(np.isnan(report.hourly_percent[3]))
+
+    def test_many_sessions_fast(self):
+        """Çok sayıda oturum memmap ile hızlıca analiz edilmeli."""
+        records = make_records(np.tile(PATTERN, 50), fps=30.0)
+        for i in range(200):
+            write_session(os.path.join(self.tmpdir.name, f"s{i:04d}.timeline"), records, self.start + i * 3600)
+
+        started = time.perf_counter()
+        report = analyze_sessions([self.tmpdir.name])
+        elapsed = time.perf_counter() - started
+        self.assertEqual(len(report.sessions), 200)
+        self.assertEqual(sum(s.records for s in report.sessions), 200 * len(records))
+        self.assertLess(elapsed, 5.0)
+
+    def test_cli(self):
+        """CLI raporu yazdırmalı; oturum yoksa hata kodu dönmeli."""
+        write_session(session_path(self.tmpdir.name, self.start), make_records(PATTERN), self.start)
+        out = io.StringIO()
+        with redirect_stdout(out):
+            code = main([self.tmpdir.name, "--per-session", "--min-episode", "6"])
+        self.assertEqual(code, 0)
+        self.assertIn("Odak: %59.1", out.getvalue())
+        self.assertIn("14:00", out.getvalue())
+
+        empty = os.path.join(self.tmpdir.name, "bos")
+        os.mkdir(empty)
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(main([empty]), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
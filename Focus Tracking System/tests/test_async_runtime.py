@@ -0,0 +1,168 @@
+"""
+Unit tests for async_runtime module.
+"""
+
+import unittest
+import sys
+import os
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from async_runtime import AsyncRuntime, GROUP_VIDEO, GROUP_TIMER
+from frame_source import SyntheticSource
+from frame_scheduler import AdaptiveFrameScheduler
+from session_engine import FocusSession, EVENT_COMPLETED, EVENT_STOPPED
+
+
+def make_session(count, duration=3600.0):
+    source = SyntheticSource(count=count, width=160, height=120)
+    scheduler = AdaptiveFrameScheduler(min_skip=1, max_skip=1, enabled=True)
+    return FocusSession(source, duration, scheduler=scheduler, multi_face=False)
+
+
+class TestAsyncRuntime(unittest.TestCase):
+    """AsyncRuntime sınıfı için unit testler."""
+
+    def setUp(self):
+        self.runtime = AsyncRuntime(capture_threads=2, detection_threads=2).start()
+        self.addCleanup(self.runtime.shutdown)
+
+    def wait_until(self, predicate, timeout=20.0):
+        deadline = time.monotonic() + timeout
+        while not predicate():
+            if time.monotonic() > deadline:
+                self.fail("Zaman aşımı")
+            time.sleep(0.01)
+
+    def test_many_sessions_bounded_threads(self):
+        """Çok sayıda oturum sınırlı sayıda thread ile sonuna kadar çalışmalı."""
+        before = threading.active_count()
+        frames = []
+        sessions = [make_session(5) for _ in range(8)]
+        handles = [self.runtime.start_session(s, on_frame=lambda s, f, c: frames.append(c.index), fps=0)
+                   for s in sessions]
+
+        self.wait_until(lambda: all(h.tasks[GROUP_VIDEO].done() for h in handles))
+        self.assertLessEqual(threading.active_count() - before, self.runtime.thread_count())
+        self.assertEqual(len(frames), 40)
+        self.assertTrue(all(s.processed_count == 5 for s in sessions))
+        for session, handle in zip(sessions, handles):
+            self.runtime.stop_session(handle)
+            session.close()
+
+    def test_timer_completes_session(self):
+        """Süre sayacı coroutine'i süre dolunca oturumu tamamlamalı."""
+        session = make_session(100000, duration=0.3)
+        events = []
+        ticks = []
+        session.add_listener(events.append)
+        handle = self.runtime.start_session(session, on_tick=ticks.append, fps=30)
+        self.addCleanup(session.close)
+
+        self.wait_until(lambda: handle.done)
+        self.assertTrue(session.is_completed)
+        self.assertEqual(events[-1].kind, EVENT_COMPLETED)
+        self.assertEqual(ticks[0], 1)
+        self.assertEqual(ticks[-1], 0)
+        self.assertGreater(handle.pacer.ticks, 0)
+
+    def test_stop_session(self):
+        """stop_session() oturumu durdurmalı ve görevlerini iptal etmeli."""
+        session = make_session(100000)
+        events = []
+        session.add_listener(events.append)
+        handle = self.runtime.start_session(session, fps=30)
+        self.addCleanup(session.close)
+
+        self.runtime.stop_session(handle)
+        self.assertTrue(handle.done)
+        self.assertEqual(events[-1].kind, EVENT_STOPPED)
+
+    def test_frame_error_does_not_end_loop(self):
+        """Tek frame'deki hata sayılmalı ve video döngüsü sonraki frame'lerle devam etmeli."""
+        session = make_session(6)
+        self.addCleanup(session.close)
+        frames = []
+
+        def on_frame(session, frame, captured):
+            if captured.index == 2:
+                raise RuntimeError("analiz hatası")
+            frames.append(captured.index)
+        handle = self.runtime.start_session(session, on_frame=on_frame, fps=0)
+
+        self.wait_until(lambda: handle.tasks[GROUP_VIDEO].done())
+        self.assertIsNone(handle.tasks[GROUP_VIDEO].exception())
+        self.assertEqual(handle.errors, 1)
+        self.assertEqual(frames, [0, 1, 3, 4, 5])
+        self.runtime.stop_session(handle)
+
+    def test_stop_session_async(self):
+        """stop_session_async() beklemeden dönmeli ve temizliği son adımdan sonra yapmalı."""
+        session = make_session(100000)
+        self.addCleanup(session.close)
+        handle = self.runtime.start_session(session, fps=30)
+        stopped = []
+
+        future = self.runtime.stop_session_async(handle, on_stopped=lambda h: stopped.append(h.inflight.done()))
+        self.assertIsNone(future.result(5))
+        self.assertTrue(handle.done)
+        self.assertEqual(stopped, [True])
+
+    def test_stop_timeout_defers_release(self):
+        """Son adım süre içinde bitmezse TimeoutError dönmeli; temizlik adım bitince yapılmalı."""
+        session = make_session(100000)
+        self.addCleanup(session.close)
+        busy = threading.Event()
+        release = threading.Event()
+        cleaned = threading.Event()
+
+        def slow_frame(session, frame, captured):
+            busy.set()
+            release.wait(5)
+        handle = self.runtime.start_session(session, on_frame=slow_frame, fps=0)
+        self.assertTrue(busy.wait(5))
+
+        def on_stopped(h):
+            self.assertTrue(release.is_set())
+            cleaned.set()
+        future = self.runtime.stop_session_async(handle, timeout=0.05, on_stopped=on_stopped)
+        with self.assertRaises(TimeoutError):
+            future.result(5)
+        self.assertFalse(cleaned.is_set())
+
+        release.set()
+        self.assertTrue(cleaned.wait(5))
+
+    def test_sounds_run_in_order_on_one_thread(self):
+        """Ses işleri tek thread'de sırayla çalışmalı."""
+        calls = []
+        record = lambda name: calls.append((name, threading.current_thread().name))
+        futures = [self.runtime.play(record, name) for name in ("start", "alert", "stop")]
+        for future in futures:
+            future.result(5)
+
+        self.assertEqual([name for name, _ in calls], ["start", "alert", "stop"])
+        self.assertEqual(len({thread for _, thread in calls}), 1)
+
+    def test_shutdown_order(self):
+        """Kapatmada önce video döngüsü, sonra sayaç iptal edilmeli; başlamış ses işi bitmeli."""
+        session = make_session(100000)
+        self.addCleanup(session.close)
+        handle = self.runtime.start_session(session, fps=30)
+        order = []
+        for group in (GROUP_VIDEO, GROUP_TIMER):
+            handle.tasks[group].add_done_callback(lambda task, g=group: order.append(g))
+        sound = self.runtime.play(time.sleep, 0.1)
+
+        self.runtime.shutdown()
+        self.assertEqual(order, [GROUP_VIDEO, GROUP_TIMER])
+        self.assertIsNone(sound.result(0))
+        self.assertFalse(self.runtime.is_running)
+        with self.assertRaises(RuntimeError):
+            self.runtime.play(time.sleep, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
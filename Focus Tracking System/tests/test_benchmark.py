@@ -0,0 +1,78 @@
+"""
+Unit tests for benchmark module.
+"""
+
+import unittest
+import sys
+import os
+import json
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmark import summarize, run_suite, compare, parse_resolution, main
+
+
+class TestBenchmark(unittest.TestCase):
+    """Benchmark testleri."""
+
+    def test_summarize(self):
+        """Özet istatistikler milisaniye cinsinden olmalı."""
+        stats = summarize([0.001] * 99 + [0.1])
+
+        self.assertEqual(stats["count"], 100)
+        self.assertAlmostEqual(stats["p50_ms"], 1.0)
+        self.assertGreater(stats["p99_ms"], stats["p95_ms"] - 1e-9)
+        self.assertGreater(stats["throughput_fps"], 0)
+
+    def test_summarize_empty(self):
+        """Boş örnek listesi hata vermemeli."""
+        self.assertEqual(summarize([]), {"count": 0})
+
+    def test_parse_resolution(self):
+        """Çözünürlük metni ayrıştırılmalı."""
+        self.assertEqual(parse_resolution("640x480"), (640, 480))
+
+    def test_run_suite(self):
+        """Tüm aşamalar ve döngü ölçümleri raporda olmalı."""
+        report = run_suite(frame_count=3, resolutions=[(160, 120)], skips=[1, 2],
+                           sensitivities=[0.25])
+
+        results = report["results"]
+        self.assertIn("160x120/sens=0.25/stage/analyze", results)
+        self.assertIn("160x120/sens=0.25/stage/face_detect", results)
+        self.assertIn("160x120/sens=0.25/loop/skip=2", results)
+        self.assertEqual(results["160x120/sens=0.25/loop/skip=1"]["count"], 3)
+        self.assertEqual(report["meta"]["source"], "synthetic")
+
+    def test_compare_detects_regression(self):
+        """Eşiği aşan yavaşlama raporlanmalı."""
+        baseline = {"results": {"a": {"p95_ms": 10.0}, "b": {"p95_ms": 10.0}}}
+        current = {"results": {"a": {"p95_ms": 15.0}, "b": {"p95_ms": 11.0}, "c": {"p95_ms": 1.0}}}
+
+        regressions = compare(current, baseline, tolerance=0.2)
+
+        self.assertEqual([r["name"] for r in regressions], ["a"])
+        self.assertAlmostEqual(regressions[0]["ratio"], 1.5)
+
+    def test_cli_baseline(self):
+        """Referansa göre yavaşlama varsa çıkış kodu 1 olmalı."""
+        with tempfile.TemporaryDirectory() as folder:
+            output = os.path.join(folder, "sonuc.json")
+            args = ["--frames", "2", "--resolutions", "160x120", "--skips", "1"]
+            self.assertEqual(main(args + ["--output", output]), 0)
+
+            with open(output) as f:
+                report = json.load(f)
+            for stats in report["results"].values():
+                if "p95_ms" in stats:
+                    stats["p95_ms"] /= 1000.0
+            baseline = os.path.join(folder, "referans.json")
+            with open(baseline, "w") as f:
+                json.dump(report, f)
+
+            self.assertEqual(main(args + ["--baseline", baseline]), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+"""
+Unit tests for clock module.
+"""
+
+import unittest
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from clock import MonotonicClock, ScaledClock, SimulatedClock, create_clock
+from frame_scheduler import FramePacer
+
+
+class TestSimulatedClock(unittest.TestCase):
+    """SimulatedClock sınıfı için unit testler."""
+
+    def test_sleep_advances_without_waiting(self):
+        """sleep() beklemeden saati ilerletmeli."""
+        clock = SimulatedClock(start=5.0)
+        start = time.perf_counter()
+        clock.sleep(3600)
+        self.assertLess(time.perf_counter() - start, 0.1)
+        self.assertEqual(clock(), 3605.0)
+
+    def test_never_goes_back(self):
+        """Saat geriye alınamamalı."""
+        clock = SimulatedClock()
+        clock.advance(10)
+        clock.advance(-5)
+        clock.advance_to(3)
+        self.assertEqual(clock(), 10)
+        clock.advance_to(12)
+        self.assertEqual(clock(), 12)
+
+    def test_drives_pacer(self):
+        """FramePacer simüle saatle beklemeden adımlanmalı."""
+        clock = SimulatedClock()
+        pacer = FramePacer(fps=30, clock=clock, sleep=clock.sleep)
+        for _ in range(300):
+            pacer.wait()
+        self.assertAlmostEqual(clock(), 10.0, places=6)
+
+
+class TestScaledClock(unittest.TestCase):
+    """ScaledClock sınıfı için unit testler."""
+
+    def test_runs_faster_than_real_time(self):
+        """Saat gerçek zamanın speed katı hızında akmalı."""
+        clock = ScaledClock(speed=100)
+        start = time.perf_counter()
+        clock.sleep(2.0)
+        real = time.perf_counter() - start
+
+        self.assertGreaterEqual(clock(), 2.0)
+        self.assertLess(real, 0.5)
+
+    def test_invalid_speed(self):
+        """Pozitif olmayan hız ValueError fırlatmalı."""
+        with self.assertRaises(ValueError):
+            ScaledClock(speed=0)
+
+
+class TestCreateClock(unittest.TestCase):
+    """create_clock fonksiyonu için unit testler."""
+
+    def test_create_clock(self):
+        """Hız çarpanına göre doğru saat seçilmeli."""
+        self.assertIsInstance(create_clock(1), MonotonicClock)
+        self.assertIsInstance(create_clock(0), SimulatedClock)
+        self.assertIsInstance(create_clock(50), ScaledClock)
+
+
+if __name__ == '__main__':
+    unittest.main()
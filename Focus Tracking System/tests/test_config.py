@@ -46,11 +46,31 @@ class TestConfig(unittest.TestCase):
         self.assertIsInstance(config.DISTRACTION_THRESHOLD, int)
         self.assertGreater(config.DISTRACTION_THRESHOLD, 0)
     
+    def test_distraction_seconds(self):
+        """Süre tabanlı dikkat eşiklerinin geçerli olduğunu test et."""
+        self.assertGreater(config.DISTRACTION_SECONDS, 0)
+        self.assertGreaterEqual(config.REFOCUS_SECONDS, 0)
+        self.assertLess(config.REFOCUS_SECONDS, config.DISTRACTION_SECONDS)
+    
+    def test_multi_face(self):
+        """Çok yüzlü mod ayarlarının geçerli olduğunu test et."""
+        self.assertIsInstance(config.MULTI_FACE_MODE, bool)
+        self.assertGreater(config.MULTI_FACE_IOU_THRESHOLD, 0)
+        self.assertLessEqual(config.MULTI_FACE_IOU_THRESHOLD, 1)
+        self.assertGreaterEqual(config.MULTI_FACE_MAX_MISSED, 0)
+    
     def test_frame_skip(self):
         """FRAME_SKIP değerinin geçerli olduğunu test et."""
         self.assertIsInstance(config.FRAME_SKIP, int)
         self.assertGreaterEqual(config.FRAME_SKIP, 1)
     
+    def test_adaptive_scheduling(self):
+        """Uyarlanabilir işleme ayarlarının geçerli olduğunu test et."""
+        self.assertIsInstance(config.ADAPTIVE_SCHEDULING, bool)
+        self.assertGreaterEqual(config.ADAPTIVE_MIN_SKIP, 1)
+        self.assertGreaterEqual(config.ADAPTIVE_MAX_SKIP, config.ADAPTIVE_MIN_SKIP)
+        self.assertGreaterEqual(config.ADAPTIVE_MARGIN, 0)
+    
     def test_target_fps(self):
         """TARGET_FPS değerinin geçerli olduğunu test et."""
         self.assertIsInstance(config.TARGET_FPS, int)
@@ -64,6 +84,58 @@ class TestConfig(unittest.TestCase):
         self.assertGreater(config.WEBCAM_WIDTH, 0)
         self.assertGreater(config.WEBCAM_HEIGHT, 0)
     
+    def test_face_tracking(self):
+        """Yüz takip ayarlarının geçerli olduğunu test et."""
+        self.assertIsInstance(config.FACE_TRACKING, bool)
+        self.assertIsInstance(config.FACE_REDETECT_INTERVAL, int)
+        self.assertGreaterEqual(config.FACE_REDETECT_INTERVAL, 1)
+        self.assertGreaterEqual(config.FACE_TRACKING_PADDING, 0)
+    
+    def test_detection_scale(self):
+        """DETECTION_SCALE değerinin geçerli olduğunu test et."""
+        self.assertIsInstance(config.DETECTION_SCALE, (int, float))
+        self.assertGreater(config.DETECTION_SCALE, 0)
+        self.assertLessEqual(config.DETECTION_SCALE, 1)
+    
+    def test_detector_backend(self):
+        """DETECTOR_BACKEND değerinin geçerli olduğunu test et."""
+        self.assertIn(config.DETECTOR_BACKEND, ['haar', 'lbp', 'dnn'])
+        self.assertGreater(config.DNN_CONFIDENCE, 0)
+        self.assertLessEqual(config.DNN_CONFIDENCE, 1)
+    
+    def test_pupil_method(self):
+        """PUPIL_METHOD değerinin geçerli olduğunu test et."""
+        self.assertIn(config.PUPIL_METHOD, ['external', 'components', 'moments', 'contours'])
+    
+    def test_instrumentation(self):
+        """Süre ölçümü ayarlarının geçerli olduğunu test et."""
+        self.assertIsInstance(config.INSTRUMENTATION_ENABLED, bool)
+        self.assertIsInstance(config.INSTRUMENTATION_WINDOW, int)
+        self.assertGreater(config.INSTRUMENTATION_WINDOW, 0)
+    
+    def test_preview_refresh(self):
+        """PREVIEW_REFRESH_MS değerinin geçerli olduğunu test et."""
+        self.assertIsInstance(config.PREVIEW_REFRESH_MS, int)
+        self.assertGreater(config.PREVIEW_REFRESH_MS, 0)
+    
+    def test_capture_buffer_size(self):
+        """CAPTURE_BUFFER_SIZE değerinin geçerli olduğunu test et."""
+        self.assertIsInstance(config.CAPTURE_BUFFER_SIZE, int)
+        self.assertGreaterEqual(config.CAPTURE_BUFFER_SIZE, 1)
+    
+    def test_detector_processes(self):
+        """DETECTOR_PROCESSES değerinin geçerli olduğunu test et."""
+        self.assertIsInstance(config.DETECTOR_PROCESSES, int)
+        self.assertGreaterEqual(config.DETECTOR_PROCESSES, 0)
+        self.assertGreater(config.DETECTOR_TIMEOUT, 0)
+    
+    def test_timeline_settings(self):
+        """Zaman çizelgesi ayarlarının geçerli olduğunu test et."""
+        self.assertIsInstance(config.TIMELINE_ENABLED, bool)
+        self.assertIsInstance(config.TIMELINE_DIR, str)
+        self.assertGreaterEqual(config.TIMELINE_FLUSH_RECORDS, 1)
+        self.assertGreater(config.TIMELINE_FLUSH_INTERVAL, 0)
+    
     def test_window_size(self):
         """Pencere boyutlarının geçerli olduğunu test et."""
         self.assertIsInstance(config.WINDOW_SIZE, tuple)
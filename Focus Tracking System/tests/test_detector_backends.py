@@ -0,0 +1,125 @@
+"""
+Unit tests for detector_backends module.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from detector_backends import (
+    BACKENDS,
+    DetectorBackend,
+    HaarBackend,
+    LBPBackend,
+    DnnBackend,
+    create_backend,
+    load_frames,
+    benchmark_backends
+)
+from gaze_detector import GazeDetector
+import config
+
+
+class TestDetectorBackends(unittest.TestCase):
+    """Arka uç seçimi ve oluşturma testleri."""
+
+    def test_create_default_backend(self):
+        """Varsayılan arka uç Haar olmalı."""
+        backend = create_backend()
+        self.assertIsInstance(backend, HaarBackend)
+        backend.release()
+
+    def test_create_unknown_backend(self):
+        """Bilinmeyen arka uç adı hata vermeli."""
+        with self.assertRaises(ValueError):
+            create_backend("yok")
+
+    def test_registered_backends(self):
+        """Tüm arka uçlar kayıtlı olmalı."""
+        self.assertEqual(set(BACKENDS), {"haar", "lbp", "dnn"})
+
+    def test_missing_lbp_cascade(self):
+        """Eksik LBP dosyası anlaşılır bir hata vermeli."""
+        with self.assertRaises(FileNotFoundError):
+            LBPBackend(face_cascade_path="olmayan_dosya.xml")
+
+    def test_missing_dnn_model(self):
+        """Eksik DNN modeli anlaşılır bir hata vermeli."""
+        with self.assertRaises(FileNotFoundError):
+            DnnBackend(prototxt="olmayan.prototxt", model="olmayan.caffemodel")
+
+    def test_haar_black_frame(self):
+        """Siyah frame'de yüz bulunmamalı."""
+        backend = HaarBackend()
+        faces = backend.detect_faces(np.zeros((240, 320), dtype=np.uint8))
+        self.assertEqual(len(faces), 0)
+
+    def test_gaze_detector_accepts_backend_instance(self):
+        """GazeDetector hazır arka uç nesnesini kullanabilmeli."""
+        backend = HaarBackend()
+        detector = GazeDetector(backend=backend)
+
+        self.assertIs(detector.backend, backend)
+        self.assertIs(detector.face_cascade, backend.face_cascade)
+        detector.release()
+
+    def test_gaze_detector_custom_backend(self):
+        """GazeDetector DetectorBackend alt sınıflarıyla çalışmalı."""
+        class StaticBackend(DetectorBackend):
+            def detect_faces(self, gray):
+                return np.array([[10, 10, 40, 40]])
+
+            def detect_eyes(self, face_gray):
+                return ()
+
+        detector = GazeDetector(backend=StaticBackend(), detection_scale=1.0)
+        result = detector.analyze(np.zeros((100, 100, 3), dtype=np.uint8))
+
+        self.assertEqual(result.face, (10, 10, 40, 40))
+        self.assertIsNone(detector.face_cascade)
+
+
+class TestBackendBenchmark(unittest.TestCase):
+    """Arka uç karşılaştırma testleri."""
+
+    def test_benchmark_report(self):
+        """Karşılaştırma raporu hız ve tespit oranı içermeli."""
+        frames = [np.zeros((120, 160, 3), dtype=np.uint8)] * 3
+
+        report = benchmark_backends(frames, ["haar"])
+
+        self.assertIn("haar", report)
+        self.assertEqual(report["haar"]["detection_rate"], 0.0)
+        self.assertGreater(report["haar"]["ms_per_frame"], 0.0)
+
+    def test_benchmark_unavailable_backend(self):
+        """Kullanılamayan arka uç raporda hata olarak görünmeli."""
+        frames = [np.zeros((120, 160, 3), dtype=np.uint8)]
+
+        report = benchmark_backends(frames, ["dnn"])
+
+        if not os.path.exists(config.DNN_FACE_MODEL):
+            self.assertIn("error", report["dnn"])
+        else:
+            self.assertIn("fps", report["dnn"])
+
+    def test_load_frames_from_folder(self):
+        """Resim klasöründen frame okunabilmeli."""
+        with tempfile.TemporaryDirectory() as folder:
+            for i in range(3):
+                cv2.imwrite(os.path.join(folder, f"{i:03d}.png"), np.zeros((20, 30, 3), dtype=np.uint8))
+
+            frames = load_frames(folder, limit=2)
+
+        self.assertEqual(len(frames), 2)
+        self.assertEqual(frames[0].shape, (20, 30, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
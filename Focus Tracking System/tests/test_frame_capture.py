@@ -0,0 +1,137 @@
+"""
+Unit tests for frame_capture module.
+"""
+
+import unittest
+import sys
+import os
+import time
+import threading
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from frame_capture import LatestFrameCapture, CapturedFrame
+
+
+class FakeCamera:
+    """Her read() çağrısında artan numaralı frame döndüren sahte kamera."""
+
+    def __init__(self, fail_first: int = 0):
+        self.counter = 0
+        self.fail_first = fail_first
+        self.props = {}
+        self.gate = threading.Semaphore(0)
+
+    def set(self, prop, value):
+        self.props[prop] = value
+        return True
+
+    def read(self):
+        self.gate.acquire()
+        if self.fail_first > 0:
+            self.fail_first -= 1
+            return False, None
+        frame = np.full((4, 4, 3), self.counter % 256, dtype=np.uint8)
+        self.counter += 1
+        return True, frame
+
+    def release_frames(self, count: int):
+        for _ in range(count):
+            self.gate.release()
+
+
+def wait_until(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.002)
+    return False
+
+
+class TestLatestFrameCapture(unittest.TestCase):
+    """LatestFrameCapture sınıfı için unit testler."""
+
+    def setUp(self):
+        self.camera = FakeCamera()
+        self.capture = LatestFrameCapture(self.camera, buffer_size=2)
+        self.capture.start()
+
+    def tearDown(self):
+        self.camera.release_frames(10)
+        self.capture.stop()
+
+    def test_sets_driver_buffer_size(self):
+        """Sürücü tamponu 1 frame'e indirilmeli."""
+        import cv2
+        self.assertEqual(self.camera.props.get(cv2.CAP_PROP_BUFFERSIZE), 1)
+
+    def test_returns_newest_frame(self):
+        """Okuyucu geride kaldığında en yeni frame verilmeli."""
+        self.camera.release_frames(5)
+        self.assertTrue(wait_until(lambda: self.capture.captured_count == 5))
+
+        captured = self.capture.read(timeout=1.0)
+
+        self.assertIsInstance(captured, CapturedFrame)
+        self.assertEqual(captured.index, 4)
+        self.assertEqual(int(captured.frame[0, 0, 0]), 4)
+        self.assertGreaterEqual(captured.age, 0.0)
+
+    def test_counts_dropped_frames(self):
+        """Okunmadan geçilen frame'ler sayılmalı."""
+        self.camera.release_frames(3)
+        self.assertTrue(wait_until(lambda: self.capture.captured_count == 3))
+        self.capture.read(timeout=1.0)
+
+        self.camera.release_frames(1)
+        self.capture.read(timeout=1.0)
+
+        stats = self.capture.stats()
+        self.assertEqual(stats["captured"], 4)
+        self.assertEqual(stats["dropped"], 2)
+
+    def test_same_frame_not_returned_twice(self):
+        """Yeni frame yoksa read() zaman aşımında None döndürmeli."""
+        self.camera.release_frames(1)
+        self.assertIsNotNone(self.capture.read(timeout=1.0))
+        self.assertIsNone(self.capture.read(timeout=0.05))
+
+    def test_stop_wakes_reader(self):
+        """stop() bekleyen okuyucuyu uyandırmalı."""
+        results = []
+        reader = threading.Thread(target=lambda: results.append(self.capture.read(timeout=5.0)))
+        reader.start()
+        time.sleep(0.05)
+
+        self.camera.release_frames(1)
+        self.capture.read(timeout=0)
+        self.capture.stop(timeout=0.1)
+        reader.join(1.0)
+
+        self.assertFalse(reader.is_alive())
+
+
+class TestFailedReads(unittest.TestCase):
+    """Okuma hataları için unit testler."""
+
+    def test_failed_reads_counted(self):
+        """Başarısız okumalar sayılmalı, sonraki frame yine verilmeli."""
+        camera = FakeCamera(fail_first=2)
+        capture = LatestFrameCapture(camera, buffer_size=1)
+        capture.start()
+        try:
+            camera.release_frames(3)
+            captured = capture.read(timeout=1.0)
+            self.assertIsNotNone(captured)
+            self.assertEqual(captured.index, 0)
+            self.assertEqual(capture.stats()["failed_reads"], 2)
+        finally:
+            camera.release_frames(5)
+            capture.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
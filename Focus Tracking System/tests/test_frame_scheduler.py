@@ -0,0 +1,133 @@
+"""
+Unit tests for frame_scheduler module.
+"""
+
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from frame_scheduler import AdaptiveFrameScheduler, FramePacer
+from gaze_detector import GazeResult
+from clock import SimulatedClock
+import config
+
+
+STEADY = GazeResult(face=(0, 0, 10, 10), avg_ratio=0.50, direction="merkez", is_looking=True)
+NEAR_LIMIT = GazeResult(face=(0, 0, 10, 10), avg_ratio=0.61, direction="merkez", is_looking=True)
+NO_FACE = GazeResult()
+NO_EYES = GazeResult(face=(0, 0, 10, 10))
+
+
+class TestAdaptiveFrameScheduler(unittest.TestCase):
+    """AdaptiveFrameScheduler sınıfı için unit testler."""
+
+    def setUp(self):
+        """Her test öncesi çalışır."""
+        self.scheduler = AdaptiveFrameScheduler(min_skip=1, max_skip=4, margin=0.05, enabled=True)
+
+    def processed_count(self, frames):
+        return sum(self.scheduler.should_process() for _ in range(frames))
+
+    def test_starts_at_min_skip(self):
+        """Başlangıçta her frame işlenmeli."""
+        self.assertEqual(self.processed_count(5), 5)
+
+    def test_steady_gaze_ramps_down(self):
+        """Kararlı bakışta aralık max_skip'e kadar artmalı."""
+        for _ in range(10):
+            self.scheduler.update(STEADY, sensitivity=0.25)
+
+        self.assertEqual(self.scheduler.interval, 4)
+        self.assertEqual(self.processed_count(8), 2)
+
+    def test_near_limit_resets(self):
+        """Oran sınıra yaklaşınca her frame işlenmeli."""
+        for _ in range(10):
+            self.scheduler.update(STEADY, sensitivity=0.25)
+        self.scheduler.update(NEAR_LIMIT, sensitivity=0.25)
+
+        self.assertEqual(self.scheduler.interval, 1)
+
+    def test_face_or_eyes_lost_resets(self):
+        """Yüz veya göz kaybolunca her frame işlenmeli."""
+        for lost in (NO_FACE, NO_EYES):
+            for _ in range(10):
+                self.scheduler.update(STEADY, sensitivity=0.25)
+            self.scheduler.update(lost, sensitivity=0.25)
+            self.assertEqual(self.scheduler.interval, 1)
+
+    def test_disabled_uses_frame_skip(self):
+        """Kapalıyken sabit FRAME_SKIP aralığı kullanılmalı."""
+        scheduler = AdaptiveFrameScheduler(enabled=False)
+        scheduler.update(STEADY, sensitivity=0.25)
+
+        self.assertEqual(scheduler.interval, config.FRAME_SKIP)
+        processed = [scheduler.should_process() for _ in range(config.FRAME_SKIP * 3)]
+        self.assertEqual(sum(processed), 3)
+
+    def test_reset(self):
+        """reset sonrası başlangıç aralığına dönmeli."""
+        for _ in range(10):
+            self.scheduler.update(STEADY, sensitivity=0.25)
+        self.scheduler.reset()
+
+        self.assertEqual(self.scheduler.interval, 1)
+
+    def test_max_not_below_min(self):
+        """max_skip min_skip'ten küçük olamaz."""
+        scheduler = AdaptiveFrameScheduler(min_skip=3, max_skip=1, enabled=True)
+        self.assertEqual(scheduler.max_skip, 3)
+
+
+class TestFramePacer(unittest.TestCase):
+    """FramePacer sınıfı için unit testler."""
+
+    def setUp(self):
+        """Her test öncesi çalışır."""
+        self.clock = SimulatedClock()
+        self.pacer = FramePacer(fps=10, clock=self.clock, sleep=self.clock.sleep)
+
+    def test_work_time_subtracted_from_sleep(self):
+        """Bekleme süresi, iş süresi kadar kısalmalı."""
+        self.clock.advance(0.03)
+        self.assertEqual(self.pacer.wait(), 0)
+        self.assertAlmostEqual(self.clock(), 0.1)
+
+    def test_no_drift_over_many_ticks(self):
+        """Hedef zamanlar birikimli kaymamalı."""
+        for _ in range(100):
+            self.clock.advance(0.04)
+            self.pacer.wait()
+        self.assertAlmostEqual(self.clock(), 10.0, places=6)
+
+    def test_skips_missed_deadlines_when_behind(self):
+        """Geride kalındığında kaçırılan hedefler atlanmalı ve sayılmalı."""
+        self.clock.advance(0.35)
+        self.assertEqual(self.pacer.wait(), 2)
+        self.assertEqual(self.pacer.missed_deadlines, 2)
+
+        self.pacer.wait()
+        self.assertAlmostEqual(self.clock(), 0.4)
+
+    def test_stats(self):
+        """Ulaşılan FPS ve titreme raporlanmalı."""
+        self.assertNotIn("achieved_fps", self.pacer.stats())
+        for _ in range(20):
+            self.clock.advance(0.01)
+            self.pacer.wait()
+
+        stats = self.pacer.stats()
+        self.assertEqual(stats["target_fps"], 10)
+        self.assertEqual(stats["ticks"], 20)
+        self.assertAlmostEqual(stats["achieved_fps"], 10.0, places=3)
+        self.assertAlmostEqual(stats["jitter_ms"], 0.0, places=3)
+
+    def test_invalid_fps(self):
+        """Pozitif olmayan fps ValueError fırlatmalı."""
+        with self.assertRaises(ValueError):
+            FramePacer(fps=0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,169 @@
+"""
+Unit tests for frame_source module.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from frame_source import (
+    FrameSource, VideoFileSource, ImageFolderSource, SyntheticSource, open_source
+)
+from frame_scheduler import AdaptiveFrameScheduler
+from session_engine import FocusSession
+from clock import SimulatedClock
+
+
+def read_all(source):
+    frames = []
+    while True:
+        captured = source.read()
+        if captured is None:
+            return frames
+        frames.append(captured)
+
+
+class TestSyntheticSource(unittest.TestCase):
+    """SyntheticSource sınıfı için unit testler."""
+
+    def test_timestamps_and_exhaustion(self):
+        """Zaman damgaları index / fps olmalı, kaynak bitince None dönmeli."""
+        source = SyntheticSource(count=4, width=160, height=120, fps=20)
+        frames = read_all(source)
+
+        self.assertEqual([f.index for f in frames], [0, 1, 2, 3])
+        self.assertEqual([f.timestamp for f in frames], [0.0, 0.05, 0.1, 0.15])
+        self.assertEqual(frames[0].frame.shape, (120, 160, 3))
+        self.assertTrue(source.exhausted)
+        self.assertIsNone(source.read())
+
+    def test_deterministic(self):
+        """Aynı tohum aynı frame'leri üretmeli."""
+        a = SyntheticSource(count=2, width=160, height=120, seed=3).read()
+        b = SyntheticSource(count=2, width=160, height=120, seed=3).read()
+        np.testing.assert_array_equal(a.frame, b.frame)
+
+    def test_realtime_pacing(self):
+        """Realtime modda frame'ler fps hızında verilmeli."""
+        clock = SimulatedClock()
+        source = SyntheticSource(count=5, width=160, height=120, fps=10, realtime=True,
+                                 clock=clock, sleep=clock.sleep)
+        read_all(source)
+        self.assertAlmostEqual(clock(), 0.4)
+
+    def test_as_fast_as_possible(self):
+        """Realtime kapalıyken beklenmemeli."""
+        clock = SimulatedClock()
+        source = SyntheticSource(count=5, width=160, height=120, fps=10,
+                                 clock=clock, sleep=clock.sleep)
+        read_all(source)
+        self.assertEqual(clock(), 0.0)
+
+
+class TestFileSources(unittest.TestCase):
+    """Dosya tabanlı kaynaklar için unit testler."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Test videosunu ve resim klasörünü oluştur."""
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        cls.video = os.path.join(cls.tmpdir.name, "oturum.avi")
+        writer = cv2.VideoWriter(cls.video, cv2.VideoWriter_fourcc(*"MJPG"), 10, (160, 120))
+        for i in range(6):
+            writer.write(np.full((120, 160, 3), i * 30, dtype=np.uint8))
+        writer.release()
+
+        cls.folder = os.path.join(cls.tmpdir.name, "resimler")
+        os.makedirs(cls.folder)
+        for i in range(3):
+            cv2.imwrite(os.path.join(cls.folder, f"{i:03d}.png"), np.full((40, 60, 3), i, dtype=np.uint8))
+        with open(os.path.join(cls.folder, "notlar.txt"), "w") as f:
+            f.write("resim değil")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmpdir.cleanup()
+
+    def test_video_file(self):
+        """Video frame'leri videonun FPS'ine göre zaman damgası almalı."""
+        with VideoFileSource(self.video) as source:
+            frames = read_all(source)
+        self.assertEqual(len(frames), 6)
+        self.assertAlmostEqual(frames[3].timestamp, 0.3)
+
+    def test_video_loop(self):
+        """loop açıkken video başa sarılmalı ve sıra numarası artmaya devam etmeli."""
+        with VideoFileSource(self.video, loop=True) as source:
+            frames = [source.read() for _ in range(8)]
+        self.assertEqual(frames[-1].index, 7)
+        np.testing.assert_array_equal(frames[6].frame, frames[0].frame)
+
+    def test_missing_video(self):
+        """Açılamayan video IOError fırlatmalı."""
+        with self.assertRaises(IOError):
+            VideoFileSource(os.path.join(self.tmpdir.name, "yok.avi"))
+
+    def test_image_folder(self):
+        """Klasördeki resimler ad sırasıyla verilmeli, diğer dosyalar atlanmalı."""
+        source = ImageFolderSource(self.folder, fps=5)
+        frames = read_all(source)
+        self.assertEqual([int(f.frame[0, 0, 0]) for f in frames], [0, 1, 2])
+        self.assertAlmostEqual(frames[2].timestamp, 0.4)
+
+    def test_image_folder_loop(self):
+        """loop açıkken resimler tekrar etmeli."""
+        source = ImageFolderSource(self.folder, loop=True)
+        values = [int(source.read().frame[0, 0, 0]) for _ in range(5)]
+        self.assertEqual(values, [0, 1, 2, 0, 1])
+
+    def test_image_folder_loop_unreadable(self):
+        """loop açıkken hiçbir resim okunamıyorsa kaynak sonsuz döngüye girmeden bitmeli."""
+        folder = os.path.join(self.tmpdir.name, "bozuk")
+        os.makedirs(folder)
+        for i in range(3):
+            with open(os.path.join(folder, f"{i:03d}.png"), "wb") as f:
+                f.write(b"png degil" * i)
+        source = ImageFolderSource(folder, loop=True)
+        self.assertIsNone(source.read())
+        self.assertTrue(source.exhausted)
+
+    def test_open_source(self):
+        """Tanımdan doğru kaynak türü seçilmeli."""
+        self.assertIsInstance(open_source(self.folder), ImageFolderSource)
+        self.assertIsInstance(open_source(self.video), VideoFileSource)
+        synthetic = open_source("synthetic:7")
+        self.assertIsInstance(synthetic, SyntheticSource)
+        self.assertEqual(synthetic.count, 7)
+
+
+class TestSessionWithSource(unittest.TestCase):
+    """Kaynakların oturum motoruyla kullanımı için testler."""
+
+    def test_headless_session_on_synthetic_source(self):
+        """Sentetik kaynakla oturum kamera olmadan sonuna kadar çalışmalı."""
+        source = SyntheticSource(count=12, width=320, height=240)
+        scheduler = AdaptiveFrameScheduler(min_skip=1, max_skip=1, enabled=True)
+        session = FocusSession(source, 3600, scheduler=scheduler, multi_face=False)
+        try:
+            session.run()
+        finally:
+            session.close()
+
+        self.assertTrue(source.exhausted)
+        self.assertEqual(session.frame_count, 12)
+        self.assertEqual(session.processed_count, 12)
+
+    def test_base_class_is_abstract(self):
+        """Temel sınıf doğrudan okunamamalı."""
+        with self.assertRaises(NotImplementedError):
+            FrameSource().read()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,11 +5,12 @@ Unit tests for GazeDetector module.
 import unittest
 import sys
 import os
+import cv2
 import numpy as np
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from gaze_detector import GazeDetector
+from gaze_detector import GazeDetector, GazeResult
 
 
 class TestGazeDetector(unittest.TestCase):
@@ -97,6 +98,216 @@ class TestGazeDetector(unittest.TestCase):
         self.detector.release()
 
 
+class FakeCascade:
+    """detectMultiScale çağrılarını kaydeden sahte cascade."""
+    
+    def __init__(self, box=None):
+        self.box = box
+        self.calls = []
+    
+    def detectMultiScale(self, image, *args, **kwargs):
+        self.calls.append(image.shape)
+        if self.box is None:
+            return ()
+        x, y, w, h = self.box
+        if image.shape[0] < y + h or image.shape[1] < x + w:
+            return np.array([[0, 0, w, h]])
+        return np.array([self.box])
+
+
+class TestFaceTracking(unittest.TestCase):
+    """Yüz takip modu testleri."""
+    
+    def setUp(self):
+        """Her test öncesi çalışır."""
+        self.detector = GazeDetector(tracking=True, detection_scale=1.0)
+        self.detector.redetect_interval = 3
+        self.detector.tracking_padding = 0.5
+        self.detector.face_cascade = FakeCascade(box=(200, 150, 100, 100))
+        self.detector.eye_cascade = FakeCascade()
+        self.frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    
+    def tearDown(self):
+        """Her test sonrası çalışır."""
+        self.detector.release()
+    
+    def test_tracking_searches_window(self):
+        """Tespitten sonra sadece yüz çevresindeki pencere taranmalı."""
+        self.detector.process_frame(self.frame)
+        self.detector.process_frame(self.frame)
+        
+        calls = self.detector.face_cascade.calls
+        self.assertEqual(calls[0], (480, 640))
+        self.assertEqual(calls[1], (200, 200))
+        self.assertTrue(self.detector.is_face_detected())
+    
+    def test_periodic_full_redetect(self):
+        """Her redetect_interval frame'de bir tam tarama yapılmalı."""
+        for _ in range(5):
+            self.detector.process_frame(self.frame)
+        
+        full_scans = [c for c in self.detector.face_cascade.calls if c == (480, 640)]
+        self.assertEqual(len(full_scans), 2)
+    
+    def test_lost_tracking_falls_back(self):
+        """Takip kaybolunca aynı frame'de tam tarama yapılmalı."""
+        self.detector.process_frame(self.frame)
+        self.detector.face_cascade.box = None
+        self.detector.process_frame(self.frame)
+        
+        calls = self.detector.face_cascade.calls
+        self.assertEqual(calls[1:], [(200, 200), (480, 640)])
+        self.assertFalse(self.detector.is_face_detected())
+    
+    def test_tracking_disabled(self):
+        """Takip kapalıyken her frame tam taranmalı."""
+        self.detector.tracking = False
+        for _ in range(3):
+            self.detector.process_frame(self.frame)
+        
+        self.assertEqual(self.detector.face_cascade.calls, [(480, 640)] * 3)
+    
+    def test_reset_tracking(self):
+        """reset_tracking sonrası tam tarama yapılmalı."""
+        self.detector.process_frame(self.frame)
+        self.detector.reset_tracking()
+        self.detector.process_frame(self.frame)
+        
+        self.assertEqual(self.detector.face_cascade.calls[1], (480, 640))
+
+
+class TestDetectionScale(unittest.TestCase):
+    """Küçültülmüş çözünürlükte yüz tespiti testleri."""
+    
+    def test_face_detected_on_downscaled_frame(self):
+        """Yüz tespiti küçültülmüş frame üzerinde yapılmalı."""
+        detector = GazeDetector(tracking=False, detection_scale=0.5)
+        detector.face_cascade = FakeCascade(box=(100, 75, 50, 50))
+        detector.eye_cascade = FakeCascade()
+        
+        detector.process_frame(np.zeros((480, 640, 3), dtype=np.uint8))
+        
+        self.assertEqual(detector.face_cascade.calls, [(240, 320)])
+        self.assertEqual(detector.eye_cascade.calls, [(50, 100)])
+        detector.release()
+    
+    def test_boxes_mapped_to_full_resolution(self):
+        """Bulunan kutular tam çözünürlüğe geri ölçeklenmeli."""
+        detector = GazeDetector(detection_scale=0.25)
+        detector.face_cascade = FakeCascade(box=(50, 30, 25, 25))
+        
+        faces = detector._detect_faces(np.zeros((480, 640), dtype=np.uint8))
+        
+        self.assertEqual(tuple(faces[0]), (200, 120, 100, 100))
+        detector.release()
+    
+    def test_invalid_scale(self):
+        """Geçersiz ölçek değeri hata vermeli."""
+        with self.assertRaises(ValueError):
+            GazeDetector(detection_scale=0)
+        with self.assertRaises(ValueError):
+            GazeDetector(detection_scale=1.5)
+
+
+class TestAnalyzeAndRender(unittest.TestCase):
+    """Analiz ve çizim ayrımı testleri."""
+    
+    def setUp(self):
+        """Her test öncesi çalışır."""
+        self.detector = GazeDetector()
+        self.frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    
+    def tearDown(self):
+        """Her test sonrası çalışır."""
+        self.detector.release()
+    
+    def test_analyze_does_not_modify_frame(self):
+        """analyze() frame'e çizim yapmamalı."""
+        result = self.detector.analyze(self.frame)
+        
+        self.assertIsInstance(result, GazeResult)
+        self.assertFalse(result.face_detected)
+        self.assertFalse(result.is_looking)
+        self.assertEqual(self.frame.sum(), 0)
+    
+    def test_analyze_accepts_gray_frame(self):
+        """analyze() gri tonlamalı frame kabul etmeli."""
+        gray = np.zeros((480, 640), dtype=np.uint8)
+        result = self.detector.analyze(gray)
+        self.assertIsNone(result.face)
+    
+    def test_analyze_result_in_frame_coordinates(self):
+        """Göz kutuları tam frame koordinatlarında dönmeli."""
+        self.detector.detection_scale = 1.0
+        self.detector.face_cascade = FakeCascade(box=(200, 150, 100, 100))
+        self.detector.eye_cascade = FakeCascade(box=(10, 20, 30, 20))
+        
+        result = self.detector.analyze(self.frame)
+        
+        self.assertEqual(result.face, (200, 150, 100, 100))
+        self.assertEqual(result.eyes, [(210, 170, 30, 20)])
+    
+    def test_render_copies_by_default(self):
+        """render() varsayılan olarak kopya üzerine çizmeli."""
+        result = GazeResult(face=(100, 100, 50, 50), eyes=[(110, 110, 10, 10)])
+        
+        output = self.detector.render(self.frame, result)
+        
+        self.assertEqual(self.frame.sum(), 0)
+        self.assertGreater(output.sum(), 0)
+    
+    def test_render_in_place(self):
+        """copy=False ile verilen frame üzerine çizilmeli."""
+        output = self.detector.render(self.frame, GazeResult(), copy=False)
+        
+        self.assertIs(output, self.frame)
+        self.assertGreater(self.frame.sum(), 0)
+
+
+class TestPupilMethods(unittest.TestCase):
+    """Göz bebeği bulma yöntemleri testleri."""
+    
+    METHODS = ["external", "components", "moments", "contours"]
+    
+    def setUp(self):
+        """Her test öncesi çalışır."""
+        self.detector = GazeDetector()
+        self.eye = np.full((40, 60), 200, dtype=np.uint8)
+        cv2.circle(self.eye, (38, 20), 6, 30, -1)
+    
+    def tearDown(self):
+        """Her test sonrası çalışır."""
+        self.detector.release()
+    
+    def test_methods_find_dark_blob(self):
+        """Tüm yöntemler koyu bölgenin merkezini bulmalı."""
+        for method in self.METHODS:
+            center, radius = self.detector.detect_pupil(self.eye, method)
+            self.assertIsNotNone(center, method)
+            self.assertAlmostEqual(center[0], 38, delta=1, msg=method)
+            self.assertAlmostEqual(center[1], 20, delta=1, msg=method)
+            self.assertGreater(radius, 2, method)
+    
+    def test_methods_empty_roi(self):
+        """Tüm yöntemler boş ROI'de güvenli dönmeli."""
+        empty_roi = np.zeros((10, 10), dtype=np.uint8)
+        for method in self.METHODS:
+            center, radius = self.detector.detect_pupil(empty_roi, method)
+            self.assertTrue(center is None or radius == 0, method)
+    
+    def test_default_method(self):
+        """Varsayılan yöntem yapılandırmadan alınmalı."""
+        detector = GazeDetector(pupil_method="moments")
+        self.assertEqual(detector.pupil_method, "moments")
+        self.assertIsNotNone(detector.detect_pupil(self.eye)[0])
+        detector.release()
+    
+    def test_invalid_method(self):
+        """Bilinmeyen yöntem hata vermeli."""
+        with self.assertRaises(ValueError):
+            GazeDetector(pupil_method="yok")
+
+
 class TestGazeDetectorEdgeCases(unittest.TestCase):
     """GazeDetector için edge case testleri."""
     
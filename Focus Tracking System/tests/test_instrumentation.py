@@ -0,0 +1,98 @@
+"""
+Unit tests for instrumentation module.
+"""
+
+import unittest
+import sys
+import os
+import time
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from instrumentation import Profiler, StageHistogram, get_profiler
+from gaze_detector import GazeDetector
+from synthetic_frames import generate_face_frame
+
+
+class TestProfiler(unittest.TestCase):
+    """Profiler sınıfı için unit testler."""
+
+    def test_probe_records_duration(self):
+        """Prob süresi ilgili aşamaya yazılmalı."""
+        profiler = Profiler(enabled=True, window=10)
+        with profiler.probe("uyku"):
+            time.sleep(0.01)
+
+        stats = profiler.snapshot()["uyku"]
+        self.assertEqual(stats["count"], 1)
+        self.assertGreaterEqual(stats["p50_ms"], 9.0)
+
+    def test_disabled_probe_records_nothing(self):
+        """Kapalıyken ölçüm yapılmamalı ve aynı boş prob dönmeli."""
+        profiler = Profiler(enabled=False)
+        first = profiler.probe("a")
+        with first:
+            pass
+        profiler.record("b", 1.0)
+
+        self.assertIs(first, profiler.probe("c"))
+        self.assertEqual(profiler.snapshot(), {})
+
+    def test_rolling_window(self):
+        """Histogram sadece son `window` ölçümü tutmalı."""
+        histogram = StageHistogram(window=5)
+        for value in range(10):
+            histogram.record(value / 1000.0)
+
+        stats = histogram.snapshot()
+        self.assertEqual(stats["count"], 10)
+        self.assertEqual(stats["window"], 5)
+        self.assertAlmostEqual(stats["p50_ms"], 7.0)
+
+    def test_format_report(self):
+        """Rapor her aşama için bir satır içermeli."""
+        profiler = Profiler(enabled=True)
+        profiler.record("face_detect", 0.01)
+        profiler.record("eye_detect", 0.02)
+
+        lines = profiler.format_report().splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[1].startswith("eye_detect"))
+
+    def test_thread_safety(self):
+        """Aynı anda ölçüm yapmak güvenli olmalı."""
+        profiler = Profiler(enabled=True, window=1000)
+
+        def worker():
+            for _ in range(200):
+                with profiler.probe("ortak"):
+                    pass
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(profiler.snapshot()["ortak"]["count"], 800)
+
+    def test_detector_stages(self):
+        """Detector aşamaları paylaşılan profiler'a yazılmalı."""
+        profiler = get_profiler()
+        profiler.reset()
+        profiler.set_enabled(True)
+        try:
+            detector = GazeDetector(tracking=False)
+            detector.analyze(generate_face_frame())
+            detector.release()
+            stages = set(profiler.snapshot())
+        finally:
+            profiler.set_enabled(False)
+            profiler.reset()
+
+        self.assertTrue({"cvtColor", "face_detect", "eye_detect"} <= stages)
+
+
+if __name__ == "__main__":
+    unittest.main()
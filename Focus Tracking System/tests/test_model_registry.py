@@ -0,0 +1,132 @@
+"""
+Unit tests for model_registry module.
+"""
+
+import unittest
+import sys
+import os
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from model_registry import ModelRegistry, get_registry
+from detector_backends import HAAR_FACE_CASCADE, warm_up
+from gaze_detector import GazeDetector
+
+
+class TestModelRegistry(unittest.TestCase):
+    """ModelRegistry sınıfı için unit testler."""
+
+    def setUp(self):
+        """Her test öncesi çalışır."""
+        self.registry = ModelRegistry()
+        self.loads = 0
+
+    def loader(self):
+        self.loads += 1
+        return object()
+
+    def test_acquire_loads_once(self):
+        """Geri verilen model tekrar yüklenmeden kullanılmalı."""
+        model = self.registry.acquire("m", self.loader)
+        self.registry.release("m", model)
+
+        self.assertIs(self.registry.acquire("m", self.loader), model)
+        self.assertEqual(self.loads, 1)
+        self.assertEqual(self.registry.load_count("m"), 1)
+
+    def test_concurrent_users_get_separate_models(self):
+        """Aynı anda kullanan iki kullanıcı farklı örnek almalı."""
+        first = self.registry.acquire("m", self.loader)
+        second = self.registry.acquire("m", self.loader)
+
+        self.assertIsNot(first, second)
+        self.assertEqual(self.loads, 2)
+
+    def test_keys_are_separate(self):
+        """Farklı anahtarlar farklı havuzlar kullanmalı."""
+        model = self.registry.acquire("a", self.loader)
+        self.registry.release("a", model)
+
+        self.assertIsNot(self.registry.acquire("b", self.loader), model)
+        self.assertEqual(self.registry.idle_count("a"), 1)
+
+    def test_warm_up_background(self):
+        """Ön yükleme arka planda çalışıp havuzu doldurmalı."""
+        def task():
+            self.registry.release("m", self.registry.acquire("m", self.loader))
+
+        thread = self.registry.warm_up(task)
+        thread.join(timeout=5)
+
+        self.assertEqual(self.registry.idle_count("m"), 1)
+
+    def test_warm_up_errors_are_caught(self):
+        """Ön yükleme hatası uygulamayı durdurmamalı."""
+        def task():
+            raise FileNotFoundError("yok")
+
+        self.assertIsNone(self.registry.warm_up(task, background=False))
+
+    def test_thread_safety(self):
+        """Aynı anda kiralama/geri verme güvenli olmalı."""
+        errors = []
+        held = []
+        lock = threading.Lock()
+
+        def worker():
+            try:
+                for _ in range(50):
+                    model = self.registry.acquire("m", object)
+                    with lock:
+                        self.assertNotIn(model, held)
+                        held.append(model)
+                    with lock:
+                        held.remove(model)
+                    self.registry.release("m", model)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(len(errors), 0)
+        self.assertLessEqual(self.registry.load_count("m"), 4)
+
+
+class TestSharedCascades(unittest.TestCase):
+    """GazeDetector'ın paylaşılan havuzu kullanma testleri."""
+
+    def test_detector_reuses_cascades(self):
+        """Yeni detector önceki detector'ın cascade'ini kullanmalı."""
+        warm_up(background=False)
+        key = ("cascade", HAAR_FACE_CASCADE)
+        loads = get_registry().load_count(key)
+
+        first = GazeDetector()
+        cascade = first.face_cascade
+        first.release()
+        second = GazeDetector()
+
+        self.assertIs(second.face_cascade, cascade)
+        self.assertEqual(get_registry().load_count(key), loads)
+        second.release()
+
+    def test_release_returns_original_model(self):
+        """Değiştirilen cascade havuza geri konmamalı."""
+        detector = GazeDetector()
+        original = detector.face_cascade
+        detector.face_cascade = object()
+        detector.release()
+        detector.release()
+
+        other = GazeDetector()
+        self.assertIs(other.face_cascade, original)
+        other.release()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+"""
+Unit tests for multi_face module.
+"""
+
+import unittest
+import sys
+import os
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from multi_face import MultiFaceTracker, box_iou
+from detector_backends import DetectorBackend
+from gaze_detector import GazeDetector, GazeResult
+
+
+def looking(box):
+    return GazeResult(face=box, avg_ratio=0.5, direction="merkez", is_looking=True)
+
+
+def away(box):
+    return GazeResult(face=box, avg_ratio=0.1, direction="sol", is_looking=False)
+
+
+class TestBoxIou(unittest.TestCase):
+    """box_iou fonksiyonu testleri."""
+
+    def test_identical_boxes(self):
+        """Aynı kutuların IoU'su 1 olmalı."""
+        self.assertAlmostEqual(box_iou([(0, 0, 10, 10)], [(0, 0, 10, 10)])[0, 0], 1.0)
+
+    def test_disjoint_boxes(self):
+        """Örtüşmeyen kutuların IoU'su 0 olmalı."""
+        self.assertEqual(box_iou([(0, 0, 10, 10)], [(20, 20, 10, 10)])[0, 0], 0.0)
+
+    def test_matrix_shape(self):
+        """Sonuç (N, M) boyutunda olmalı."""
+        iou = box_iou([(0, 0, 10, 10)] * 3, [(5, 0, 10, 10)] * 2)
+        self.assertEqual(iou.shape, (3, 2))
+        self.assertAlmostEqual(iou[0, 0], 50 / 150)
+
+
+class TestMultiFaceTracker(unittest.TestCase):
+    """MultiFaceTracker sınıfı için unit testler."""
+
+    def setUp(self):
+        """Her test öncesi çalışır."""
+        self.tracker = MultiFaceTracker(iou_threshold=0.3, max_missed=2,
+                                        distraction_seconds=1.0, refocus_seconds=0.0)
+
+    def test_new_faces_get_ids(self):
+        """Her yeni yüz yeni bir kişi olmalı."""
+        people = self.tracker.update([looking((0, 0, 50, 50)), looking((200, 0, 50, 50))])
+        self.assertEqual([p.person_id for p in people], [1, 2])
+
+    def test_faces_linked_across_frames(self):
+        """Hafif kayan yüzler aynı kişiye bağlanmalı."""
+        self.tracker.update([looking((0, 0, 50, 50)), looking((200, 0, 50, 50))])
+        people = self.tracker.update([looking((205, 3, 50, 50)), looking((4, 2, 50, 50))])
+
+        self.assertEqual([p.person_id for p in people], [2, 1])
+        self.assertEqual(len(self.tracker.people), 2)
+
+    def test_per_person_distraction(self):
+        """Her kişinin dikkat durumu ayrı tutulmalı ve süreye göre belirlenmeli."""
+        for t in (0.0, 0.5, 1.0):
+            self.tracker.update([looking((0, 0, 50, 50)), away((200, 0, 50, 50))], timestamp=t)
+
+        first, second = self.tracker.people
+        self.assertFalse(first.is_distracted)
+        self.assertEqual(first.distraction.away_seconds(1.0), 0.0)
+        self.assertEqual(second.distraction.away_seconds(1.0), 1.0)
+        self.assertEqual(second.direction, "sol")
+        self.assertEqual(self.tracker.distracted_people(), [second])
+
+    def test_distraction_independent_of_frame_rate(self):
+        """Uyarı, işlenen frame sayısından bağımsız olarak aynı sürede verilmeli."""
+        for fps in (2, 30):
+            tracker = MultiFaceTracker(distraction_seconds=1.0, refocus_seconds=0.0)
+            first_distracted = None
+            for i in range(3 * fps):
+                tracker.update([away((0, 0, 50, 50))], timestamp=i / fps)
+                if first_distracted is None and tracker.distracted_people():
+                    first_distracted = i / fps
+            self.assertAlmostEqual(first_distracted, 1.0)
+
+    def test_missing_person_removed(self):
+        """max_missed frame görünmeyen kişi silinmeli."""
+        self.tracker.update([looking((0, 0, 50, 50))])
+        for _ in range(2):
+            self.tracker.update([])
+        self.assertEqual(len(self.tracker.people), 1)
+        self.assertFalse(self.tracker.people[0].is_looking)
+
+        self.tracker.update([])
+        self.assertEqual(len(self.tracker.people), 0)
+
+    def test_reset(self):
+        """reset sonrası id'ler baştan başlamalı."""
+        self.tracker.update([looking((0, 0, 50, 50))])
+        self.tracker.reset()
+        people = self.tracker.update([looking((0, 0, 50, 50))])
+        self.assertEqual(people[0].person_id, 1)
+
+
+class CountingBackend(DetectorBackend):
+    """Sabit yüzler döndüren ve göz tespiti çağrılarını sayan arka uç."""
+
+    def __init__(self, faces):
+        self.faces = np.array(faces)
+        self.eye_calls = []
+
+    def detect_faces(self, gray):
+        return self.faces
+
+    def detect_eyes(self, face_gray):
+        self.eye_calls.append(face_gray.shape)
+        return np.array([[5, 5, 20, 10], [45, 5, 20, 10], [90, 5, 20, 10]])
+
+
+class TestAnalyzeAll(unittest.TestCase):
+    """GazeDetector.analyze_all testleri."""
+
+    def test_eye_detection_batched(self):
+        """Tüm yüzlerin gözleri tek çağrıda aranmalı."""
+        backend = CountingBackend([[0, 0, 50, 40], [100, 100, 60, 60]])
+        detector = GazeDetector(backend=backend, detection_scale=1.0)
+
+        results = detector.analyze_all(np.zeros((240, 320, 3), dtype=np.uint8))
+
+        self.assertEqual(backend.eye_calls, [(30, 110)])
+        self.assertEqual(len(results), 2)
+        self.assertEqual(results[0].eyes, [(5, 5, 20, 10)])
+        self.assertEqual(results[1].eyes, [(140, 105, 20, 10)])
+        self.assertTrue(detector.is_face_detected())
+
+    def test_no_faces(self):
+        """Yüz yoksa boş liste dönmeli."""
+        detector = GazeDetector(backend=CountingBackend(np.empty((0, 4))))
+        self.assertEqual(detector.analyze_all(np.zeros((120, 160, 3), dtype=np.uint8)), [])
+        self.assertFalse(detector.is_face_detected())
+
+    def test_render_all(self):
+        """render_all her yüzü çizmeli."""
+        detector = GazeDetector()
+        frame = np.zeros((120, 160, 3), dtype=np.uint8)
+        output = detector.render_all(frame, [looking((10, 30, 40, 40))], ["#1 merkez"])
+
+        self.assertEqual(frame.sum(), 0)
+        self.assertGreater(output.sum(), 0)
+        detector.release()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+"""
+Unit tests for preview module.
+"""
+
+import unittest
+import sys
+import os
+import threading
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from preview import PreviewRenderer, FrameMailbox, fit_size
+
+
+class TestFitSize(unittest.TestCase):
+    """fit_size fonksiyonu için unit testler."""
+
+    def test_wide_target(self):
+        """Geniş alanda yükseklik sınırlayıcı olmalı."""
+        self.assertEqual(fit_size(640, 480, 1000, 300), (400, 300))
+
+    def test_tall_target(self):
+        """Dar alanda genişlik sınırlayıcı olmalı."""
+        self.assertEqual(fit_size(640, 480, 320, 1000), (320, 240))
+
+    def test_minimum_size(self):
+        """Boyut 1x1'in altına düşmemeli."""
+        self.assertEqual(fit_size(640, 480, 1000, 1)[1], 1)
+
+
+class TestPreviewRenderer(unittest.TestCase):
+    """PreviewRenderer sınıfı için unit testler."""
+
+    def setUp(self):
+        """Her test öncesi çalışır."""
+        self.renderer = PreviewRenderer()
+        self.frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        self.frame[:, :, 0] = 255
+
+    def test_no_target_size(self):
+        """Hedef boyut bilinmeden render yapılmamalı."""
+        self.assertIsNone(self.renderer.render(self.frame))
+        self.renderer.set_target_size(1, 1)
+        self.assertIsNone(self.renderer.render(self.frame))
+
+    def test_resizes_and_converts_to_rgb(self):
+        """Çıktı hedef alana sığmalı ve RGB sırasında olmalı."""
+        self.renderer.set_target_size(320, 400)
+        rgb = self.renderer.render(self.frame)
+
+        self.assertEqual(rgb.shape, (240, 320, 3))
+        self.assertEqual(tuple(rgb[0, 0]), (0, 0, 255))
+
+    def test_same_size_only_converts(self):
+        """Frame zaten hedef boyuttaysa sadece renk dönüşümü yapılmalı."""
+        self.renderer.set_target_size(640, 480)
+        rgb = self.renderer.render(self.frame)
+
+        self.assertEqual(rgb.shape, self.frame.shape)
+        self.assertEqual(tuple(rgb[0, 0]), (0, 0, 255))
+
+    def test_skips_unchanged_frame(self):
+        """Aynı anahtarlı frame ikinci kez işlenmemeli."""
+        self.renderer.set_target_size(320, 240)
+        self.assertIsNotNone(self.renderer.render(self.frame, key=7))
+        self.assertIsNone(self.renderer.render(self.frame, key=7))
+        self.assertEqual(self.renderer.skipped_count, 1)
+
+        self.renderer.set_target_size(160, 120)
+        self.assertIsNotNone(self.renderer.render(self.frame, key=7))
+
+    def test_buffers_are_reused(self):
+        """Çıktı tamponları dönüşümlü olarak yeniden kullanılmalı."""
+        renderer = PreviewRenderer(buffer_count=2)
+        renderer.set_target_size(320, 240)
+        first = renderer.render(self.frame, key=1)
+        second = renderer.render(self.frame, key=2)
+        third = renderer.render(self.frame, key=3)
+
+        self.assertIsNot(first, second)
+        self.assertIs(first, third)
+
+    def test_reset_clears_target(self):
+        """reset() sonrasında hedef boyut yeniden beklenmeli."""
+        self.renderer.set_target_size(320, 240)
+        self.renderer.reset()
+        self.assertIsNone(self.renderer.target_size)
+
+
+class TestFrameMailbox(unittest.TestCase):
+    """FrameMailbox sınıfı için unit testler."""
+
+    def setUp(self):
+        """Her test öncesi çalışır."""
+        self.mailbox = FrameMailbox()
+
+    def test_empty_take(self):
+        """Boş posta kutusu None döndürmeli."""
+        self.assertIsNone(self.mailbox.take())
+
+    def test_keeps_only_newest(self):
+        """Alınmamış eski öğeler atılmalı ve sayılmalı."""
+        for i in range(5):
+            self.mailbox.put(i)
+
+        self.assertEqual(self.mailbox.take(), 4)
+        self.assertIsNone(self.mailbox.take())
+        self.assertEqual(self.mailbox.put_count, 5)
+        self.assertEqual(self.mailbox.dropped_count, 4)
+
+    def test_taken_items_not_counted_as_dropped(self):
+        """Zamanında alınan öğeler atlanmış sayılmamalı."""
+        for i in range(3):
+            self.mailbox.put(i)
+            self.assertEqual(self.mailbox.take(), i)
+        self.assertEqual(self.mailbox.dropped_count, 0)
+
+    def test_concurrent_producer(self):
+        """Eşzamanlı üretici ile sayaçlar tutarlı kalmalı."""
+        taken = []
+
+        def produce():
+            for i in range(1000):
+                self.mailbox.put(i)
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        while producer.is_alive():
+            item = self.mailbox.take()
+            if item is not None:
+                taken.append(item)
+        producer.join()
+        item = self.mailbox.take()
+        if item is not None:
+            taken.append(item)
+
+        self.assertEqual(taken[-1], 999)
+        self.assertEqual(taken, sorted(taken))
+        self.assertEqual(len(taken) + self.mailbox.dropped_count, 1000)
+
+    def test_clear(self):
+        """clear() öğeyi ve sayaçları sıfırlamalı."""
+        self.mailbox.put(1)
+        self.mailbox.put(2)
+        self.mailbox.clear()
+        self.assertIsNone(self.mailbox.take())
+        self.assertEqual(self.mailbox.dropped_count, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
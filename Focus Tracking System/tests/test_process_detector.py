@@ -0,0 +1,125 @@
+"""
+Unit tests for process_detector module.
+"""
+
+import unittest
+import sys
+import os
+import signal
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from process_detector import ProcessPoolDetector, pack_result, unpack_result
+from gaze_detector import GazeDetector, GazeResult
+from synthetic_frames import generate_face_frame, generate_sequence
+from session_server import SessionServer
+from frame_source import SyntheticSource
+from frame_scheduler import AdaptiveFrameScheduler
+
+
+class TestResultRecords(unittest.TestCase):
+    """Sonuç kayıtları için unit testler."""
+
+    def test_roundtrip(self):
+        """Kayda çevrilen sonuç aynen geri okunmalı ve numpy tipleri içermemeli."""
+        result = GazeResult(face=(np.int32(10), 20, 30, 40), eyes=[(1, 2, 3, 4)],
+                            pupils=[((np.int64(5), 6), 2)], avg_ratio=np.float64(0.42),
+                            direction="sol", is_looking=False)
+        record = pack_result(result)
+        self.assertIs(type(record[0][0]), int)
+        self.assertIs(type(record[3]), float)
+        self.assertEqual(unpack_result(record), result)
+
+    def test_empty_result(self):
+        """Yüz bulunamayan sonuç da taşınabilmeli."""
+        self.assertEqual(unpack_result(pack_result(GazeResult())), GazeResult())
+
+
+class TestProcessPoolDetector(unittest.TestCase):
+    """ProcessPoolDetector sınıfı için unit testler."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.pool = ProcessPoolDetector(processes=2, slots=2, slot_bytes=320 * 240 * 3, timeout=60)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.close()
+
+    def test_matches_in_process_detector(self):
+        """İşçi süreçteki sonuçlar aynı süreçteki GazeDetector ile aynı olmalı."""
+        frames = list(generate_sequence(12, 320, 240, seed=1, absent_every=5))
+        local = GazeDetector()
+        try:
+            expected = [local.analyze(frame) for frame in frames]
+        finally:
+            local.release()
+
+        remote = self.pool.detector()
+        try:
+            self.assertEqual([remote.analyze(frame) for frame in frames], expected)
+        finally:
+            remote.release()
+
+    def test_pipelined_submits(self):
+        """Yuvalardan fazla istek sırayla beklemeli ve hepsi tamamlanmalı."""
+        frame = generate_face_frame(320, 240)
+        remote = self.pool.detector()
+        futures = [remote.submit(frame) for _ in range(6)]
+        results = [future.result(60) for future in futures]
+        remote.release()
+        self.assertTrue(all(result.face_detected for result in results))
+
+    def test_larger_frame_grows_slots(self):
+        """Yuvadan büyük frame gelince paylaşılan bellek büyütülmeli."""
+        remote = self.pool.detector()
+        results = remote.analyze_all(generate_face_frame(640, 480))
+        remote.release()
+        self.assertEqual(len(results), 1)
+        self.assertGreaterEqual(self.pool.slot_bytes, 640 * 480 * 3)
+
+    def test_rejects_non_uint8(self):
+        """uint8 olmayan frame reddedilmeli."""
+        with self.assertRaises(ValueError):
+            self.pool.detector().analyze(np.zeros((10, 10, 3), dtype=np.float32))
+
+    @unittest.skipUnless(hasattr(signal, "SIGSTOP"), "POSIX sinyalleri gerekli")
+    def test_dead_worker_fails_pending_and_restarts(self):
+        """Ölen işçinin bekleyen isteği hata almalı, yuvası boşalmalı ve işçi yeniden başlamalı."""
+        pool = ProcessPoolDetector(processes=1, slots=2, slot_bytes=320 * 240 * 3, timeout=60)
+        self.addCleanup(pool.close)
+        remote = pool.detector()
+        frame = generate_face_frame(320, 240)
+        self.assertTrue(remote.analyze(frame).face_detected)
+
+        worker = pool._workers[0]
+        os.kill(worker.pid, signal.SIGSTOP)
+        future = remote.submit(frame)
+        os.kill(worker.pid, signal.SIGKILL)
+        with self.assertRaises(RuntimeError):
+            future.result(10)
+        self.assertEqual(len(pool._free), pool.slots)
+        self.assertEqual(pool.restarts, 1)
+        self.assertTrue(remote.analyze(frame).face_detected)
+
+    def test_default_timeout_is_finite(self):
+        """Varsayılan sonuç bekleme süresi sonlu olmalı."""
+        self.assertIsNotNone(self.pool.timeout)
+
+    def test_session_server_with_processes(self):
+        """Sunucu analizleri işçi süreçlerde yapabilmeli."""
+        server = SessionServer(workers=2, processes=1)
+        for name in ("a", "b"):
+            server.add_stream(SyntheticSource(count=4, width=320, height=240), 3600, name=name,
+                              scheduler=AdaptiveFrameScheduler(min_skip=1, max_skip=1, enabled=True),
+                              multi_face=False)
+        stats = server.run(timeout=120)
+        self.assertEqual(stats["a"]["completed"], 4)
+        self.assertEqual(stats["b"]["completed"], 4)
+        self.assertEqual(stats["a"]["errors"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+"""
+Unit tests for replay module.
+"""
+
+import unittest
+import sys
+import os
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from replay import replay_timeline, replay_source, result_from_row
+from video_analyzer import TIMELINE_DTYPE, DIRECTION_CODES
+from clock import SimulatedClock, ScaledClock
+from frame_scheduler import AdaptiveFrameScheduler
+from session_engine import EVENT_DISTRACTED, EVENT_COMPLETED
+
+
+def make_timeline(seconds, fps=1.0, away_blocks=()):
+    """Her saniye bir kayıt; away_blocks içindeki (başlangıç, bitiş) aralıklarında yüz yok."""
+    count = int(seconds * fps)
+    timeline = np.zeros(count, dtype=TIMELINE_DTYPE)
+    timeline["frame"] = np.arange(count)
+    timeline["timestamp"] = np.arange(count) / fps
+    timeline["face"] = 1
+    timeline["ratio"] = 0.5
+    timeline["direction"] = DIRECTION_CODES["merkez"]
+    for start, end in away_blocks:
+        block = slice(int(start * fps), int(end * fps))
+        timeline["face"][block] = 0
+        timeline["ratio"][block] = np.nan
+        timeline["direction"][block] = -1
+    return timeline
+
+
+class TestResultFromRow(unittest.TestCase):
+    """result_from_row fonksiyonu için unit testler."""
+
+    def test_conversion(self):
+        """Kayıt GazeResult alanlarına doğru çevrilmeli."""
+        timeline = make_timeline(2, away_blocks=[(1, 2)])
+        looking = result_from_row(timeline[0])
+        away = result_from_row(timeline[1])
+
+        self.assertTrue(looking.is_looking)
+        self.assertAlmostEqual(looking.avg_ratio, 0.5)
+        self.assertFalse(away.face_detected)
+        self.assertIsNone(away.avg_ratio)
+        self.assertFalse(away.is_looking)
+
+
+class TestReplayTimeline(unittest.TestCase):
+    """replay_timeline fonksiyonu için unit testler."""
+
+    def test_two_hour_session_in_seconds(self):
+        """2 saatlik oturum saniyeler içinde tekrar oynatılmalı ve aynı uyarıları üretmeli."""
+        # Her 20 dakikada bir: 150 saniye (uyarı) ve 50 saniye (uyarı yok) uzak kalma
+        blocks = []
+        for minute in range(0, 120, 20):
+            start = minute * 60 + 100
+            blocks.append((start, start + 150))
+            blocks.append((start + 400, start + 450))
+        timeline = make_timeline(2 * 3600, away_blocks=blocks)
+
+        events = []
+        started = time.perf_counter()
+        session = replay_timeline(timeline, 2 * 3600, listener=events.append,
+                                  distraction_seconds=100, refocus_seconds=0)
+
+        self.assertLess(time.perf_counter() - started, 10)
+        self.assertTrue(session.is_completed)
+        self.assertEqual(session.alert_count, 6)
+        distracted = [e for e in events if e.kind == EVENT_DISTRACTED]
+        self.assertAlmostEqual(distracted[0].timestamp, 100 + 100)
+        self.assertEqual(events[-1].kind, EVENT_COMPLETED)
+        self.assertAlmostEqual(events[-1].timestamp, 7200)
+
+    def test_loop_short_timeline(self):
+        """Kısa zaman çizelgesi oturum bitene kadar başa dönmeli."""
+        timeline = make_timeline(10, away_blocks=[(5, 10)])
+        session = replay_timeline(timeline, 60, distraction_seconds=3, refocus_seconds=0)
+
+        self.assertTrue(session.is_completed)
+        self.assertEqual(session.alert_count, 6)
+
+    def test_no_loop(self):
+        """loop kapalıyken zaman çizelgesi bitince oturum tamamlanmadan durmalı."""
+        timeline = make_timeline(10)
+        session = replay_timeline(timeline, 60, loop=False)
+        self.assertFalse(session.is_completed)
+        self.assertEqual(session.processed_count, 10)
+
+    def test_scaled_clock(self):
+        """Ölçekli saatle tekrar gerçek süreden çok daha kısa sürmeli."""
+        timeline = make_timeline(20, fps=2)
+        started = time.perf_counter()
+        session = replay_timeline(timeline, 20, clock=ScaledClock(200))
+
+        self.assertTrue(session.is_completed)
+        self.assertLess(time.perf_counter() - started, 2)
+
+
+class TestReplaySource(unittest.TestCase):
+    """replay_source fonksiyonu için unit testler."""
+
+    def test_synthetic_source_on_simulated_clock(self):
+        """Sentetik kaynak simüle saatte kendi FPS'inde oynatılmalı."""
+        clock = SimulatedClock()
+        scheduler = AdaptiveFrameScheduler(min_skip=1, max_skip=1, enabled=True)
+        session = replay_source("synthetic:60", 0.52, clock=clock, scheduler=scheduler, multi_face=False)
+
+        self.assertTrue(session.is_completed)
+        self.assertAlmostEqual(clock(), 16 / 30, places=6)
+        self.assertEqual(session.frame_count, 17)
+
+
+if __name__ == '__main__':
+    unittest.main()
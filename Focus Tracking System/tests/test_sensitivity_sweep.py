@@ -0,0 +1,129 @@
+"""
+Unit tests for sensitivity_sweep module.
+"""
+
+import unittest
+import sys
+import os
+import io
+import tempfile
+from contextlib import redirect_stdout
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sensitivity_sweep import looking_masks, count_alerts, sweep, parse_grid, main
+from distraction import DistractionTracker, DISTRACTED
+from gaze_detector import GazeDetector
+from timeline import TimelineWriter, RECORD_DTYPE
+from analytics import analyze_sessions
+
+
+def reference_alerts(looking, timestamps, seconds, refocus):
+    """DistractionTracker ile kayıt kayıt sayım."""
+    tracker = DistractionTracker(seconds, refocus)
+    return sum(tracker.update(bool(l), float(t)) == DISTRACTED for l, t in zip(looking, timestamps))
+
+
+def random_ratios(rng, n):
+    """Merkez etrafında, arada uzun bakış kaçırmaları ve kayıp göz bebekleri olan oranlar."""
+    ratios = 0.5 + rng.normal(0, 0.08, n)
+    for start in rng.integers(0, n, n // 60):
+        ratios[start:start + rng.integers(5, 120)] += rng.choice([-0.3, 0.3])
+    ratios[rng.random(n) < 0.05] = np.nan
+    return ratios.astype(np.float32)
+
+
+class TestSensitivitySweep(unittest.TestCase):
+    """Hassasiyet taraması için unit testler."""
+
+    def test_masks_match_detector(self):
+        """Maskeler GazeDetector._classify ile aynı olmalı."""
+        detector = GazeDetector.__new__(GazeDetector)
+        ratios = np.array([0.0, 0.2, 0.375, 0.4, 0.5, 0.6, 0.625, 0.8, 1.0])
+        for sensitivity in (0.1, 0.25, 0.5):
+            detector.sensitivity = sensitivity
+            expected = [detector._classify(r)[1] for r in ratios]
+            np.testing.assert_array_equal(looking_masks(ratios, [sensitivity])[0], expected)
+        self.assertFalse(looking_masks(np.array([np.nan]), [1.0])[0, 0])
+
+    def test_matches_distraction_tracker(self):
+        """Izgaradaki her nokta DistractionTracker ile aynı uyarı sayısını vermeli."""
+        rng = np.random.default_rng(3)
+        n = 3000
+        ratios = random_ratios(rng, n)
+        timestamps = np.cumsum(rng.uniform(0.02, 0.1, n))
+        sensitivities = [0.1, 0.2, 0.3, 0.5]
+        seconds = [0.5, 1.0, 3.0, 6.0]
+        masks = looking_masks(ratios, sensitivities)
+
+        for refocus in (0.0, 0.5):
+            alerts = count_alerts(masks, timestamps, seconds, refocus)
+            for i in range(len(sensitivities)):
+                for j, threshold in enumerate(seconds):
+                    self.assertEqual(alerts[i, j], reference_alerts(masks[i], timestamps, threshold, refocus),
+                                     (sensitivities[i], threshold, refocus))
+
+    def test_short_glance_does_not_split_episode(self):
+        """Odağa dönüş süresinden kısa bakış uzaklaşmayı bölmemeli."""
+        timestamps = np.arange(9, dtype=np.float64)
+        looking = np.array([[False, False, False, True, False, False, False, True, True]])
+        np.testing.assert_array_equal(count_alerts(looking, timestamps, [4.0], refocus_seconds=1.0), [[1]])
+        np.testing.assert_array_equal(count_alerts(looking, timestamps, [4.0], refocus_seconds=0.0), [[0]])
+
+    def test_sweep_files_and_cli(self):
+        """Dosyalar üzerinden tarama toplanmalı ve CLI tabloyu yazdırmalı."""
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        rng = np.random.default_rng(5)
+        for i in range(3):
+            records = np.zeros(1000, dtype=RECORD_DTYPE)
+            records["timestamp"] = np.arange(1000) / 10
+            records["ratio"] = random_ratios(rng, 1000)
+            with TimelineWriter(os.path.join(tmpdir.name, f"s{i}.timeline")) as writer:
+                for record in records.tolist():
+                    writer.append_record(record)
+
+        result = sweep([tmpdir.name], [0.1, 0.3], [1.0, 6.0], refocus_seconds=0.5)
+        self.assertEqual(result.sessions, 3)
+        self.assertEqual(result.alerts.shape, (2, 2))
+        # Uzun uyarı süresi aynı bölümlerden daha az uyarı üretir
+        self.assertTrue(np.all(result.alerts[:, 0] >= result.alerts[:, 1]))
+        self.assertLess(result.looking_seconds[0], result.looking_seconds[1])
+        self.assertEqual(result.alerts_at(0.3, 6.0), result.alerts[1, 1])
+
+        out = io.StringIO()
+        with redirect_stdout(out):
+            code = main([tmpdir.name, "--sensitivity", "0.1:0.3:0.1", "--seconds", "1,6"])
+        self.assertEqual(code, 0)
+        self.assertIn("0.300", out.getvalue())
+        self.assertIn("6 s", out.getvalue())
+
+    def test_looking_time_matches_analytics(self):
+        """Bakış süresi analytics ile aynı olmalı (donma boşlukları sınırlanır)."""
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        path = os.path.join(tmpdir.name, "s.timeline")
+        records = np.zeros(100, dtype=RECORD_DTYPE)
+        records["timestamp"] = np.arange(100) / 10
+        records["timestamp"][50:] += 120.0
+        records["ratio"] = 0.5
+        records["direction"] = 0
+        with TimelineWriter(path) as writer:
+            for record in records.tolist():
+                writer.append_record(record)
+
+        result = sweep([path], [0.25], [6.0])
+        report = analyze_sessions([path])
+        self.assertAlmostEqual(result.duration, report.duration)
+        self.assertAlmostEqual(result.looking_seconds[0], report.focused)
+
+    def test_parse_grid(self):
+        """Izgara liste veya aralık olarak verilebilmeli."""
+        self.assertEqual(parse_grid("0.1:0.3:0.1"), [0.1, 0.2, 0.3])
+        self.assertEqual(parse_grid("3,6"), [3.0, 6.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
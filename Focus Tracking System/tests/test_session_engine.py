@@ -0,0 +1,156 @@
+"""
+Unit tests for session_engine module.
+"""
+
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from session_engine import (
+    FocusSession, EVENT_STARTED, EVENT_DISTRACTED, EVENT_REFOCUSED,
+    EVENT_COMPLETED, EVENT_STOPPED
+)
+from frame_capture import CapturedFrame
+from frame_scheduler import AdaptiveFrameScheduler
+from gaze_detector import GazeResult
+from synthetic_frames import generate_face_frame
+from clock import SimulatedClock
+
+LOOKING = generate_face_frame(gaze=0.5)
+AWAY = generate_face_frame(face_visible=False)
+
+
+class ListSource:
+    """Frame listesini sırayla veren, her okumada saati ilerleten kaynak."""
+
+    def __init__(self, frames, clock, interval=0.1):
+        self.frames = list(frames)
+        self.clock = clock
+        self.interval = interval
+        self.position = 0
+
+    @property
+    def exhausted(self):
+        return self.position >= len(self.frames)
+
+    def read(self, timeout=None):
+        if self.exhausted:
+            return None
+        self.clock.advance(self.interval)
+        captured = CapturedFrame(self.frames[self.position], self.clock(), self.position)
+        self.position += 1
+        return captured
+
+
+def every_frame():
+    return AdaptiveFrameScheduler(min_skip=1, max_skip=1, enabled=True)
+
+
+class TestFocusSession(unittest.TestCase):
+    """FocusSession sınıfı için unit testler."""
+
+    def make_session(self, frames, duration=60.0, seconds=0.15, interval=0.1):
+        self.clock = SimulatedClock(100.0)
+        source = ListSource(frames, self.clock, interval)
+        session = FocusSession(source, duration, clock=self.clock, distraction_seconds=seconds,
+                               refocus_seconds=0.0, scheduler=every_frame(), multi_face=False)
+        self.events = []
+        session.add_listener(self.events.append)
+        self.addCleanup(session.close)
+        return session
+
+    def kinds(self):
+        return [event.kind for event in self.events]
+
+    def test_distracted_then_refocused(self):
+        """Eşik süresince uzaklaşma uyarı, odağa dönüş uyarı kapatma olayı üretmeli."""
+        session = self.make_session([LOOKING] + [AWAY] * 4 + [LOOKING])
+        session.run()
+
+        self.assertEqual(self.kinds(), [EVENT_STARTED, EVENT_DISTRACTED, EVENT_REFOCUSED])
+        self.assertEqual(session.alert_count, 1)
+        self.assertFalse(session.is_distracted)
+        self.assertEqual(session.processed_count, 6)
+
+    def test_no_alert_below_threshold(self):
+        """Eşiğin altındaki dikkatsizlik uyarı üretmemeli."""
+        session = self.make_session([AWAY, AWAY, LOOKING, AWAY, AWAY])
+        session.run()
+
+        self.assertNotIn(EVENT_DISTRACTED, self.kinds())
+
+    def test_alert_delay_independent_of_frame_rate(self):
+        """Uyarı gecikmesi frame hızından bağımsız olarak aynı olmalı."""
+        delays = []
+        for interval in (0.05, 0.25):
+            frames = [LOOKING] + [AWAY] * int(3.0 / interval)
+            session = self.make_session(frames, seconds=1.0, interval=interval)
+            session.run()
+            distracted = [e for e in self.events if e.kind == EVENT_DISTRACTED]
+            first_away = 100.0 + 2 * interval
+            delays.append(distracted[0].timestamp - first_away)
+            self.assertGreaterEqual(distracted[0].data["away_seconds"], 1.0)
+
+        self.assertAlmostEqual(delays[0], delays[1], delta=0.25)
+
+    def test_completes_when_duration_elapses(self):
+        """Süre dolunca oturum tamamlanmalı ve frame okumayı bırakmalı."""
+        session = self.make_session([LOOKING] * 10, duration=0.35)
+        session.run()
+
+        self.assertTrue(session.is_completed)
+        self.assertEqual(self.kinds()[-1], EVENT_COMPLETED)
+        self.assertEqual(session.frame_count, 4)
+        self.assertEqual(session.remaining_seconds(), 0)
+
+    def test_stop(self):
+        """stop() durdurma olayı üretmeli ve sonuçlar artık uygulanmamalı."""
+        session = self.make_session([])
+        session.start()
+        self.assertEqual(session.remaining_seconds(), 60)
+
+        session.stop()
+        self.assertEqual(self.kinds(), [EVENT_STARTED, EVENT_STOPPED])
+        self.assertEqual(session.apply_result(GazeResult()), [])
+        self.assertIsNone(session.stop())
+
+    def test_split_steps(self):
+        """Analiz dışarıda yapılıp sonuç apply_result ile uygulanabilmeli."""
+        session = self.make_session([])
+        session.start()
+
+        for step in range(3):
+            events = session.apply_result(GazeResult(), timestamp=self.clock() + step * 0.1)
+        self.assertEqual([e.kind for e in events], [EVENT_DISTRACTED])
+        self.assertAlmostEqual(events[0].timestamp, self.clock() + 0.2)
+
+        result = session.analyze(session.prepare(LOOKING))
+        self.assertTrue(result.is_looking)
+        events = session.apply_result(result)
+        self.assertEqual([e.kind for e in events], [EVENT_REFOCUSED])
+
+
+class TestMultiFaceSession(unittest.TestCase):
+    """Çok yüzlü modda FocusSession için unit testler."""
+
+    def test_multi_face_distraction(self):
+        """Çok yüzlü modda kayıp yüz dikkatsizlik olarak sayılmalı."""
+        clock = SimulatedClock(100.0)
+        source = ListSource([LOOKING] + [AWAY] * 3, clock)
+        session = FocusSession(source, 60.0, clock=clock, distraction_seconds=0.15,
+                               refocus_seconds=0.0, scheduler=every_frame(), multi_face=True)
+        events = []
+        session.add_listener(events.append)
+        try:
+            session.run()
+        finally:
+            session.close()
+
+        self.assertIn(EVENT_DISTRACTED, [e.kind for e in events])
+        self.assertIsNotNone(session.last_results)
+
+
+if __name__ == '__main__':
+    unittest.main()
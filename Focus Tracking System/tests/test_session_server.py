@@ -0,0 +1,140 @@
+"""
+Unit tests for session_server module.
+"""
+
+import unittest
+import sys
+import os
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from session_server import FairDetectionPool, SessionServer, format_stats
+from frame_source import SyntheticSource
+from frame_scheduler import AdaptiveFrameScheduler
+from session_engine import EVENT_STARTED, EVENT_DISTRACTED
+
+
+class TestFairDetectionPool(unittest.TestCase):
+    """FairDetectionPool sınıfı için unit testler."""
+
+    def setUp(self):
+        self.pool = FairDetectionPool(workers=1)
+        self.addCleanup(self.pool.close)
+        self.order = []
+        self.gate = threading.Event()
+        self.running = threading.Event()
+
+    def job(self, name, wait=False):
+        def run():
+            if wait:
+                self.running.set()
+                self.gate.wait(5)
+            self.order.append(name)
+        return run
+
+    def test_round_robin_and_drop(self):
+        """Meşgul akışın yeni işi eskisinin yerine geçmeli, diğer akış öne geçmeli."""
+        self.pool.submit("a", self.job("a0", wait=True))
+        self.assertTrue(self.running.wait(5))
+        self.pool.submit("a", self.job("a1"))
+        self.pool.submit("b", self.job("b1"))
+        self.assertTrue(self.pool.submit("a", self.job("a2")))
+        self.gate.set()
+
+        self.assertTrue(self.pool.wait_idle("a", 5))
+        self.assertTrue(self.pool.wait_idle("b", 5))
+        self.assertEqual(self.order, ["a0", "b1", "a2"])
+        self.assertEqual(self.pool.dropped, {"a": 1})
+
+    def test_block_waits_instead_of_dropping(self):
+        """block=True iken hiçbir iş düşürülmemeli."""
+        self.pool.submit("a", self.job("a0", wait=True))
+        self.assertTrue(self.running.wait(5))
+        self.pool.submit("a", self.job("a1"))
+        threading.Timer(0.05, self.gate.set).start()
+        self.assertFalse(self.pool.submit("a", self.job("a2"), block=True))
+
+        self.assertTrue(self.pool.wait_idle("a", 5))
+        self.assertEqual(self.order, ["a0", "a1", "a2"])
+        self.assertEqual(self.pool.dropped, {})
+
+    def test_failing_job_keeps_worker(self):
+        """Hata fırlatan iş işçiyi sonlandırmamalı; sonraki işler çalışmalı."""
+        def fail():
+            raise RuntimeError("bozuk iş")
+        self.pool.submit("a", fail)
+        self.assertTrue(self.pool.wait_idle("a", 5))
+        self.pool.submit("a", self.job("a1"))
+        self.pool.submit("b", self.job("b1"))
+        self.assertTrue(self.pool.wait_idle("a", 5))
+        self.assertTrue(self.pool.wait_idle("b", 5))
+        self.assertEqual(sorted(self.order), ["a1", "b1"])
+
+    def test_closed_pool_rejects_jobs(self):
+        """Kapatılan havuz yeni iş kabul etmemeli."""
+        self.pool.close()
+        with self.assertRaises(RuntimeError):
+            self.pool.submit("a", self.job("a0"))
+
+
+class TestSessionServer(unittest.TestCase):
+    """SessionServer sınıfı için unit testler."""
+
+    def add_synthetic(self, server, name, count):
+        scheduler = AdaptiveFrameScheduler(min_skip=1, max_skip=1, enabled=True)
+        return server.add_stream(SyntheticSource(count=count, width=320, height=240, seed=len(name)),
+                                 3600, name=name, scheduler=scheduler, multi_face=False)
+
+    def test_runs_all_streams_on_shared_pool(self):
+        """Tüm akışlar ortak havuzda sonuna kadar işlenmeli ve istatistik üretmeli."""
+        server = SessionServer(workers=2)
+        events = []
+        for name, count in (("a", 8), ("b", 5), ("c", 3)):
+            self.add_synthetic(server, name, count).add_listener(events.append)
+        stats = server.run(timeout=60)
+
+        for name, count in (("a", 8), ("b", 5), ("c", 3)):
+            self.assertEqual(stats[name]["frames"], count)
+            self.assertEqual(stats[name]["completed"], count)
+            self.assertEqual(stats[name]["dropped"], 0)
+            self.assertEqual(stats[name]["latency"]["count"], count)
+            self.assertGreaterEqual(stats[name]["latency"]["p95_ms"], stats[name]["analyze"]["p50_ms"])
+        self.assertEqual(stats["_total"]["completed"], 16)
+        self.assertGreater(stats["_total"]["throughput_fps"], 0)
+        self.assertEqual([e.kind for e in events].count(EVENT_STARTED), 3)
+        self.assertIn("Toplam", format_stats(stats))
+
+    def test_listener_error_counted(self):
+        """apply_result içindeki hata sayılmalı ve havuz sonraki frame'leri işlemeye devam etmeli."""
+        server = SessionServer(workers=1)
+        scheduler = AdaptiveFrameScheduler(min_skip=1, max_skip=1, enabled=True)
+        session = server.add_stream(SyntheticSource(count=10, width=320, height=240, absent_every=2),
+                                    3600, name="a", scheduler=scheduler, multi_face=False,
+                                    distraction_seconds=0, refocus_seconds=0)
+
+        def listener(event):
+            if event.kind == EVENT_DISTRACTED:
+                raise RuntimeError("dinleyici hatası")
+        session.add_listener(listener)
+        stats = server.run(timeout=60)
+
+        self.assertGreater(stats["a"]["errors"], 0)
+        self.assertGreater(stats["a"]["completed"], 0)
+        self.assertEqual(stats["a"]["completed"] + stats["a"]["errors"], 10)
+
+    def test_stop(self):
+        """stop() sonrası akışlar bitmeli ve sunucu kapanmalı."""
+        server = SessionServer(workers=1)
+        session = self.add_synthetic(server, "a", 100000)
+        server.start()
+        server.stop()
+        self.assertTrue(server.wait(10))
+        server.close()
+        self.assertFalse(session.is_running)
+        with self.assertRaises(RuntimeError):
+            self.add_synthetic(server, "b", 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
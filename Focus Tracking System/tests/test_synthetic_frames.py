@@ -0,0 +1,58 @@
+"""
+Unit tests for synthetic_frames module.
+"""
+
+import unittest
+import sys
+import os
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from synthetic_frames import generate_face_frame, generate_sequence
+from gaze_detector import GazeDetector
+
+
+class TestSyntheticFrames(unittest.TestCase):
+    """Sentetik frame üretimi testleri."""
+
+    def test_frame_shape(self):
+        """Frame istenen boyutta ve BGR olmalı."""
+        frame = generate_face_frame(320, 240)
+        self.assertEqual(frame.shape, (240, 320, 3))
+        self.assertEqual(frame.dtype, np.uint8)
+
+    def test_deterministic(self):
+        """Aynı tohum aynı frame'i üretmeli."""
+        np.testing.assert_array_equal(generate_face_frame(seed=3), generate_face_frame(seed=3))
+        self.assertFalse(np.array_equal(generate_face_frame(seed=3), generate_face_frame(seed=4)))
+
+    def test_face_is_detectable(self):
+        """Sentetik yüz ve gözler tespit edilebilmeli."""
+        detector = GazeDetector(tracking=False)
+        result = detector.analyze(generate_face_frame(gaze=0.5))
+
+        self.assertTrue(result.face_detected)
+        self.assertGreater(len(result.eyes), 0)
+        detector.release()
+
+    def test_absent_face(self):
+        """face_visible=False iken yüz bulunmamalı."""
+        detector = GazeDetector(tracking=False)
+        result = detector.analyze(generate_face_frame(face_visible=False))
+
+        self.assertFalse(result.face_detected)
+        detector.release()
+
+    def test_sequence(self):
+        """Dizi istenen sayıda frame üretmeli; yokluk blokları uygulanmalı."""
+        frames = list(generate_sequence(8, 160, 120, absent_every=4))
+        self.assertEqual(len(frames), 8)
+
+        background = generate_face_frame(160, 120, seed=3, face_visible=False)
+        np.testing.assert_array_equal(frames[3], background)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,198 @@
+"""
+Unit tests for timeline module.
+"""
+
+import unittest
+import sys
+import os
+import errno
+import subprocess
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from timeline import (
+    TimelineWriter, RECORD_DTYPE, HEADER_SIZE, read_header, read_timeline, session_path
+)
+from gaze_detector import GazeResult
+from replay import replay_timeline
+from session_engine import FocusSession
+from frame_source import SyntheticSource
+from frame_scheduler import AdaptiveFrameScheduler
+
+LOOKING = GazeResult(face=(0, 0, 10, 10), eyes=[(0, 0, 1, 1), (2, 0, 1, 1)],
+                     avg_ratio=0.5, direction="merkez", is_looking=True)
+LEFT = GazeResult(face=(0, 0, 10, 10), eyes=[(0, 0, 1, 1)], avg_ratio=0.1, direction="sol")
+NO_FACE = GazeResult()
+
+
+class TestTimeline(unittest.TestCase):
+    """TimelineWriter ve read_timeline için unit testler."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.path = os.path.join(self.tmpdir.name, "oturum.timeline")
+
+    def test_roundtrip(self):
+        """Yazılan kayıtlar memmap ile aynen okunmalı; oran ham saklanmalı."""
+        with TimelineWriter(self.path, start_epoch=1700000000.0) as writer:
+            writer.append(0, 0.0, LOOKING)
+            writer.append(1, 0.5, LEFT)
+            writer.append(2, 1.0, NO_FACE)
+
+        records = read_timeline(self.path)
+        self.assertIsInstance(records, np.memmap)
+        self.assertEqual(records.dtype, RECORD_DTYPE)
+        np.testing.assert_array_equal(records["frame"], [0, 1, 2])
+        np.testing.assert_array_equal(records["timestamp"], [0.0, 0.5, 1.0])
+        np.testing.assert_array_equal(records["face"], [1, 1, 0])
+        np.testing.assert_array_equal(records["eyes"], [2, 1, 0])
+        np.testing.assert_array_equal(records["direction"], [0, 1, -1])
+        self.assertAlmostEqual(float(records["ratio"][1]), 0.1, places=6)
+        self.assertTrue(np.isnan(records["ratio"][2]))
+        self.assertEqual(read_header(self.path).start_epoch, 1700000000.0)
+        self.assertEqual(os.path.getsize(self.path), HEADER_SIZE + 3 * RECORD_DTYPE.itemsize)
+
+    def test_batched_flush(self):
+        """Kayıtlar eşik dolunca veya flush() ile toplu yazılmalı."""
+        writer = TimelineWriter(self.path, flush_records=4, flush_interval=60)
+        self.addCleanup(writer.close)
+        for i in range(3):
+            writer.append(i, i, LOOKING)
+        self.assertEqual(len(read_timeline(self.path)), 0)
+
+        writer.append(3, 3, LOOKING)
+        deadline = time.monotonic() + 5
+        while writer.record_count < 4 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(len(read_timeline(self.path)), 4)
+
+        writer.append(4, 4, LOOKING)
+        self.assertTrue(writer.flush())
+        self.assertEqual(len(read_timeline(self.path)), 5)
+
+    def test_refuses_existing_file_and_ignores_torn_tail(self):
+        """Var olan günlüğe eklenmemeli; okurken yarım kalmış son kayıt yok sayılmalı."""
+        with TimelineWriter(self.path, start_epoch=5.0) as writer:
+            writer.append(0, 0.0, LOOKING)
+        with open(self.path, "ab") as f:
+            f.write(b"\x01\x02\x03")
+        self.assertEqual(len(read_timeline(self.path)), 1)
+
+        with self.assertRaises(FileExistsError):
+            TimelineWriter(self.path)
+        self.assertEqual(read_header(self.path).start_epoch, 5.0)
+
+    def test_rejects_foreign_file(self):
+        """Zaman çizelgesi olmayan dosya reddedilmeli."""
+        with open(self.path, "wb") as f:
+            f.write(b"x" * 64)
+        with self.assertRaises(ValueError):
+            read_timeline(self.path)
+        with self.assertRaises(FileExistsError):
+            TimelineWriter(self.path)
+
+    def test_write_error_is_reported(self):
+        """Yazma hatası saklanmalı ve append/flush/close tarafından fırlatılmalı."""
+        writer = TimelineWriter(self.path, flush_records=2, flush_interval=60)
+        real_file = writer._file
+
+        class FullDisk:
+            def write(self, data):
+                raise OSError(errno.ENOSPC, "Aygıtta yer kalmadı")
+
+            def flush(self):
+                pass
+
+            def close(self):
+                real_file.close()
+        writer._file = FullDisk()
+
+        writer.append(0, 0.0, LOOKING)
+        with self.assertRaises(OSError):
+            writer.flush()
+        self.assertEqual(writer.error.errno, errno.ENOSPC)
+        with self.assertRaises(OSError):
+            writer.append(1, 0.1, LOOKING)
+        self.assertEqual(writer._buffer, [])
+        with self.assertRaises(OSError):
+            writer.close()
+
+    def test_session_survives_recorder_error(self):
+        """Kayıt hatası oturumun işlemesini durdurmamalı; kayıt bırakılmalı."""
+        class FailingRecorder:
+            def append(self, frame, timestamp, result):
+                raise OSError(errno.ENOSPC, "Aygıtta yer kalmadı")
+
+        scheduler = AdaptiveFrameScheduler(min_skip=1, max_skip=1, enabled=True)
+        session = FocusSession(SyntheticSource(count=4, width=320, height=240, fps=10), 3600,
+                               scheduler=scheduler, multi_face=False, recorder=FailingRecorder())
+        try:
+            session.run()
+        finally:
+            session.close()
+        self.assertEqual(session.processed_count, 4)
+        self.assertIsNone(session.recorder)
+
+    def test_append_is_cheap(self):
+        """append() diske yazmadan hızlıca dönmeli."""
+        with TimelineWriter(self.path, flush_records=100000) as writer:
+            started = time.perf_counter()
+            for i in range(10000):
+                writer.append(i, i / 30, LOOKING)
+            per_call = (time.perf_counter() - started) / 10000
+        self.assertLess(per_call, 100e-6)
+        self.assertEqual(len(read_timeline(self.path)), 10000)
+
+    def test_session_records_and_replays(self):
+        """Oturum her işlenen sonucu kaydetmeli ve kayıt tekrar oynatılabilmeli."""
+        scheduler = AdaptiveFrameScheduler(min_skip=1, max_skip=1, enabled=True)
+        with TimelineWriter(self.path) as writer:
+            session = FocusSession(SyntheticSource(count=6, width=320, height=240, fps=10), 3600,
+                                   scheduler=scheduler, multi_face=False, recorder=writer)
+            try:
+                session.run()
+            finally:
+                session.close()
+
+        records = read_timeline(self.path)
+        self.assertEqual(len(records), session.processed_count)
+        np.testing.assert_array_equal(records["frame"], np.arange(6))
+        np.testing.assert_allclose(records["timestamp"], np.arange(6) / 10)
+        self.assertTrue(np.all(records["face"] == 1))
+
+        replayed = replay_timeline(records, 0.6, loop=False)
+        self.assertEqual(replayed.processed_count, 6)
+
+    def test_light_imports(self):
+        """Zaman çizelgesi ve analiz araçları OpenCV/video analizini yüklememeli."""
+        code = ("import sys, timeline, analytics, sensitivity_sweep; "
+                "print(','.join(m for m in ('cv2', 'video_analyzer', 'gaze_detector') if m in sys.modules))")
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        output = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True,
+                                text=True, check=True).stdout
+        self.assertEqual(output.strip(), "")
+
+    def test_session_path(self):
+        """Dosya adı başlangıç zamanından üretilmeli."""
+        path = session_path("kayitlar", time.mktime((2025, 1, 2, 9, 30, 0, 0, 0, -1)))
+        self.assertEqual(path, os.path.join("kayitlar", "oturum_20250102_093000.timeline"))
+
+    def test_session_path_unique_within_second(self):
+        """Aynı saniyede başlayan oturumlar ayrı dosyalara yazılmalı."""
+        epoch = time.mktime((2025, 1, 2, 9, 30, 0, 0, 0, -1))
+        first = session_path(self.tmpdir.name, epoch)
+        TimelineWriter(first, start_epoch=epoch).close()
+        second = session_path(self.tmpdir.name, epoch + 0.5)
+        TimelineWriter(second, start_epoch=epoch + 0.5).close()
+        self.assertNotEqual(first, second)
+        self.assertTrue(second.endswith("oturum_20250102_093000_2.timeline"))
+        self.assertEqual(read_header(first).start_epoch, epoch)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+"""
+Unit tests for video_analyzer module.
+"""
+
+import unittest
+import sys
+import os
+import csv
+import tempfile
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from video_analyzer import (
+    TIMELINE_DTYPE,
+    split_chunks,
+    probe_video,
+    analyze_chunk,
+    analyze_video,
+    write_csv,
+    write_binary,
+    main
+)
+
+
+class TestVideoAnalyzer(unittest.TestCase):
+    """Çevrimdışı video analizi testleri."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Test videosunu oluştur."""
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        cls.video = os.path.join(cls.tmpdir.name, "oturum.avi")
+        writer = cv2.VideoWriter(cls.video, cv2.VideoWriter_fourcc(*"MJPG"), 10, (160, 120))
+        for i in range(25):
+            writer.write(np.full((120, 160, 3), i * 5, dtype=np.uint8))
+        writer.release()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmpdir.cleanup()
+
+    def test_split_chunks(self):
+        """Parçalar tüm aralığı boşluksuz kapsamalı."""
+        self.assertEqual(split_chunks(25, 10), [(0, 10), (10, 20), (20, 25)])
+        self.assertEqual(split_chunks(0, 10), [])
+
+    def test_probe_video(self):
+        """Frame sayısı ve FPS okunmalı."""
+        self.assertEqual(probe_video(self.video), (25, 10.0))
+
+    def test_probe_missing_video(self):
+        """Olmayan video hata vermeli."""
+        with self.assertRaises(IOError):
+            probe_video(os.path.join(self.tmpdir.name, "yok.avi"))
+
+    def test_analyze_chunk(self):
+        """Parça analizi frame numarası ve zaman damgası üretmeli."""
+        rows = analyze_chunk(self.video, 10, 15, 10.0)
+
+        self.assertEqual(rows.dtype, TIMELINE_DTYPE)
+        self.assertEqual(list(rows["frame"]), [10, 11, 12, 13, 14])
+        self.assertAlmostEqual(rows["timestamp"][0], 1.0)
+        self.assertFalse(rows["face"].any())
+        self.assertTrue(np.isnan(rows["ratio"]).all())
+        self.assertTrue((rows["direction"] == -1).all())
+
+    def test_parallel_matches_serial(self):
+        """Paralel sonuç sıralı sonuçla aynı olmalı."""
+        serial = analyze_video(self.video, workers=1, chunk_size=25)
+        parallel = analyze_video(self.video, workers=2, chunk_size=7)
+
+        self.assertEqual(len(parallel), 25)
+        np.testing.assert_array_equal(parallel["frame"], np.arange(25))
+        np.testing.assert_array_equal(serial["face"], parallel["face"])
+
+    def test_write_outputs(self):
+        """CSV ve ikili çıktılar yazılmalı."""
+        timeline = analyze_chunk(self.video, 0, 3, 10.0)
+        csv_path = os.path.join(self.tmpdir.name, "out.csv")
+        npy_path = os.path.join(self.tmpdir.name, "out.npy")
+
+        write_csv(timeline, csv_path)
+        write_binary(timeline, npy_path)
+
+        with open(csv_path) as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(rows[0], ["frame", "timestamp", "face", "ratio", "direction"])
+        self.assertEqual(len(rows), 4)
+        self.assertEqual(np.load(npy_path).tobytes(), timeline.tobytes())
+
+    def test_cli(self):
+        """Komut satırı çıktı dosyası oluşturmalı."""
+        output = os.path.join(self.tmpdir.name, "cli.npy")
+        main([self.video, "-o", output, "--workers", "1"])
+        self.assertEqual(len(np.load(output)), 25)
+
+
+if __name__ == "__main__":
+    unittest.main()
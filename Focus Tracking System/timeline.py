@@ -0,0 +1,273 @@
+"""
+Timeline Module
+Oturum boyunca işlenen her frame'in sonucunu sabit boyutlu kayıtlarla tutan,
+sadece sona eklenen ikili günlük (append-only log).
+
+Dosya düzeni:
+    başlık (32 bayt): sihirli değer, sürüm, kayıt boyutu, başlangıç zamanı (Unix epoch)
+    kayıtlar: RECORD_DTYPE, art arda, hizalamasız
+
+Kayıtlar video döngüsünü yavaşlatmamak için bellekte biriktirilir ve arka
+plan thread'inde toplu olarak yazılır. Dosya ayrıştırılmadan np.memmap ile
+NumPy dizisi olarak okunabilir (bkz. read_timeline). Yarım kalmış son kayıt
+(ör. çökme sonrası) okurken yok sayılır.
+"""
+
+import os
+import struct
+import threading
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+
+import numpy as np
+
+from config import TIMELINE_FLUSH_RECORDS, TIMELINE_FLUSH_INTERVAL
+
+MAGIC = b"FOCUSTL\0"
+VERSION = 1
+EXTENSION = ".timeline"
+
+# Bakış yönlerinin kayıtlardaki kodları (video_analyzer, replay ve analiz araçları da kullanır)
+DIRECTION_CODES = {"merkez": 0, "sol": 1, "sag": 2}
+
+# video_analyzer çıktısının (.npy) kayıt tipi
+TIMELINE_DTYPE = np.dtype([
+    ("frame", "<u4"),
+    ("timestamp", "<f8"),
+    ("face", "u1"),
+    ("ratio", "<f4"),
+    ("direction", "i1"),
+])
+
+# Yön kodu: DIRECTION_CODES veya göz bebeği bulunamadıysa -1.
+# Oran ham olarak saklanır (yoksa NaN); hassasiyet sonradan değiştirilerek yeniden sınıflandırılabilir.
+RECORD_DTYPE = np.dtype([
+    ("frame", "<u4"),
+    ("timestamp", "<f8"),
+    ("face", "u1"),
+    ("eyes", "u1"),
+    ("ratio", "<f4"),
+    ("direction", "i1"),
+])
+
+# sihirli değer, sürüm, kayıt boyutu, ayrılmış, başlangıç zamanı (epoch), ayrılmış
+_HEADER = struct.Struct("<8sHHIdd")
+HEADER_SIZE = _HEADER.size
+
+
+@dataclass
+class TimelineHeader:
+    """Zaman çizelgesi dosyasının başlığı."""
+    version: int
+    record_size: int
+    start_epoch: float
+
+
+def record_from_result(frame: int, timestamp: float, result) -> tuple:
+    """GazeResult'tan RECORD_DTYPE sırasında kayıt oluştur."""
+    return (
+        frame,
+        timestamp,
+        result.face is not None,
+        min(len(result.eyes), 255),
+        result.avg_ratio if result.avg_ratio is not None else np.nan,
+        DIRECTION_CODES.get(result.direction, -1) if result.avg_ratio is not None else -1,
+    )
+
+
+def _read_header(f) -> TimelineHeader:
+    data = f.read(HEADER_SIZE)
+    if len(data) < HEADER_SIZE:
+        raise ValueError("Zaman çizelgesi başlığı eksik")
+    magic, version, record_size, _, start_epoch, _ = _HEADER.unpack(data)
+    if magic != MAGIC:
+        raise ValueError("Zaman çizelgesi dosyası değil")
+    if version != VERSION or record_size != RECORD_DTYPE.itemsize:
+        raise ValueError(f"Desteklenmeyen zaman çizelgesi sürümü: {version} ({record_size} bayt)")
+    return TimelineHeader(version, record_size, start_epoch)
+
+
+class TimelineWriter:
+    """
+    Zaman çizelgesi günlüğüne kayıt ekleyen sınıf.
+    Thread-safe.
+
+    append() sadece kaydı bellekteki tampona ekler; yazma, tampon
+    `flush_records` kayda ulaştığında veya `flush_interval` saniyede bir
+    arka plan thread'inde tek seferde yapılır. Dosya her zaman yeni
+    oluşturulur; başka bir oturumun günlüğüne asla eklenmez. Yazma hatası
+    (ör. disk dolu) `error` alanında saklanır; sonraki append(), flush() ve
+    close() çağrıları bu hatayı fırlatır ve tampon büyümeye devam etmez.
+    """
+
+    def __init__(self, path: str, start_epoch: float = None, flush_records: int = None,
+                 flush_interval: float = None):
+        """
+        TimelineWriter'ı başlat.
+
+        Args:
+            path: Günlük dosyası
+            start_epoch: Oturum başlangıcı (Unix epoch; None ise şimdi)
+            flush_records: Bu kadar kayıt birikince yazılır
+            flush_interval: En geç bu kadar saniyede bir yazılır
+
+        Raises:
+            FileExistsError: Dosya zaten varsa
+        """
+        self.path = path
+        self.flush_records = flush_records or TIMELINE_FLUSH_RECORDS
+        self.flush_interval = flush_interval if flush_interval is not None else TIMELINE_FLUSH_INTERVAL
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        start_epoch = start_epoch if start_epoch is not None else time.time()
+        self.header = TimelineHeader(VERSION, RECORD_DTYPE.itemsize, start_epoch)
+        # "xb": aynı adla başlayan iki oturum tek dosyada birleşmez
+        self._file = open(path, "xb")
+        self._file.write(_HEADER.pack(MAGIC, VERSION, RECORD_DTYPE.itemsize, 0, start_epoch, 0.0))
+        self._file.flush()
+
+        self.record_count = 0
+        self.error: Optional[OSError] = None
+        self._buffer: List[tuple] = []
+        self._cond = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="timeline-writer", daemon=True)
+        self._thread.start()
+
+    def append(self, frame: int, timestamp: float, result):
+        """
+        Frame sonucunu ekle (video döngüsünden çağrılır, diske yazmaz).
+
+        Args:
+            frame: Frame sıra numarası
+            timestamp: Oturum başlangıcından itibaren saniye
+            result: GazeResult
+        """
+        self.append_record(record_from_result(frame, timestamp, result))
+
+    def append_record(self, record: tuple):
+        """
+        RECORD_DTYPE sırasında hazır kaydı ekle.
+
+        Raises:
+            OSError: Arka planda yazma başarısız olduysa
+        """
+        with self._cond:
+            if self.error is not None:
+                raise self.error
+            if self._closed:
+                raise ValueError("Zaman çizelgesi kapatıldı")
+            self._buffer.append(record)
+            if len(self._buffer) >= self.flush_records:
+                self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                if not self._closed and len(self._buffer) < self.flush_records:
+                    self._cond.wait(self.flush_interval)
+                batch, self._buffer = self._buffer, []
+                closed = self._closed
+            if batch:
+                records = np.array(batch, dtype=RECORD_DTYPE)
+                try:
+                    self._file.write(records.tobytes())
+                    self._file.flush()
+                except OSError as e:
+                    with self._cond:
+                        self.error = e
+                        self._buffer = []
+                        self._cond.notify_all()
+                    return
+                with self._cond:
+                    self.record_count += len(records)
+                    self._cond.notify_all()
+            if closed:
+                return
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Tampondaki kayıtları hemen yazdır ve yazılmalarını bekle.
+
+        Returns:
+            bool: Kayıtlar süre içinde yazıldıysa True
+
+        Raises:
+            OSError: Arka planda yazma başarısız olduysa
+        """
+        with self._cond:
+            target = self.record_count + len(self._buffer)
+            self._cond.notify_all()
+            written = self._cond.wait_for(
+                lambda: self.record_count >= target or self._closed or self.error is not None, timeout
+            )
+            if self.error is not None:
+                raise self.error
+            return written
+
+    def close(self):
+        """
+        Kalan kayıtları yaz ve dosyayı kapat. Birden fazla çağrılabilir.
+
+        Raises:
+            OSError: Arka planda yazma başarısız olduysa
+        """
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+        try:
+            self._file.close()
+        except OSError as e:
+            self.error = self.error or e
+        if self.error is not None:
+            raise self.error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def read_header(path: str) -> TimelineHeader:
+    """Dosyanın başlığını oku."""
+    with open(path, "rb") as f:
+        return _read_header(f)
+
+
+def read_timeline(path: str) -> np.ndarray:
+    """
+    Zaman çizelgesini kopyalamadan, salt okunur NumPy dizisi olarak aç.
+
+    Returns:
+        np.ndarray: RECORD_DTYPE tipinde kayıtlar (np.memmap; boş dosyada boş dizi)
+
+    Raises:
+        ValueError: Dosya zaman çizelgesi değilse
+    """
+    read_header(path)
+    count = (os.path.getsize(path) - HEADER_SIZE) // RECORD_DTYPE.itemsize
+    if count <= 0:
+        return np.zeros(0, dtype=RECORD_DTYPE)
+    return np.memmap(path, dtype=RECORD_DTYPE, mode="r", offset=HEADER_SIZE, shape=(count,))
+
+
+def session_path(directory: str, start_epoch: float = None) -> str:
+    """
+    Oturum başlangıç zamanından kullanılmayan bir dosya yolu oluştur
+    (ör. oturum_20250101_093000.timeline). Aynı saniyede başlayan oturumlar
+    için sona sayaç eklenir (oturum_20250101_093000_2.timeline).
+    """
+    stamp = time.strftime("%Y%m%d_%H%M%S", time.localtime(start_epoch))
+    path = os.path.join(directory, f"oturum_{stamp}{EXTENSION}")
+    counter = 2
+    while os.path.exists(path):
+        path = os.path.join(directory, f"oturum_{stamp}_{counter}{EXTENSION}")
+        counter += 1
+    return path
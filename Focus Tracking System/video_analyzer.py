@@ -0,0 +1,159 @@
+"""
+Video Analyzer Module
+Kaydedilmiş oturum videolarını (mp4/avi) GazeDetector ile çevrimdışı analiz eder.
+Video parçalara bölünür, parçalar süreç havuzunda işlenir ve sonuçlar sırayla birleştirilir.
+Tkinter penceresi açmaz.
+
+Kullanım:
+    python video_analyzer.py oturum.mp4 -o zaman_cizelgesi.csv --workers 4
+"""
+
+import os
+import csv
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple
+
+import cv2
+import numpy as np
+
+from gaze_detector import GazeDetector
+from timeline import DIRECTION_CODES, TIMELINE_DTYPE
+
+
+def probe_video(path: str) -> Tuple[int, float]:
+    """
+    Videonun frame sayısını ve FPS değerini oku.
+
+    Returns:
+        tuple: (frame_sayısı, fps)
+    """
+    cap = cv2.VideoCapture(path)
+    if not cap.isOpened():
+        raise IOError(f"Video açılamadı: {path}")
+    frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+    cap.release()
+    return frame_count, fps
+
+
+def split_chunks(frame_count: int, chunk_size: int) -> List[Tuple[int, int]]:
+    """Frame aralığını [başlangıç, bitiş) parçalarına böl."""
+    chunk_size = max(1, chunk_size)
+    return [(start, min(start + chunk_size, frame_count))
+            for start in range(0, frame_count, chunk_size)]
+
+
+def analyze_chunk(path: str, start: int, end: int, fps: float,
+                  sensitivity: float = None) -> np.ndarray:
+    """
+    Videonun [start, end) aralığını analiz et (işçi süreçte çalışır).
+
+    Returns:
+        np.ndarray: TIMELINE_DTYPE tipinde, frame başına bir kayıt
+    """
+    rows = np.zeros(end - start, dtype=TIMELINE_DTYPE)
+    detector = GazeDetector(sensitivity=sensitivity)
+    cap = cv2.VideoCapture(path)
+    cap.set(cv2.CAP_PROP_POS_FRAMES, start)
+
+    count = 0
+    try:
+        for index in range(start, end):
+            ret, frame = cap.read()
+            if not ret:
+                break
+            result = detector.analyze(frame)
+
+            row = rows[count]
+            row["frame"] = index
+            row["timestamp"] = index / fps
+            row["face"] = result.face_detected
+            row["ratio"] = result.avg_ratio if result.avg_ratio is not None else np.nan
+            row["direction"] = DIRECTION_CODES[result.direction] if result.pupil_detected else -1
+            count += 1
+    finally:
+        cap.release()
+        detector.release()
+
+    return rows[:count]
+
+
+def analyze_video(path: str, workers: int = None, chunk_size: int = None,
+                  sensitivity: float = None) -> np.ndarray:
+    """
+    Videonun tamamını parçalar halinde paralel analiz et.
+
+    Args:
+        path: Video dosyası
+        workers: İşçi süreç sayısı (None ise CPU sayısı)
+        chunk_size: Parça başına frame sayısı (None ise işçi başına ~4 parça)
+        sensitivity: Bakış hassasiyeti
+
+    Returns:
+        np.ndarray: Frame sırasıyla birleştirilmiş zaman çizelgesi
+    """
+    frame_count, fps = probe_video(path)
+    workers = workers or os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(1, -(-frame_count // (workers * 4)))
+    chunks = split_chunks(frame_count, chunk_size)
+    if not chunks:
+        return np.zeros(0, dtype=TIMELINE_DTYPE)
+
+    if workers == 1:
+        parts = [analyze_chunk(path, start, end, fps, sensitivity) for start, end in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(analyze_chunk, path, start, end, fps, sensitivity)
+                       for start, end in chunks]
+            parts = [future.result() for future in futures]
+
+    return np.concatenate(parts)
+
+
+def write_csv(timeline: np.ndarray, path: str):
+    """Zaman çizelgesini CSV olarak yaz."""
+    names = {code: name for name, code in DIRECTION_CODES.items()}
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["frame", "timestamp", "face", "ratio", "direction"])
+        for row in timeline:
+            ratio = "" if np.isnan(row["ratio"]) else f"{row['ratio']:.4f}"
+            writer.writerow([
+                int(row["frame"]),
+                f"{row['timestamp']:.3f}",
+                int(row["face"]),
+                ratio,
+                names.get(int(row["direction"]), ""),
+            ])
+
+
+def write_binary(timeline: np.ndarray, path: str):
+    """Zaman çizelgesini kompakt NumPy (.npy) dosyası olarak yaz."""
+    np.save(path, timeline, allow_pickle=False)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kaydedilmiş oturum videosunu analiz et.")
+    parser.add_argument("video", help="Video dosyası (mp4/avi)")
+    parser.add_argument("-o", "--output", help="Çıktı dosyası (.csv veya .npy)")
+    parser.add_argument("--workers", type=int, default=None, help="İşçi süreç sayısı")
+    parser.add_argument("--chunk-size", type=int, default=None, help="Parça başına frame sayısı")
+    parser.add_argument("--sensitivity", type=float, default=None, help="Bakış hassasiyeti")
+    args = parser.parse_args(argv)
+
+    timeline = analyze_video(args.video, args.workers, args.chunk_size, args.sensitivity)
+
+    output = args.output or os.path.splitext(args.video)[0] + ".csv"
+    if output.endswith(".npy"):
+        write_binary(timeline, output)
+    else:
+        write_csv(timeline, output)
+
+    faces = int(timeline["face"].sum()) if len(timeline) else 0
+    print(f"{len(timeline)} frame analiz edildi, {faces} frame'de yüz bulundu -> {output}")
+
+
+if __name__ == "__main__":
+    main()